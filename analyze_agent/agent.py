@@ -2,8 +2,6 @@ import logging
 import requests
 from typing import Dict, Any
 
-# Setup Logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("NanoClaw")
 
 TRADING_BOT_URL = "http://trading-bot:8001/trade"
@@ -48,7 +46,8 @@ class AnalyzeAgent:
             "side": signal_data['signal_type'], # BUY/SELL
             "price": float(signal_data['price']),
             "reason": decision['reasoning'],
-            "agent_decision": decision['decision']
+            "agent_decision": decision['decision'],
+            "instance_id": signal_data.get('instance_id', 'default')
         }
         
         try:
@@ -1,5 +1,13 @@
+import os
+import sys
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
+
+# Shared logging pipeline lives in monitoring_bot (copied next to us in Docker)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'monitoring_bot'))
+from log_pipeline import setup_logging
+setup_logging("NanoClaw", log_file=os.getenv("LOG_FILE", "analyze_agent.log"))
+
 from agent import create_agent
 from tools.basic_tools import web_search_tool, crypto_api_tool
 
@@ -17,6 +25,7 @@ class SignalRequest(BaseModel):
     price: float
     indicators: dict
     trend: str
+    instance_id: str = "default"
 
 @app.post("/analyze")
 async def analyze_signal(signal: SignalRequest):
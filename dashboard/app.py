@@ -1 +1 @@
-aW1wb3J0IHN0cmVhbWxpdCBhcyBzdAppbXBvcnQgc3FsaXRlMwppbXBvcnQgcGFuZGFzIGFzIHBkCmltcG9ydCBjY3h0CmltcG9ydCB0aW1lCmltcG9ydCBjb25jdXJyZW50LmZ1dHVyZXMKaW1wb3J0IHV1aWQKaW1wb3J0IGpzb24KCmltcG9ydCBzeXMKaW1wb3J0IG9zCgojIEFkZCBtb25pdG9yaW5nX2JvdCB0byBwYXRoIGZvciBTdHJhdGVneSBpbXBvcnRzCnN5cy5wYXRoLmFwcGVuZChvcy5wYXRoLmpvaW4ob3MuZ2V0Y3dkKCksICdtb25pdG9yaW5nX2JvdCcpKQpmcm9tIHN0cmF0ZWd5IGltcG9ydCBTdHJhdGVneQoKIyBQYWdlIENvbmZpZwpzdC5zZXRfcGFnZV9jb25maWcocGFnZV90aXRsZT0iQ3J5cHRvLVRyYWRlciIsIGxheW91dD0id2lkZSIsIHBhZ2VfaWNvbj0i8J+mgiIsIGluaXRpYWxfc2lkZWJhcl9zdGF0ZT0iZXhwYW5kZWQiKQoKIyBJbml0aWFsaXplIFN0cmF0ZWd5IEVuZ2luZSBmb3IgVUkgdXNlCnN0cmF0ZWd5X2VuZ2luZSA9IFN0cmF0ZWd5KCkKCiMgQ3VzdG9tIENTUyBmb3IgRGFyayBNb2RlICYgTW9kZXJuIExvb2sKc3QubWFya2Rvd24oIiIiCjxzdHlsZT4KICAgIC8qIEdsb2JhbCBCYWNrZ3JvdW5kICovCiAgICAuc3RBcHAgewogICAgICAgIGJhY2tncm91bmQtY29sb3I6ICMwRTExMTc7CiAgICAgICAgY29sb3I6ICNGQUZBRkE7CiAgICB9CiAgICAKICAgIC8qIFNpZGViYXIgQmFja2dyb3VuZCAqLwogICAgc2VjdGlvbltkYXRhLXRlc3RpZD0ic3RTaWRlYmFyIl0gewogICAgICAgIGJhY2tncm91bmQtY29sb3I6ICMxNjFCMjI7CiAgICAgICAgYm9yZGVyLXJpZ2h0OiAxcHggc29saWQgIzMwMzYzRDsKICAgIH0KICAgIAogICAgLyogRm9yY2UgU2lkZWJhciBUZXh0IENvbG9yICovCiAgICAuY3NzLTE3bG50a24gewogICAgICAgIGNvbG9yOiAjQzlEMUQ5ICFpbXBvcnRhbnQ7CiAgICB9CiAgICAKICAgIC8qIEJ1dHRvbnMgKi8KICAgIGRpdi5zdEJ1dHRvbiA+IGJ1dHRvbiB7CiAgICAgICAgd2lkdGg6IDEwMCU7CiAgICAgICAgYm9yZGVyLXJhZGl1czogOHB4OwogICAgICAgIGZvbnQtd2VpZ2h0OiA2MDA7CiAgICAgICAgYmFja2dyb3VuZC1jb2xvcjogIzIxMjYyRDsKICAgICAgICBjb2xvcjogI0M5RDFEOTsKICAgICAgICBib3JkZXI6IDFweCBzb2xpZCAjMzAzNjNEOwogICAgICAgIHRyYW5zaXRpb246IGFsbCAwLjJzIGVhc2U7CiAgICB9CiAgICBkaXYuc3RCdXR0b24gPiBidXR0b246aG92ZXIgewogICAgICAgIGJvcmRlci1jb2xvcjogIzhCNUNGNjsKICAgICAgICBjb2xvcjogI0ZGRkZGRjsKICAgICAgICBiYWNrZ3JvdW5kLWNvbG9yOiAjMzAzNjNEOwogICAgICAgIGJveC1zaGFkb3c6IDAgNHB4IDZweCByZ2JhKDAsIDAsIDAsIDAuMyk7CiAgICB9CiAgICBkaXYuc3RCdXR0b24gPiBidXR0b246YWN0aXZlLCBkaXYuc3RCdXR0b24gPiBidXR0b246Zm9jdXMgewogICAgICAgIGJhY2tncm91bmQtY29sb3I6ICM4QjVDRjYgIWltcG9ydGFudDsKICAgICAgICBjb2xvcjogd2hpdGUgIWltcG9ydGFudDsKICAgICAgICBib3JkZXItY29sb3I6ICM4QjVDRjYgIWltcG9ydGFudDsKICAgIH0KCiAgICAvKiBTdGFydCBUcmFkaW5nIEJ1dHRvbiAqLwogICAgLnN0YXJ0LXRyYWRpbmctYnRuID4gYnV0dG9uIHsKICAgICAgICBiYWNrZ3JvdW5kLWNvbG9yOiAjOEI1Q0Y2ICFpbXBvcnRhbnQ7CiAgICAgICAgY29sb3I6IHdoaXRlICFpbXBvcnRhbnQ7CiAgICAgICAgYm9yZGVyOiBub25lICFpbXBvcnRhbnQ7CiAgICAgICAgaGVpZ2h0OiA0ZW0gIWltcG9ydGFudDsKICAgICAgICBmb250LXNpemU6IDEuMmVtICFpbXBvcnRhbnQ7CiAgICB9CiAgICAKICAgIC8qIEhlYWRlcnMgKi8KICAgIGgxLCBoMiwgaDMsIGg0IHsKICAgICAgICBmb250LWZhbWlseTogJ0ludGVyJywgc2Fucy1zZXJpZjsKICAgICAgICBmb250LXdlaWdodDogNzAwOwogICAgICAgIGNvbG9yOiAjRjBGNkZDOwogICAgfQogICAgCiAgICAvKiBNZXRyaWNzIENhcmRzICovCiAgICBkaXZbZGF0YS10ZXN0aWQ9InN0TWV0cmljIl0gewogICAgICAgIGJhY2tncm91bmQtY29sb3I6ICMyMTI2MkQ7CiAgICAgICAgcGFkZGluZzogMTVweDsKICAgICAgICBib3JkZXItcmFkaXVzOiAxMHB4OwogICAgICAgIGJvcmRlcjogMXB4IHNvbGlkICMzMDM2M0Q7CiAgICAgICAgYm94LXNoYWRvdzogMCAycHggNHB4IHJnYmEoMCwwLDAsMC4yKTsKICAgIH0KCiAgICAvKiBUcmVuZCBCYWRnZSBTdHlsaW5nICovCiAgICAudHJlbmQtYmFkZ2UgewogICAgICAgIHBhZGRpbmc6IDJweCAxMHB4OwogICAgICAgIGJvcmRlci1yYWRpdXM6IDRweDsKICAgICAgICBmb250LXdlaWdodDogYm9sZDsKICAgICAgICBmb250LXNpemU6IDAuODVlbTsKICAgICAgICB0ZXh0LXRyYW5zZm9ybTogdXBwZXJjYXNlOwogICAgICAgIGRpc3BsYXk6IGlubGluZS1ibG9jazsKICAgICAgICBtYXJnaW46IDJweDsKICAgIH0KICAgIC50cmVuZC11cCB7IGJhY2tncm91bmQtY29sb3I6ICMwNTJlMTY7IGNvbG9yOiAjNGFkZTgwOyBib3JkZXI6IDFweCBzb2xpZCAjMTQ1MzJkOyB9CiAgICAudHJlbmQtZG93biB7IGJhY2tncm91bmQtY29sb3I6ICM0NTBhMGE7IGNvbG9yOiAjZjg3MTcxOyBib3JkZXI6IDFweCBzb2xpZCAjN2YxZDFkOyB9CiAgICAudHJlbmQtbmV1dHJhbCB7IGJhY2tncm91bmQtY29sb3I6ICMxZTFiNGI7IGNvbG9yOiAjODE4Y2Y4OyBib3JkZXI6IDFweCBzb2xpZCAjMzEyZTgxOyB9CiAgICAKICAgIC8qIFRhYmxlIFN0eWxpbmcgKi8KICAgIGRpdltkYXRhLXRlc3RpZD0ic3REYXRhRnJhbWUiXSB7CiAgICAgICAgYm9yZGVyOiAxcHggc29saWQgIzMwMzYzRDsKICAgICAgICBib3JkZXItcmFkaXVzOiA4cHg7CiAgICAgICAgYmFja2dyb3VuZC1jb2xvcjogIzBEMTExNzsKICAgIH0KICAgIAogICAgLyogU3RyYXRlZ3kgRGVmaW5pdGlvbiBCb3ggKi8KICAgIC5zdHJhdC1ib3ggewogICAgICAgIGJhY2tncm91bmQtY29sb3I6ICMxNjFCMjI7CiAgICAgICAgcGFkZGluZzogMTVweDsKICAgICAgICBib3JkZXItcmFkaXVzOiA4cHg7CiAgICAgICAgYm9yZGVyOiAxcHggc29saWQgIzMwMzYzRDsKICAgICAgICBtYXJnaW4tYm90dG9tOiAxMHB4OwogICAgfQoKICAgIC8qIEhpZGUgU3RyZWFtbGl0IEJyYW5kaW5nICovCiAgICAjTWFpbk1lbnUge3Zpc2liaWxpdHk6IGhpZGRlbjt9CiAgICBmb290ZXIge3Zpc2liaWxpdHk6IGhpZGRlbjt9Cjwvc3R5bGU+CiIiIiwgdW5zYWZlX2FsbG93X2h0bWw9VHJ1ZSkKCiMgRGF0YWJhc2UgQ29ubmVjdGlvbgpEQl9QQVRIID0gInRyYWRlcy5kYiIKCmRlZiBnZXRfY29ubmVjdGlvbigpOgogICAgdHJ5OgogICAgICAgIGNvbm4gPSBzcWxpdGUzLmNvbm5lY3QoREJfUEFUSCkKICAgICAgICByZXR1cm4gY29ubgogICAgZXhjZXB0IEV4Y2VwdGlvbiBhcyBlOgogICAgICAgIHN0LmVycm9yKGYiRmFpbGVkIHRvIGNvbm5lY3QgdG8gREI6IHtlfSIpCiAgICAgICAgcmV0dXJuIE5vbmUKCiMgUmVnaXN0ZXIgSW5zdGFuY2UgaW4gREIKZGVmIHJlZ2lzdGVyX2luc3RhbmNlKGNvbmZpZywgcGFpcnNfbGlzdCk6CiAgICB0cnk6CiAgICAgICAgY29ubiA9IGdldF9jb25uZWN0aW9uKCkKICAgICAgICBpZiBub3QgY29ubjogcmV0dXJuIEZhbHNlCiAgICAgICAgCiAgICAgICAgIyBFbnN1cmUgdGFibGUgZXhpc3RzCiAgICAgICAgY29ubi5leGVjdXRlKCcnJ0NSRUFURSBUQUJMRSBJRiBOT1QgRVhJU1RTIGluc3RhbmNlcyAoCiAgICAgICAgICAgIGlkIFRFWFQgUFJJTUFSWSBLRVksIG5hbWUgVEVYVCwgZXhjaGFuZ2UgVEVYVCwgYmFzZV9jdXJyZW5jeSBURVhULCAKICAgICAgICAgICAgbWFya2V0X3R5cGUgVEVYVCwgc3RyYXRlZ3lfY29uZmlnIFRFWFQsIHBhaXJzIFRFWFQsIAogICAgICAgICAgICBzdGF0dXMgVEVYVCBERUZBVUxUICdTVE9QUEVEJywgY3JlYXRlZF9hdCBEQVRFVElNRSBERUZBVUxUIENVUlJFTlRfVElNRVNUQU1QLAogICAgICAgICAgICBzdHJhdGVneV9qc29uIFRFWFQKICAgICAgICApJycnKQogICAgICAgIAogICAgICAgIGluc3RhbmNlX2lkID0gc3RyKHV1aWQudXVpZDQoKSlbOjhdCiAgICAgICAgbmFtZSA9IGYie2NvbmZpZ1snZXhjaGFuZ2UnXX1fe2NvbmZpZ1snbWFya2V0X3R5cGUnXX1fe2luc3RhbmNlX2lkfSIKICAgICAgICAKICAgICAgICBjb25uLmV4ZWN1dGUoCiAgICAgICAgICAgICJJTlNFUlQgSU5UTyBpbnN0YW5jZXMgKGlkLCBuYW1lLCBleGNoYW5nZSwgYmFzZV9jdXJyZW5jeSwgbWFya2V0X3R5cGUsIHN0cmF0ZWd5X2NvbmZpZywgcGFpcnMsIHN0YXR1cywgc3RyYXRlZ3lfanNvbikgVkFMVUVTICg/LCA/LCA/LCA/LCA/LCA/LCA/LCA/LCA/KSIsCiAgICAgICAgICAgICgKICAgICAgICAgICAgICAgIGluc3RhbmNlX2lkLAogICAgICAgICAgICAgICAgbmFtZSwKICAgICAgICAgICAgICAgIGNvbmZpZ1snZXhjaGFuZ2UnXSwKICAgICAgICAgICAgICAgIGNvbmZpZ1snYmFzZV9jdXJyZW5jeSddLAogICAgICAgICAgICAgICAgY29uZmlnWydtYXJrZXRfdHlwZSddLAogICAgICAgICAgICAgICAganNvbi5kdW1wcyhjb25maWdbJ3N0cmF0ZWd5X3BhcmFtcyddKSwKICAgICAgICAgICAgICAgIGpzb24uZHVtcHMocGFpcnNfbGlzdCksCiAgICAgICAgICAgICAgICAnQUNUSVZFJywKICAgICAgICAgICAgICAgIGpzb24uZHVtcHMoY29uZmlnWydzdHJhdGVneV9sb2dpYyddKQogICAgICAgICAgICApCiAgICAgICAgKQogICAgICAgIGNvbm4uY29tbWl0KCkKICAgICAgICBjb25uLmNsb3NlKCkKICAgICAgICByZXR1cm4gbmFtZQogICAgZXhjZXB0IEV4Y2VwdGlvbiBhcyBlOgogICAgICAgIHN0LmVycm9yKGYiRmFpbGVkIHRvIHJlZ2lzdGVyIGluc3RhbmNlOiB7ZX0iKQogICAgICAgIHJldHVybiBGYWxzZQoKIyBPUFRJTUlaRUQ6IEZldGNoIFRvcCBHYWluZXJzL0xvc2VycwpAc3QuY2FjaGVfZGF0YSh0dGw9MTIwKQpkZWYgZ2V0X21hcmtldF9tb3ZlcnMoZXhjaGFuZ2VfaWQpOgogICAgdHJ5OgogICAgICAgIGV4Y2hhbmdlX2NsYXNzID0gZ2V0YXR0cihjY3h0LCBleGNoYW5nZV9pZCkKICAgICAgICBleGNoYW5nZSA9IGV4Y2hhbmdlX2NsYXNzKHsndGltZW91dCc6IDUwMDAsICdlbmFibGVSYXRlTGltaXQnOiBUcnVlfSkKICAgICAgICB0aWNrZXJzID0gZXhjaGFuZ2UuZmV0Y2hfdGlja2VycygpCiAgICAgICAgcGFpcnMgPSBbXQogICAgICAgIGZvciBzeW1ib2wsIGRhdGEgaW4gdGlja2Vycy5pdGVtcygpOgogICAgICAgICAgICBpZiAnL1VTRFQnIGluIHN5bWJvbCBhbmQgZGF0YVsncGVyY2VudGFnZSddIGlzIG5vdCBOb25lOgogICAgICAgICAgICAgICAgcGFpcnMuYXBwZW5kKHsKICAgICAgICAgICAgICAgICAgICAnU3ltYm9sJzogc3ltYm9sLAogICAgICAgICAgICAgICAgICAgICdQcmljZSc6IGRhdGFbJ2xhc3QnXSwKICAgICAgICAgICAgICAgICAgICAnQ2hhbmdlICUnOiBkYXRhWydwZXJjZW50YWdlJ10KICAgICAgICAgICAgICAgIH0pCiAgICAgICAgZGYgPSBwZC5EYXRhRnJhbWUocGFpcnMpCiAgICAgICAgaWYgZGYuZW1wdHk6IHJldHVybiBwZC5EYXRhRnJhbWUoKSwgcGQuRGF0YUZyYW1lKCkKICAgICAgICBkZiA9IGRmLnNvcnRfdmFsdWVzKGJ5PSdDaGFuZ2UgJScsIGFzY2VuZGluZz1GYWxzZSkKICAgICAgICByZXR1cm4gZGYuaGVhZCgxMCksIGRmLnRhaWwoMTApLnNvcnRfdmFsdWVzKGJ5PSdDaGFuZ2UgJScsIGFzY2VuZGluZz1UcnVlKQogICAgZXhjZXB0IEV4Y2VwdGlvbjogcmV0dXJuIHBkLkRhdGFGcmFtZSgpLCBwZC5EYXRhRnJhbWUoKQoKIyBPUFRJTUlaRUQ6IEZldGNoIFRvcCBQYWlycwpAc3QuY2FjaGVfZGF0YSh0dGw9MzAwKQpkZWYgZ2V0X3RvcF9wYWlycyhleGNoYW5nZV9pZCwgbWFya2V0X3R5cGUsIGJhc2VfY3VycmVuY3kpOgogICAgdHJ5OgogICAgICAgIGV4Y2hhbmdlX2NsYXNzID0gZ2V0YXR0cihjY3h0LCBleGNoYW5nZV9pZCkKICAgICAgICBleGNoYW5nZSA9IGV4Y2hhbmdlX2NsYXNzKHsndGltZW91dCc6IDE1MDAwLCAnZW5hYmxlUmF0ZUxpbWl0JzogVHJ1ZX0pCiAgICAgICAgbWFya2V0cyA9IGV4Y2hhbmdlLmxvYWRfbWFya2V0cygpCiAgICAgICAgU1RBQkxFQ09JTlMgPSB7J1VTRFQnLCAnVVNEQycsICdCVVNEJywgJ0RBSScsICdUVVNEJywgJ0ZEVVNEJywgJ1VTREUnLCAnVVNEUCcsICdQWVVTRCcsICdFVVInLCAnVVNEJ30KICAgICAgICB0YXJnZXRfc3ltYm9scyA9IFtdCiAgICAgICAgZm9yIHN5bWJvbCwgbWFya2V0IGluIG1hcmtldHMuaXRlbXMoKToKICAgICAgICAgICAgIGlmIG1hcmtldFsncXVvdGUnXSAhPSBiYXNlX2N1cnJlbmN5OiBjb250aW51ZQogICAgICAgICAgICAgaWYgbWFya2V0WydiYXNlJ10gaW4gU1RBQkxFQ09JTlM6IGNvbnRpbnVlCiAgICAgICAgICAgICBpZiBtYXJrZXRfdHlwZSA9PSAnU3BvdCcgYW5kIG5vdCBtYXJrZXQuZ2V0KCdzcG90JywgRmFsc2UpOiBjb250aW51ZQogICAgICAgICAgICAgaWYgbWFya2V0X3R5cGUgPT0gJ0Z1dHVyZXMnIGFuZCBub3QgKG1hcmtldC5nZXQoJ2Z1dHVyZScsIEZhbHNlKSBvciBtYXJrZXQuZ2V0KCdzd2FwJywgRmFsc2UpKTogY29udGludWUKICAgICAgICAgICAgIGlmIG5vdCBtYXJrZXQuZ2V0KCdhY3RpdmUnLCBUcnVlKTogY29udGludWUKICAgICAgICAgICAgIHRhcmdldF9zeW1ib2xzLmFwcGVuZChzeW1ib2wpCgogICAgICAgIHRyeToKICAgICAgICAgICAgIHRpY2tlcnMgPSBleGNoYW5nZS5mZXRjaF90aWNrZXJzKHRhcmdldF9zeW1ib2xzKSBpZiBsZW4odGFyZ2V0X3N5bWJvbHMpID4gMCBlbHNlIHt9CiAgICAgICAgZXhjZXB0OgogICAgICAgICAgICAgdGlja2VycyA9IGV4Y2hhbmdlLmZldGNoX3RpY2tlcnMoKQoKICAgICAgICBkYXRhID0gW10KICAgICAgICBmb3Igc3ltYm9sIGluIHRhcmdldF9zeW1ib2xzOgogICAgICAgICAgICBpZiBzeW1ib2wgaW4gdGlja2VyczoKICAgICAgICAgICAgICAgIHQgPSB0aWNrZXJzW3N5bWJvbF0KICAgICAgICAgICAgICAgIHZvbCA9IHRbJ3F1b3RlVm9sdW1lJ10gaWYgdC5nZXQoJ3F1b3RlVm9sdW1lJykgZWxzZSAodFsnYmFzZVZvbHVtZSddICogdFsnbGFzdCddIGlmIHQuZ2V0KCdiYXNlVm9sdW1lJykgYW5kIHQuZ2V0KCdsYXN0JykgZWxzZSAwKQogICAgICAgICAgICAgICAgZGF0YS5hcHBlbmQoewogICAgICAgICAgICAgICAgICAgICdTZWxlY3QnOiBGYWxzZSwKICAgICAgICAgICAgICAgICAgICAnU3ltYm9sJzogc3ltYm9sLAogICAgICAgICAgICAgICAgICAgICdQcmljZSc6IHRbJ2xhc3QnXSwKICAgICAgICAgICAgICAgICAgICAnVm9sdW1lJzogdm9sLAogICAgICAgICAgICAgICAgICAgICdDaGFuZ2UgMjRoICUnOiB0WydwZXJjZW50YWdlJ10KICAgICAgICAgICAgICAgIH0pCiAgICAgICAgZGYgPSBwZC5EYXRhRnJhbWUoZGF0YSkKICAgICAgICBpZiBub3QgZGYuZW1wdHk6IGRmID0gZGYuc29ydF92YWx1ZXMoYnk9J1ZvbHVtZScsIGFzY2VuZGluZz1GYWxzZSkuaGVhZCgxMDApCiAgICAgICAgcmV0dXJuIGRmCiAgICBleGNlcHQgRXhjZXB0aW9uOiByZXR1cm4gcGQuRGF0YUZyYW1lKCkKCiMgSW5pdGlhbGl6ZSBTZXNzaW9uIFN0YXRlIE5hdmlnYXRpb24KaWYgJ3BhZ2UnIG5vdCBpbiBzdC5zZXNzaW9uX3N0YXRlOiBzdC5zZXNzaW9uX3N0YXRlLnBhZ2UgPSAiSG9tZSIKCmRlZiBuYXZpZ2F0ZV90byhwYWdlX25hbWUpOgogICAgc3Quc2Vzc2lvbl9zdGF0ZS5wYWdlID0gcGFnZV9uYW1lCiAgICBzdC5yZXJ1bigpCgojIFNpZGViYXIgTmF2aWdhdGlvbgp3aXRoIHN0LnNpZGViYXI6CiAgICBzdC50aXRsZSgi8J+mgiBDcnlwdG8tVHJhZGVyIikKICAgIHN0Lm1hcmtkb3duKCItLS0iKQogICAgc2VsZWN0ZWRfcGFnZSA9IHN0LnJhZGlvKCJOYXZpZ2F0aW9uIiwgWyJIb21lIiwgIlN0cmF0ZWd5IEJ1aWxkZXIiLCAiTGl2ZSBNb25pdG9yIiwgIlBvc3QtVHJhZGUgUmV2aWV3IiwgIlNldHRpbmdzIl0sIGluZGV4PVsiSG9tZSIsICJTdHJhdGVneSBCdWlsZGVyIiwgIkxpdmUgTW9uaXRvciIsICJQb3N0LVRyYWRlIFJldmlldyIsICJTZXR0aW5ncyJdLmluZGV4KHN0LnNlc3Npb25fc3RhdGUucGFnZSkpCiAgICBpZiBzZWxlY3RlZF9wYWdlICE9IHN0LnNlc3Npb25fc3RhdGUucGFnZToKICAgICAgICBzdC5zZXNzaW9uX3N0YXRlLnBhZ2UgPSBzZWxlY3RlZF9wYWdlCiAgICAgICAgc3QucmVydW4oKQoKIyAtLS0gUEFHRSBST1VUSU5HIC0tLQoKaWYgc3Quc2Vzc2lvbl9zdGF0ZS5wYWdlID09ICJIb21lIjoKICAgIHN0LnRpdGxlKCJDcnlwdG8tVHJhZGVyIERhc2hib2FyZCIpCiAgICBzdC5tYXJrZG93bigiKipBdXRvbm9tb3VzLiBNb2R1bGFyLiBJbnRlbGxpZ2VudC4qKiBTZWxlY3QgYW4gZXhjaGFuZ2UgYmVsb3cgdG8gdmlldyBsaXZlIG1hcmtldCBtb3ZlcnMuIikKICAgIHN0Lm1hcmtkb3duKCItLS0iKQogICAgaWYgJ3NlbGVjdGVkX2V4Y2hhbmdlJyBub3QgaW4gc3Quc2Vzc2lvbl9zdGF0ZTogc3Quc2Vzc2lvbl9zdGF0ZS5zZWxlY3RlZF9leGNoYW5nZSA9ICJiaW5hbmNlIgogICAgY29sMSwgY29sMiwgY29sMyA9IHN0LmNvbHVtbnMoMykKICAgIGJfbGFiZWwgPSAi8J+UtiBCaW5hbmNlICIgKyAoIuKchSIgaWYgc3Quc2Vzc2lvbl9zdGF0ZS5zZWxlY3RlZF9leGNoYW5nZSA9PSAiYmluYW5jZSIgZWxzZSAiIikKICAgIGtfbGFiZWwgPSAi8J+fqSBLdUNvaW4gIiArICgi4pyFIiBpZiBzdC5zZXNzaW9uX3N0YXRlLnNlbGVjdGVkX2V4Y2hhbmdlID09ICJrdWNvaW4iIGVsc2UgIiIpCiAgICBnX2xhYmVsID0gIvCfmqogR2F0ZS5pbyAiICsgKCLinIUiIGlmIHN0LnNlc3Npb25fc3RhdGUuc2VsZWN0ZWRfZXhjaGFuZ2UgPT0gImdhdGVpbyIgZWxzZSAiIikKCiAgICB3aXRoIGNvbDE6CiAgICAgICAgaWYgc3QuYnV0dG9uKGJfbGFiZWwsIGtleT0iYnRuX2JpbmFuY2UiKToKICAgICAgICAgICAgc3Quc2Vzc2lvbl9zdGF0ZS5zZWxlY3RlZF9leGNoYW5nZSA9ICJiaW5hbmNlIgogICAgICAgICAgICBzdC5yZXJ1bigpCiAgICB3aXRoIGNvbDI6CiAgICAgICAgaWYgc3QuYnV0dG9uKGtfbGFiZWwsIGtleT0iYnRuX2t1Y29pbiIpOgogICAgICAgICAgICBzdC5zZXNzaW9uX3N0YXRlLnNlbGVjdGVkX2V4Y2hhbmdlID0gImt1Y29pbiIKICAgICAgICAgICAgc3QucmVydW4oKQogICAgd2l0aCBjb2wzOgogICAgICAgIGlmIHN0LmJ1dHRvbihnX2xhYmVsLCBrZXk9ImJ0bl9nYXRlaW8iKToKICAgICAgICAgICAgc3Quc2Vzc2lvbl9zdGF0ZS5zZWxlY3RlZF9leGNoYW5nZSA9ICJnYXRlaW8iCiAgICAgICAgICAgIHN0LnJlcnVuKCkKICAgICAgICAgICAgCiAgICBzZWxlY3RlZF9leGNoYW5nZSA9IHN0LnNlc3Npb25fc3RhdGUuc2VsZWN0ZWRfZXhjaGFuZ2UKICAgIHN0Lm1hcmtkb3duKGYiIyMjIE1hcmtldCBNb3ZlcnM6IHtzZWxlY3RlZF9leGNoYW5nZS5jYXBpdGFsaXplKCl9IikKICAgIAogICAgd2l0aCBzdC5zcGlubmVyKGYiRmV0Y2hpbmcgbGl2ZSBkYXRhIGZyb20ge3NlbGVjdGVkX2V4Y2hhbmdlfS4uLiIpOgogICAgICAgIGdhaW5lcnMsIGxvc2VycyA9IGdldF9tYXJrZXRfbW92ZXJzKHNlbGVjdGVkX2V4Y2hhbmdlKQogICAgICAgIAogICAgaWYgbm90IGdhaW5lcnMuZW1wdHk6CiAgICAgICAgY29sX2dhaW4sIGNvbF9sb3NzID0gc3QuY29sdW1ucygyKQogICAgICAgIHdpdGggY29sX2dhaW46CiAgICAgICAgICAgIHN0Lm1hcmtkb3duKCIjIyMjIPCfmoAgVG9wIDEwIEdhaW5lcnMgKDI0aCkiKQogICAgICAgICAgICBzdC5kYXRhZnJhbWUoZ2FpbmVycy5zdHlsZS5mb3JtYXQoeydQcmljZSc6ICckezouNGZ9JywgJ0NoYW5nZSAlJzogJ3s6Ky4yZn0lJ30pLmJhY2tncm91bmRfZ3JhZGllbnQoc3Vic2V0PVsnQ2hhbmdlICUnXSwgY21hcD0nR3JlZW5zJyksIHVzZV9jb250YWluZXJfd2lkdGg9VHJ1ZSwgaGlkZV9pbmRleD1UcnVlKQogICAgICAgIHdpdGggY29sX2xvc3M6CiAgICAgICAgICAgIHN0Lm1hcmtkb3duKCIjIyMjIPCflLsgVG9wIDEwIExvc2VycyAoMjRoKSIpCiAgICAgICAgICAgIHN0LmRhdGFmcmFtZShsb3NlcnMuc3R5bGUuZm9ybWF0KHsnUHJpY2UnOiAnJHs6LjRmfScsICdDaGFuZ2UgJSc6ICd7OisuMmZ9JSd9KS5iYWNrZ3JvdW5kX2dyYWRpZW50KHN1YnNldD1bJ0NoYW5nZSAlJ10sIGNtYXA9J1JlZHNfcicpLCB1c2VfY29udGFpbmVyX3dpZHRoPVRydWUsIGhpZGVfaW5kZXg9VHJ1ZSkKICAgIGVsc2U6CiAgICAgICAgc3QuZXJyb3IoZiLimqDvuI8gQ291bGQgbm90IGZldGNoIG1hcmtldCBkYXRhIGZvciB7c2VsZWN0ZWRfZXhjaGFuZ2V9LiIpCgogICAgc3QubWFya2Rvd24oIi0tLSIpCiAgICBzdC5tYXJrZG93bigiPGJyPiIsIHVuc2FmZV9hbGxvd19odG1sPVRydWUpCiAgICBjMSwgYzIsIGMzID0gc3QuY29sdW1ucyhbMSwgMiwgMV0pCiAgICB3aXRoIGMyOgogICAgICAgIHN0Lm1hcmtkb3duKCc8ZGl2IGNsYXNzPSJzdGFydC10cmFkaW5nLWJ0biI+JywgdW5zYWZlX2FsbG93X2h0bWw9VHJ1ZSkKICAgICAgICBpZiBzdC5idXR0b24oIvCfmoAgU3RhcnQgVHJhZGluZyIsIHVzZV9jb250YWluZXJfd2lkdGg9VHJ1ZSk6IG5hdmlnYXRlX3RvKCJTdHJhdGVneSBCdWlsZGVyIikKICAgICAgICBzdC5tYXJrZG93bignPC9kaXY+JywgdW5zYWZlX2FsbG93X2h0bWw9VHJ1ZSkKCmVsaWYgc3Quc2Vzc2lvbl9zdGF0ZS5wYWdlID09ICJTdHJhdGVneSBCdWlsZGVyIjoKICAgIHN0LnRpdGxlKCLwn6epIFN0cmF0ZWd5IEJ1aWxkZXIiKQogICAgc3QubWFya2Rvd24oIkNvbmZpZ3VyZSB5b3VyIGF1dG9ub21vdXMgYWdlbnQgcGFyYW1ldGVycy4iKQogICAgCiAgICBpZiAnd2F0Y2hsaXN0JyBub3QgaW4gc3Quc2Vzc2lvbl9zdGF0ZToKICAgICAgICBzdC5zZXNzaW9uX3N0YXRlLndhdGNobGlzdCA9IHBkLkRhdGFGcmFtZShjb2x1bW5zPVsnU3ltYm9sJywgJ1ByaWNlJywgJ1ZvbHVtZScsICdDaGFuZ2UgMjRoICUnXSkKCiAgICAjIExheW91dDogTGVmdCAoTWFya2V0IERhdGEpIC0gUmlnaHQgKFN0cmF0ZWd5IFBhbmVsKQogICAgY29sX2xlZnQsIGNvbF9yaWdodCA9IHN0LmNvbHVtbnMoWzIsIDFdKQoKICAgICMgLS0tIExFRlQgUEFORUw6IE1hcmtldCBEYXRhIC0tLQogICAgd2l0aCBjb2xfbGVmdDoKICAgICAgICAjIDEuIENvbmZpZ3VyYXRpb24gQ29udHJvbHMKICAgICAgICB3aXRoIHN0LmNvbnRhaW5lcigpOgogICAgICAgICAgICBjMSwgYzIsIGMzID0gc3QuY29sdW1ucygzKQogICAgICAgICAgICB3aXRoIGMxOiBzdHJhdF9leGNoYW5nZSA9IHN0LnNlbGVjdGJveCgiRXhjaGFuZ2UiLCBbImJpbmFuY2UiLCAia3Vjb2luIiwgImdhdGVpbyJdLCBpbmRleD0wKQogICAgICAgICAgICB3aXRoIGMyOiBiYXNlX2N1cnJlbmN5ID0gc3Quc2VsZWN0Ym94KCJCYXNlIEN1cnJlbmN5IiwgWyJVU0RUIiwgIlVTREMiLCAiQlRDIiwgIkVUSCJdLCBpbmRleD0wKQogICAgICAgICAgICB3aXRoIGMzOiBtYXJrZXRfdHlwZSA9IHN0LnJhZGlvKCJNYXJrZXQgVHlwZSIsIFsiU3BvdCIsICJGdXR1cmVzIl0sIGhvcml6b250YWw9VHJ1ZSkKCiAgICAgICAgc3QubWFya2Rvd24oIi0tLSIpCiAgICAgICAgCiAgICAgICAgIyAyLiBGZXRjaCBQYWlycyBEYXRhCiAgICAgICAgc3Quc3ViaGVhZGVyKGYiVG9wIDEwMCB7bWFya2V0X3R5cGV9IFBhaXJzICh7YmFzZV9jdXJyZW5jeX0pIikKICAgICAgICB3aXRoIHN0LnNwaW5uZXIoIlNjYW5uaW5nIG1hcmtldCBkYXRhLi4uIik6CiAgICAgICAgICAgIHBhaXJzX2RmID0gZ2V0X3RvcF9wYWlycyhzdHJhdF9leGNoYW5nZSwgbWFya2V0X3R5cGUsIGJhc2VfY3VycmVuY3kpCiAgICAgICAgICAgIAogICAgICAgIGlmIG5vdCBwYWlyc19kZi5lbXB0eToKICAgICAgICAgICAgc2VhcmNoX3F1ZXJ5ID0gc3QudGV4dF9pbnB1dCgi8J+UjSBTZWFyY2ggVG9rZW4iLCBwbGFjZWhvbGRlcj0iZS5nLiwgQlRDLCBFVEgsIFNPTCIpCiAgICAgICAgICAgIGZpbHRlcmVkX2RmID0gcGFpcnNfZGZbcGFpcnNfZGZbJ1N5bWJvbCddLnN0ci5jb250YWlucyhzZWFyY2hfcXVlcnkudXBwZXIoKSldIGlmIHNlYXJjaF9xdWVyeSBlbHNlIHBhaXJzX2RmCgogICAgICAgICAgICBpZiAnc2hvd19hbGxfcGFpcnMnIG5vdCBpbiBzdC5zZXNzaW9uX3N0YXRlOiBzdC5zZXNzaW9uX3N0YXRlLnNob3dfYWxsX3BhaXJzID0gRmFsc2UKICAgICAgICAgICAgZGlzcGxheV9saW1pdCA9IDIwIGlmIG5vdCBzdC5zZXNzaW9uX3N0YXRlLnNob3dfYWxsX3BhaXJzIGVsc2UgMTAwCiAgICAgICAgICAgIAogICAgICAgICAgICAjIFByZXBhcmUgRGF0YSBmb3IgRWRpdG9yCiAgICAgICAgICAgIGVkaXRvcl9kZiA9IGZpbHRlcmVkX2RmLmhlYWQoZGlzcGxheV9saW1pdCkuY29weSgpCiAgICAgICAgICAgIGNvbHMgPSBbJ1NlbGVjdCddICsgW2MgZm9yIGMgaW4gZWRpdG9yX2RmLmNvbHVtbnMgaWYgYyAhPSAnU2VsZWN0J10KICAgICAgICAgICAgZWRpdG9yX2RmID0gZWRpdG9yX2RmW2NvbHNdCgogICAgICAgICAgICBlZGl0ZWRfZGYgPSBzdC5kYXRhX2VkaXRvcigKICAgICAgICAgICAgICAgIGVkaXRvcl9kZiwKICAgICAgICAgICAgICAgIGhpZGVfaW5kZXg9VHJ1ZSwKICAgICAgICAgICAgICAgIGNvbHVtbl9jb25maWc9ewogICAgICAgICAgICAgICAgICAgICJTZWxlY3QiOiBzdC5jb2x1bW5fY29uZmlnLkNoZWNrYm94Q29sdW1uKCJBZGQiLCBkZWZhdWx0PUZhbHNlKSwKICAgICAgICAgICAgICAgICAgICAiUHJpY2UiOiBzdC5jb2x1bW5fY29uZmlnLk51bWJlckNvbHVtbihmb3JtYXQ9IiQlLjRmIiksCiAgICAgICAgICAgICAgICAgICAgIlZvbHVtZSI6IHN0LmNvbHVtbl9jb25maWcuTnVtYmVyQ29sdW1uKGZvcm1hdD0iJCUuMGYiKSwKICAgICAgICAgICAgICAgICAgICAiQ2hhbmdlIDI0aCAlIjogc3QuY29sdW1uX2NvbmZpZy5OdW1iZXJDb2x1bW4oZm9ybWF0PSIlLjJmJSUiKSwKICAgICAgICAgICAgICAgIH0sCiAgICAgICAgICAgICAgICBkaXNhYmxlZD1bIlN5bWJvbCIsICJQcmljZSIsICJWb2x1bWUiLCAiQ2hhbmdlIDI0aCAlIl0sCiAgICAgICAgICAgICAgICB1c2VfY29udGFpbmVyX3dpZHRoPVRydWUKICAgICAgICAgICAgKQogICAgICAgICAgICAKICAgICAgICAgICAgc2VsZWN0ZWRfcm93cyA9IGVkaXRlZF9kZltlZGl0ZWRfZGYuU2VsZWN0XQogICAgICAgICAgICBpZiBub3Qgc2VsZWN0ZWRfcm93cy5lbXB0eToKICAgICAgICAgICAgICAgIG5ld19waWNrcyA9IHNlbGVjdGVkX3Jvd3MuZHJvcChjb2x1bW5zPVsnU2VsZWN0J10pCiAgICAgICAgICAgICAgICBjb21iaW5lZCA9IHBkLmNvbmNhdChbc3Quc2Vzc2lvbl9zdGF0ZS53YXRjaGxpc3QsIG5ld19waWNrc10pCiAgICAgICAgICAgICAgICBzdC5zZXNzaW9uX3N0YXRlLndhdGNobGlzdCA9IGNvbWJpbmVkLmRyb3BfZHVwbGljYXRlcyhzdWJzZXQ9WydTeW1ib2wnXSkKCiAgICAgICAgICAgIGlmIGxlbihmaWx0ZXJlZF9kZikgPiAyMCBhbmQgbm90IHN0LnNlc3Npb25fc3RhdGUuc2hvd19hbGxfcGFpcnM6CiAgICAgICAgICAgICAgICBpZiBzdC5idXR0b24oZiJTaG93IEFsbCB7bGVuKGZpbHRlcmVkX2RmKX0gUGFpcnMiKToKICAgICAgICAgICAgICAgICAgICBzdC5zZXNzaW9uX3N0YXRlLnNob3dfYWxsX3BhaXJzID0gVHJ1ZQogICAgICAgICAgICAgICAgICAgIHN0LnJlcnVuKCkKICAgICAgICAgICAgZWxpZiBzdC5zZXNzaW9uX3N0YXRlLnNob3dfYWxsX3BhaXJzOgogICAgICAgICAgICAgICAgaWYgc3QuYnV0dG9uKCJTaG93IExlc3MiKToKICAgICAgICAgICAgICAgICAgICBzdC5zZXNzaW9uX3N0YXRlLnNob3dfYWxsX3BhaXJzID0gRmFsc2UKICAgICAgICAgICAgICAgICAgICBzdC5yZXJ1bigpCiAgICAgICAgZWxzZToKICAgICAgICAgICAgc3Qud2FybmluZygiTm8gcGFpcnMgZm91bmQuIikKCiAgICAgICAgIyBXYXRjaGxpc3QgU2VjdGlvbgogICAgICAgIHN0Lm1hcmtkb3duKCItLS0iKQogICAgICAgIHN0LnN1YmhlYWRlcigi8J+TiyBZb3VyIFdhdGNobGlzdCAoU2VsZWN0ZWQgUGFpcnMpIikKICAgICAgICBpZiBub3Qgc3Quc2Vzc2lvbl9zdGF0ZS53YXRjaGxpc3QuZW1wdHk6CiAgICAgICAgICAgIHdhdGNobGlzdF9lZGl0b3IgPSBzdC5kYXRhX2VkaXRvcigKICAgICAgICAgICAgICAgIHN0LnNlc3Npb25fc3RhdGUud2F0Y2hsaXN0LAogICAgICAgICAgICAgICAgaGlkZV9pbmRleD1UcnVlLAogICAgICAgICAgICAgICAgY29sdW1uX2NvbmZpZz17IlByaWNlIjogc3QuY29sdW1uX2NvbmZpZy5OdW1iZXJDb2x1bW4oZm9ybWF0PSIkJS40ZiIpfSwKICAgICAgICAgICAgICAgIGRpc2FibGVkPVsiU3ltYm9sIiwgIlByaWNlIiwgIlZvbHVtZSIsICJDaGFuZ2UgMjRoICUiXSwKICAgICAgICAgICAgICAgIHVzZV9jb250YWluZXJfd2lkdGg9VHJ1ZSwKICAgICAgICAgICAgICAgIGtleT0id2F0Y2hsaXN0X2VkaXRvciIsCiAgICAgICAgICAgICAgICBudW1fcm93cz0iZHluYW1pYyIKICAgICAgICAgICAgKQogICAgICAgICAgICBpZiBub3Qgd2F0Y2hsaXN0X2VkaXRvci5lcXVhbHMoc3Quc2Vzc2lvbl9zdGF0ZS53YXRjaGxpc3QpOgogICAgICAgICAgICAgICAgIHN0LnNlc3Npb25fc3RhdGUud2F0Y2hsaXN0ID0gd2F0Y2hsaXN0X2VkaXRvcgogICAgICAgICAgICAgICAgIHN0LnJlcnVuKCkKICAgICAgICAgICAgaWYgc3QuYnV0dG9uKCLwn5eR77iPIENsZWFyIFdhdGNobGlzdCIpOgogICAgICAgICAgICAgICAgc3Quc2Vzc2lvbl9zdGF0ZS53YXRjaGxpc3QgPSBwZC5EYXRhRnJhbWUoY29sdW1ucz1bJ1N5bWJvbCcsICdQcmljZScsICdWb2x1bWUnLCAnQ2hhbmdlIDI0aCAlJ10pCiAgICAgICAgICAgICAgICBzdC5yZXJ1bigpCiAgICAgICAgZWxzZToKICAgICAgICAgICAgc3QuaW5mbygiTm8gcGFpcnMgc2VsZWN0ZWQuIikKCiAgICAgICAgIyAtLS0gU1RSQVRFR1kgU0VUVVAgU0VDVElPTiAtLS0KICAgICAgICBzdC5tYXJrZG93bigiLS0tIikKICAgICAgICBzdC5zdWJoZWFkZXIoIvCfm6DvuI8gU3RyYXRlZ3kgU2V0dXAgKFYyIENvbXBvbmVudCBCdWlsZGVyKSIpCiAgICAgICAgCiAgICAgICAgQVZBSUxBQkxFX0lORElDQVRPUlMgPSB7CiAgICAgICAgICAgICJFTUEiOiBbIlZhbHVlIHZzIFByaWNlIl0sCiAgICAgICAgICAgICJTTUEiOiBbIlZhbHVlIHZzIFByaWNlIl0sCiAgICAgICAgICAgICJSU0kiOiBbIkRpcmVjdGlvbiAoQWJvdmUvQmVsb3cgNTApIl0sCiAgICAgICAgICAgICJWb3J0ZXgiOiBbIlRyZW5kIChWSSsgLyBWSS0pIl0sCiAgICAgICAgICAgICJMaW5SZWcgU2xvcGUiOiBbIlNsb3BlIERpcmVjdGlvbiJdLAogICAgICAgICAgICAiVFRNIFNxdWVlemUiOiBbIkhpc3RvZ3JhbSBNb21lbnR1bSJdLAogICAgICAgICAgICAiQ2hhaWtpbiBNb25leSBGbG93IjogWyJDTUYgWmVyby1Dcm9zcyJdLAogICAgICAgICAgICAiSWNoaW1va3UiOiBbIkNsb3VkIiwgIlRlbmthbi9LaWp1biJdCiAgICAgICAgfQoKICAgICAgICBkZWYgcmVuZGVyX2luZGljYXRvcl9zZWxlY3Rvcih0Zl9rZXkpOgogICAgICAgICAgICBzZWxlY3RlZCA9IHN0Lm11bHRpc2VsZWN0KGYiU2VsZWN0IEluZGljYXRvcnMgZm9yIHt0Zl9rZXkuY2FwaXRhbGl6ZSgpfSIsIGxpc3QoQVZBSUxBQkxFX0lORElDQVRPUlMua2V5cygpKSwga2V5PWYibXVsdGlfe3RmX2tleX0iKQogICAgICAgICAgICAKICAgICAgICAgICAgaW5kc19jb25maWcgPSBbXQogICAgICAgICAgICBmb3IgbmFtZSBpbiBzZWxlY3RlZDoKICAgICAgICAgICAgICAgIGNvbF9uYW1lLCBjb2xfZ2VhciA9IHN0LmNvbHVtbnMoWzQsIDFdKQogICAgICAgICAgICAgICAgY29sX25hbWUubWFya2Rvd24oZiIqKntuYW1lfSoqIikKICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgcGFyYW1zID0geyJsZW5ndGgiOiAxNCwgInNvdXJjZSI6ICJjbG9zZSJ9CiAgICAgICAgICAgICAgICBpZiBuYW1lID09ICJJY2hpbW9rdSI6IHBhcmFtcyA9IHsidGVua2FuIjogOSwgImtpanVuIjogMjYsICJzZW5rb3UiOiA1Mn0KICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgd2l0aCBjb2xfZ2VhcjoKICAgICAgICAgICAgICAgICAgICB3aXRoIHN0LnBvcG92ZXIoIuKame+4jyIpOgogICAgICAgICAgICAgICAgICAgICAgICBzdC53cml0ZShmIkNvbmZpZ3VyZSB7bmFtZX0iKQogICAgICAgICAgICAgICAgICAgICAgICBzcmMgPSBzdC5zZWxlY3Rib3goIlNvdXJjZSIsIFsiY2xvc2UiLCAib3BlbiIsICJoaWdoIiwgImxvdyJdLCBrZXk9ZiJzcmNfe3RmX2tleX1fe25hbWV9IikKICAgICAgICAgICAgICAgICAgICAgICAgcGFyYW1zWydzb3VyY2UnXSA9IHNyYwogICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgaWYgbmFtZSBpbiBbIkVNQSIsICJTTUEiLCAiUlNJIiwgIlZvcnRleCIsICJMaW5SZWcgU2xvcGUiLCAiQ2hhaWtpbiBNb25leSBGbG93Il06CiAgICAgICAgICAgICAgICAgICAgICAgICAgICBwYXJhbXNbJ2xlbmd0aCddID0gc3QubnVtYmVyX2lucHV0KCJQZXJpb2QiLCB2YWx1ZT0xNCBpZiBuYW1lICE9ICJDaGFpa2luIE1vbmV5IEZsb3ciIGVsc2UgMjAsIGtleT1mImxlbl97dGZfa2V5fV97bmFtZX0iKQogICAgICAgICAgICAgICAgICAgICAgICBlbGlmIG5hbWUgPT0gIkljaGltb2t1IjoKICAgICAgICAgICAgICAgICAgICAgICAgICAgIHBhcmFtc1sndGVua2FuJ10gPSBzdC5udW1iZXJfaW5wdXQoIlRlbmthbiIsIHZhbHVlPTksIGtleT1mInRfe3RmX2tleX1fe25hbWV9IikKICAgICAgICAgICAgICAgICAgICAgICAgICAgIHBhcmFtc1sna2lqdW4nXSA9IHN0Lm51bWJlcl9pbnB1dCgiS2lqdW4iLCB2YWx1ZT0yNiwga2V5PWYia197dGZfa2V5fV97bmFtZX0iKQogICAgICAgICAgICAgICAgICAgICAgICAgICAgcGFyYW1zWydzZW5rb3UnXSA9IHN0Lm51bWJlcl9pbnB1dCgiU2Vua291IiwgdmFsdWU9NTIsIGtleT1mInNfe3RmX2tleX1fe25hbWV9IikKICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgIHN0LndyaXRlKCJDb21wb25lbnRzIHRvIENoZWNrIChDb25maXJtYXRpb24pIikKICAgICAgICAgICAgICAgICAgICAgICAgc2VsZWN0ZWRfY29tcG9uZW50cyA9IFtdCiAgICAgICAgICAgICAgICAgICAgICAgIGZvciBjb21wIGluIEFWQUlMQUJMRV9JTkRJQ0FUT1JTW25hbWVdOgogICAgICAgICAgICAgICAgICAgICAgICAgICAgaWYgc3QuY2hlY2tib3goY29tcCwgdmFsdWU9VHJ1ZSwga2V5PWYiY29tcF97dGZfa2V5fV97bmFtZX1fe2NvbXB9Iik6CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgc2VsZWN0ZWRfY29tcG9uZW50cy5hcHBlbmQoY29tcCkKICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgaW5kc19jb25maWcuYXBwZW5kKHsKICAgICAgICAgICAgICAgICAgICAibmFtZSI6IG5hbWUsCiAgICAgICAgICAgICAgICAgICAgInBhcmFtcyI6IHBhcmFtcywKICAgICAgICAgICAgICAgICAgICAic2VsZWN0ZWRfY29tcG9uZW50cyI6IHNlbGVjdGVkX2NvbXBvbmVudHMKICAgICAgICAgICAgICAgIH0pCiAgICAgICAgICAgIHJldHVybiBpbmRzX2NvbmZpZwoKICAgICAgICBzdC5pbmZvKCJHbG9iYWwgQWxpZ25tZW50IExvZ2ljOiBUcmlnZ2VyIEFnZW50IG9ubHkgd2hlbiBBTEwgc2VsZWN0ZWQgaW5kaWNhdG9ycyBvbiBBTEwgdGltZWZyYW1lcyBhbGlnbi4iKQogICAgICAgIAogICAgICAgIHdpdGggc3QuY29udGFpbmVyKGJvcmRlcj1UcnVlKToKICAgICAgICAgICAgc3QubWFya2Rvd24oIiMjIyDwn5WSIEhpZ2ggVGltZWZyYW1lIChUcmVuZCBGaWx0ZXIpIikKICAgICAgICAgICAgbGFyZ2VfY2ZnID0gcmVuZGVyX2luZGljYXRvcl9zZWxlY3RvcigibGFyZ2UiKQogICAgICAgICAgICAKICAgICAgICB3aXRoIHN0LmNvbnRhaW5lcihib3JkZXI9VHJ1ZSk6CiAgICAgICAgICAgIHN0Lm1hcmtkb3duKCIjIyMg8J+VkiBNZWRpdW0gVGltZWZyYW1lIChUcmVuZCBGaWx0ZXIpIikKICAgICAgICAgICAgbWVkX2NmZyA9IHJlbmRlcl9pbmRpY2F0b3Jfc2VsZWN0b3IoIm1lZCIpCgogICAgICAgIHdpdGggc3QuY29udGFpbmVyKGJvcmRlcj1UcnVlKToKICAgICAgICAgICAgc3QubWFya2Rvd24oIiMjIyDwn5WSIFNob3J0IFRpbWVmcmFtZSAoRW50cnkgVHJpZ2dlcikiKQogICAgICAgICAgICBzbWFsbF9jZmcgPSByZW5kZXJfaW5kaWNhdG9yX3NlbGVjdG9yKCJzbWFsbCIpCgogICAgICAgIGlmIHN0LmJ1dHRvbigi8J+SviBBcHBseSBWMiBTdHJhdGVneSBTZXR1cCIsIHVzZV9jb250YWluZXJfd2lkdGg9VHJ1ZSk6CiAgICAgICAgICAgIHN0LnNlc3Npb25fc3RhdGUuY3VycmVudF9zdHJhdGVneV9sb2dpYyA9IHsKICAgICAgICAgICAgICAgICJ2ZXJzaW9uIjogIjIuMCIsCiAgICAgICAgICAgICAgICAic21hbGwiOiBzbWFsbF9jZmcsCiAgICAgICAgICAgICAgICAibWVkIjogbWVkX2NmZywKICAgICAgICAgICAgICAgICJsYXJnZSI6IGxhcmdlX2NmZwogICAgICAgICAgICB9CiAgICAgICAgICAgIHN0LnN1Y2Nlc3MoIlYyIFN0cmF0ZWd5IEFwcGxpZWQhIikKCiAgICAjIC0tLSBSSUdIVCBQQU5FTDogU3RyYXRlZ3kgU2V0dGluZ3MgLS0tCiAgICB3aXRoIGNvbF9yaWdodDoKICAgICAgICBzdC5tYXJrZG93bigiIyMjIOKame+4jyBTdHJhdGVneSBTZXR0aW5ncyIpCiAgICAgICAgCiAgICAgICAgd2l0aCBzdC5jb250YWluZXIoYm9yZGVyPVRydWUpOgogICAgICAgICAgICBzdC5zdWJoZWFkZXIoIvCfkrAgVXNlciBBY2NvdW50IikKICAgICAgICAgICAgdXNlcl9hY2NvdW50ID0gc3QubnVtYmVyX2lucHV0KCJUb3RhbCBCYWxhbmNlIChVU0RUKSIsIHZhbHVlPTEwMDAuMCwgc3RlcD0xMDAuMCkKICAgICAgICAgICAgCiAgICAgICAgICAgIHN0LnN1YmhlYWRlcigi8J+agCBQb3NpdGlvbiBTaXppbmciKQogICAgICAgICAgICBzdGFydF9hbW91bnQgPSBzdC5udW1iZXJfaW5wdXQoIlN0YXJ0aW5nIEFtb3VudCAoVVNEVCkiLCBtaW5fdmFsdWU9MTAuMCwgdmFsdWU9MTAwLjAsIHN0ZXA9MTAuMCkKICAgICAgICAgICAgbGlxdWlkaXR5ID0gc3QubnVtYmVyX2lucHV0KCJMaXF1aWRpdHkgUG9vbCAoVVNEVCkiLCBtaW5fdmFsdWU9MC4wLCB2YWx1ZT01MDAuMCwgc3RlcD01MC4wKQogICAgICAgICAgICAKICAgICAgICAgICAgc3QubWFya2Rvd24oIi0tLSIpCiAgICAgICAgICAgIHN0LnN1YmhlYWRlcigi8J+TiiBUcmFkaW5nIExldmVscyAoTWFydGluZ2FsZSkiKQogICAgICAgICAgICBtYXhfbGV2ZWxzID0gc3QubnVtYmVyX2lucHV0KCJNYXggTGV2ZWxzIiwgbWluX3ZhbHVlPTEsIG1heF92YWx1ZT0xMCwgdmFsdWU9NSwgc3RlcD0xKQogICAgICAgICAgICBsZXZlbHMgPSBbXQogICAgICAgICAgICBmb3IgaSBpbiByYW5nZSgxLCBtYXhfbGV2ZWxzICsgMSk6CiAgICAgICAgICAgICAgICBsdmxfdmFsID0gc3QubnVtYmVyX2lucHV0KGYiTGV2ZWwge2l9ICgkKSIsIHZhbHVlPWZsb2F0KGkgKiAxMDApLCBzdGVwPTEwLjAsIGtleT1mImxldmVsX3tpfSIpCiAgICAgICAgICAgICAgICBsZXZlbHMuYXBwZW5kKGx2bF92YWwpCiAgICAgICAgICAgIAogICAgICAgICAgICBzdC5tYXJrZG93bigiIyMjIyDwn5uh77iPIFNhZmUgTGV2ZWxzIikKICAgICAgICAgICAgc2wxID0gc3QubnVtYmVyX2lucHV0KCJTTGV2ZWwgMSAoJCkiLCB2YWx1ZT04MC4wLCBzdGVwPTEwLjApCiAgICAgICAgICAgIHNsMiA9IHN0Lm51bWJlcl9pbnB1dCgiU0xldmVsIDIgKCQpIiwgdmFsdWU9NjAuMCwgc3RlcD0xMC4wKQogICAgICAgICAgICAKICAgICAgICAgICAgc3QubWFya2Rvd24oIi0tLSIpCiAgICAgICAgICAgIHN0LnN1YmhlYWRlcigi4pqW77iPIFJpc2sgTWFuYWdlbWVudCIpCiAgICAgICAgICAgIG1heF9vcGVuX3RyYWRlcyA9IHN0Lm51bWJlcl9pbnB1dCgiTWF4IE9wZW4gVHJhZGVzIiwgbWluX3ZhbHVlPTEsIHZhbHVlPTUpCiAgICAgICAgICAgIHJpc2tfdmFsID0gc3QubnVtYmVyX2lucHV0KCJSaXNrIEZhY3RvciIsIHZhbHVlPTEuMCwgc3RlcD0wLjEpCiAgICAgICAgICAgIHJld2FyZF92YWwgPSBzdC5udW1iZXJfaW5wdXQoIlJld2FyZCBGYWN0b3IiLCB2YWx1ZT0zLjAsIHN0ZXA9MC4xKQogICAgICAgICAgICByaXNrX3Blcl90cmFkZSA9IHN0Lm51bWJlcl9pbnB1dCgiUmlzayBQZXIgVHJhZGUgKCUpIiwgbWluX3ZhbHVlPTAuMSwgbWF4X3ZhbHVlPTEwMC4wLCB2YWx1ZT0yLjAsIHN0ZXA9MC4xKQogICAgICAgICAgICAKICAgICAgICAgICAgIyBGdXR1cmVzIERpcmVjdGlvbgogICAgICAgICAgICBpZiBtYXJrZXRfdHlwZSA9PSAiRnV0dXJlcyI6CiAgICAgICAgICAgICAgICB0cmFkZV9kaXJlY3Rpb24gPSBzdC5yYWRpbygiVHJhZGUgRGlyZWN0aW9uIiwgWyJMb25nIE9ubHkiLCAiU2hvcnQgT25seSIsICJCb3RoIl0sIGluZGV4PTIsIGhvcml6b250YWw9VHJ1ZSkKICAgICAgICAgICAgZWxzZToKICAgICAgICAgICAgICAgIHRyYWRlX2RpcmVjdGlvbiA9ICJMb25nIE9ubHkiCiAgICAgICAgICAgIAogICAgICAgICAgICBzdC5tYXJrZG93bigiLS0tIikKICAgICAgICAgICAgc3Quc3ViaGVhZGVyKCLij7HvuI8gVGltZWZyYW1lcyIpCiAgICAgICAgICAgIHRmX3NtYWxsID0gc3Quc2VsZWN0Ym94KCJTbWFsbCBURiIsIFsiMTVtIiwgIjMwbSIsICIxaCIsICI0aCJdLCBpbmRleD0wKQogICAgICAgICAgICB0Zl9tZWRpdW0gPSBzdC5zZWxlY3Rib3goIk1lZGl1bSBURiIsIFsiMzBtIiwgIjFoIiwgIjRoIiwgIjFkIl0sIGluZGV4PTIpCiAgICAgICAgICAgIHRmX2xhcmdlID0gc3Quc2VsZWN0Ym94KCJMYXJnZSBURiIsIFsiMWgiLCAiNGgiLCAiMWQiLCAiMXciXSwgaW5kZXg9MikKICAgICAgICAgICAgCiAgICAgICAgICAgIGlmIHN0LmJ1dHRvbigi8J+agCBTVEFSVCBJTlNUQU5DRSIsIHR5cGU9InByaW1hcnkiLCB1c2VfY29udGFpbmVyX3dpZHRoPVRydWUpOgogICAgICAgICAgICAgICAgaWYgc3Quc2Vzc2lvbl9zdGF0ZS53YXRjaGxpc3QuZW1wdHk6CiAgICAgICAgICAgICAgICAgICAgc3QuZXJyb3IoIkFkZCBwYWlycyBmaXJzdCEiKQogICAgICAgICAgICAgICAgZWxzZToKICAgICAgICAgICAgICAgICAgICBsb2dpYyA9IHN0LnNlc3Npb25fc3RhdGUuZ2V0KCdjdXJyZW50X3N0cmF0ZWd5X2xvZ2ljJywgeyJ2ZXJzaW9uIjogIjIuMCIsICJzbWFsbCI6IFtdLCAibWVkIjogW10sICJsYXJnZSI6IFtdfSkKICAgICAgICAgICAgICAgICAgICBjb25maWcgPSB7CiAgICAgICAgICAgICAgICAgICAgICAgICJleGNoYW5nZSI6IHN0cmF0X2V4Y2hhbmdlLAogICAgICAgICAgICAgICAgICAgICAgICAiYmFzZV9jdXJyZW5jeSI6IGJhc2VfY3VycmVuY3ksCiAgICAgICAgICAgICAgICAgICAgICAgICJtYXJrZXRfdHlwZSI6IG1hcmtldF90eXBlLAogICAgICAgICAgICAgICAgICAgICAgICAic3RyYXRlZ3lfcGFyYW1zIjogewogICAgICAgICAgICAgICAgICAgICAgICAgICAgInVzZXJfYWNjb3VudCI6IHVzZXJfYWNjb3VudCwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICJzdGFydF9hbW91bnQiOiBzdGFydF9hbW91bnQsCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAibGlxdWlkaXR5IjogbGlxdWlkaXR5LAogICAgICAgICAgICAgICAgICAgICAgICAgICAgImxldmVscyI6IGxldmVscywKICAgICAgICAgICAgICAgICAgICAgICAgICAgICJzYWZlX2xldmVscyI6IFtzbDEsIHNsMl0sCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAicmlzayI6IHsibWF4X3RyYWRlcyI6IG1heF9vcGVuX3RyYWRlcywgInJyIjogZiJ7cmlza192YWx9OntyZXdhcmRfdmFsfSIsICJwY3QiOiByaXNrX3Blcl90cmFkZX0sCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAidGltZWZyYW1lcyI6IFt0Zl9zbWFsbCwgdGZfbWVkaXVtLCB0Zl9sYXJnZV0sCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAidHJhZGVfZGlyZWN0aW9uIjogdHJhZGVfZGlyZWN0aW9uCiAgICAgICAgICAgICAgICAgICAgICAgIH0sCiAgICAgICAgICAgICAgICAgICAgICAgICJzdHJhdGVneV9sb2dpYyI6IGxvZ2ljCiAgICAgICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgICAgICAgIHBhaXJzX2xpc3QgPSBzdC5zZXNzaW9uX3N0YXRlLndhdGNobGlzdFsnU3ltYm9sJ10udG9saXN0KCkKICAgICAgICAgICAgICAgICAgICBpbnN0YW5jZV9uYW1lID0gcmVnaXN0ZXJfaW5zdGFuY2UoY29uZmlnLCBwYWlyc19saXN0KQogICAgICAgICAgICAgICAgICAgIGlmIGluc3RhbmNlX25hbWU6CiAgICAgICAgICAgICAgICAgICAgICAgIHN0LmJhbGxvb25zKCkKICAgICAgICAgICAgICAgICAgICAgICAgc3Quc2Vzc2lvbl9zdGF0ZS53YXRjaGxpc3QgPSBwZC5EYXRhRnJhbWUoY29sdW1ucz1bJ1N5bWJvbCcsICdQcmljZScsICdWb2x1bWUnLCAnQ2hhbmdlIDI0aCAlJ10pCiAgICAgICAgICAgICAgICAgICAgICAgIHRpbWUuc2xlZXAoMSkKICAgICAgICAgICAgICAgICAgICAgICAgbmF2aWdhdGVfdG8oIkxpdmUgTW9uaXRvciIpCgplbGlmIHN0LnNlc3Npb25fc3RhdGUucGFnZSA9PSAiTGl2ZSBNb25pdG9yIjoKICAgIHN0LnRpdGxlKCLwn5S0IExpdmUgTW9uaXRvciIpCiAgICBjb25uID0gZ2V0X2Nvbm5lY3Rpb24oKQogICAgIyBGaXhlZCBwYXRoIGZvciBjYW5kbGVzLmRiCiAgICBjX2Nvbm4gPSBzcWxpdGUzLmNvbm5lY3QoImNhbmRsZXMuZGIiKQogICAgCiAgICBpZiBjb25uOgogICAgICAgIGRmX2luc3RhbmNlcyA9IHBkLnJlYWRfc3FsKCJTRUxFQ1QgKiBGUk9NIGluc3RhbmNlcyBXSEVSRSBzdGF0dXMgIT0gJ0RFTEVURUQnIE9SREVSIEJZIGNyZWF0ZWRfYXQgREVTQyIsIGNvbm4pCiAgICAgICAgaWYgbm90IGRmX2luc3RhbmNlcy5lbXB0eToKICAgICAgICAgICAgZm9yIF8sIHJvdyBpbiBkZl9pbnN0YW5jZXMuaXRlcnJvd3MoKToKICAgICAgICAgICAgICAgIHdpdGggc3QuZXhwYW5kZXIoZiLwn5CdIHtyb3dbJ25hbWUnXX0gKHtyb3dbJ3N0YXR1cyddfSkiLCBleHBhbmRlZD1UcnVlKToKICAgICAgICAgICAgICAgICAgICBtMSwgbTIsIG0zLCBtNCA9IHN0LmNvbHVtbnMoNCkKICAgICAgICAgICAgICAgICAgICBtMS5tZXRyaWMoIkV4Y2hhbmdlIiwgcm93WydleGNoYW5nZSddLmNhcGl0YWxpemUoKSkKICAgICAgICAgICAgICAgICAgICBtMi5tZXRyaWMoIk1hcmtldCBUeXBlIiwgcm93WydtYXJrZXRfdHlwZSddKQogICAgICAgICAgICAgICAgICAgIG0zLm1ldHJpYygiU3RhdHVzIiwgcm93WydzdGF0dXMnXSkKICAgICAgICAgICAgICAgICAgICBtNC5tZXRyaWMoIlRyYWRlcyIsICIwIikKCiAgICAgICAgICAgICAgICAgICAgc3QubWFya2Rvd24oIiMjIyMg8J+TiiBQYWlycyBBY3Rpdml0eSAmIFRyZW5kcyIpCiAgICAgICAgICAgICAgICAgICAgcGFpcnMgPSBqc29uLmxvYWRzKHJvd1sncGFpcnMnXSkKICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAjIFJvYnVzdCBsb2FkaW5nIHdpdGggZmFsbGJhY2tzIGZvciBvbGRlciBpbnN0YW5jZXMKICAgICAgICAgICAgICAgICAgICBzdHJhdF9sb2dpY19yYXcgPSByb3cuZ2V0KCdzdHJhdGVneV9qc29uJykKICAgICAgICAgICAgICAgICAgICBzdHJhdF9sb2dpYyA9IGpzb24ubG9hZHMoc3RyYXRfbG9naWNfcmF3KSBpZiBzdHJhdF9sb2dpY19yYXcgZWxzZSB7InZlcnNpb24iOiAiMS4wIiwgInNtYWxsIjogW10sICJtZWQiOiBbXSwgImxhcmdlIjogW119CiAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgc3RyYXRfcGFyYW1zX3JhdyA9IHJvdy5nZXQoJ3N0cmF0ZWd5X2NvbmZpZycpCiAgICAgICAgICAgICAgICAgICAgc3RyYXRfcGFyYW1zID0ganNvbi5sb2FkcyhzdHJhdF9wYXJhbXNfcmF3KSBpZiBzdHJhdF9wYXJhbXNfcmF3IGVsc2Uge30KICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICB0ZnMgPSBzdHJhdF9wYXJhbXMuZ2V0KCd0aW1lZnJhbWVzJywgW10pCgogICAgICAgICAgICAgICAgICAgIGZvciBwIGluIHBhaXJzOgogICAgICAgICAgICAgICAgICAgICAgICBwX2NvbHMgPSBzdC5jb2x1bW5zKFsxLjVdICsgWzFdICogbGVuKHRmcykpCiAgICAgICAgICAgICAgICAgICAgICAgIHBfY29sc1swXS5tYXJrZG93bihmIioqe3B9KioiKQogICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgZm9yIGksIHRmIGluIGVudW1lcmF0ZSh0ZnMpOgogICAgICAgICAgICAgICAgICAgICAgICAgICAgdGZfa2V5ID0gJ3NtYWxsJyBpZiBpID09IDAgZWxzZSAnbWVkJyBpZiBpID09IDEgZWxzZSAnbGFyZ2UnCiAgICAgICAgICAgICAgICAgICAgICAgICAgICB0Zl9pbmRpY2F0b3JzID0gc3RyYXRfbG9naWMuZ2V0KHRmX2tleSwgW10pCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgIGNhbmRsZV9xdWVyeSA9ICJTRUxFQ1QgKiBGUk9NIGNhbmRsZXMgV0hFUkUgaW5zdGFuY2VfaWQ9PyBBTkQgc3ltYm9sPT8gQU5EIHRpbWVmcmFtZT0/IE9SREVSIEJZIHRpbWVzdGFtcCBERVNDIExJTUlUIDI1MCIKICAgICAgICAgICAgICAgICAgICAgICAgICAgIGNfZGYgPSBwZC5yZWFkX3NxbChjYW5kbGVfcXVlcnksIGNfY29ubiwgcGFyYW1zPShyb3dbJ2lkJ10sIHAsIHRmKSkKICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgYmFkZ2UgPSAnPHNwYW4gY2xhc3M9InRyZW5kLWJhZGdlIHRyZW5kLW5ldXRyYWwiPlNZTkNJTkc8L3NwYW4+JwogICAgICAgICAgICAgICAgICAgICAgICAgICAgaWYgbm90IGNfZGYuZW1wdHk6CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgaWYgdGZfaW5kaWNhdG9yczoKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgdHJ5OgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgZGZfaW5kID0gc3RyYXRlZ3lfZW5naW5lLmNhbGN1bGF0ZV9pbmRpY2F0b3JzKGNfZGYuc29ydF92YWx1ZXMoJ3RpbWVzdGFtcCcpLCB0Zl9pbmRpY2F0b3JzKQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgcmVzID0gc3RyYXRlZ3lfZW5naW5lLmV2YWx1YXRlX2FsaWdubWVudChkZl9pbmQsIHRmX2luZGljYXRvcnMpCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBpZiByZXMgPT0gJ0JVWSc6IGJhZGdlID0gZic8c3BhbiBjbGFzcz0idHJlbmQtYmFkZ2UgdHJlbmQtdXAiPuKWsiB7dGZ9IEJVWTwvc3Bhbj4nCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBlbGlmIHJlcyA9PSAnU0VMTCc6IGJhZGdlID0gZic8c3BhbiBjbGFzcz0idHJlbmQtYmFkZ2UgdHJlbmQtZG93biI+4pa8IHt0Zn0gU0VMTDwvc3Bhbj4nCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBlbHNlOiBiYWRnZSA9IGYnPHNwYW4gY2xhc3M9InRyZW5kLWJhZGdlIHRyZW5kLW5ldXRyYWwiPuKXjyB7dGZ9IE5FVVQ8L3NwYW4+JwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBleGNlcHQ6IHBhc3MKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBlbHNlOgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAjIEZhbGxiYWNrIGZvciBvbGQgaW5zdGFuY2VzIG9yIHRpbWVmcmFtZXMgd2l0aCBubyBpbmRpY2F0b3JzCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIHRyeToKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIGRmX2luZCA9IHN0cmF0ZWd5X2VuZ2luZS5jYWxjdWxhdGVfaW5kaWNhdG9ycyhjX2RmLnNvcnRfdmFsdWVzKCd0aW1lc3RhbXAnKSkKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIHRyZW5kID0gc3RyYXRlZ3lfZW5naW5lLmdldF9yb3dfdHJlbmQoZGZfaW5kLmlsb2NbLTFdKQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgaWYgdHJlbmQgPT0gJ1VQJzogYmFkZ2UgPSBmJzxzcGFuIGNsYXNzPSJ0cmVuZC1iYWRnZSB0cmVuZC11cCI+4payIHt0Zn0gVVA8L3NwYW4+JwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgZWxpZiB0cmVuZCA9PSAnRE9XTic6IGJhZGdlID0gZic8c3BhbiBjbGFzcz0idHJlbmQtYmFkZ2UgdHJlbmQtZG93biI+4pa8IHt0Zn0gRE9XTjwvc3Bhbj4nCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBlbHNlOiBiYWRnZSA9IGYnPHNwYW4gY2xhc3M9InRyZW5kLWJhZGdlIHRyZW5kLW5ldXRyYWwiPuKXjyB7dGZ9IE5FVVQ8L3NwYW4+JwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBleGNlcHQ6IHBhc3MKICAgICAgICAgICAgICAgICAgICAgICAgICAgIHBfY29sc1tpKzFdLm1hcmtkb3duKGJhZGdlLCB1bnNhZmVfYWxsb3dfaHRtbD1UcnVlKQogICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgIHN0Lm1hcmtkb3duKCItLS0iKQogICAgICAgICAgICAgICAgICAgIGNfYnRuMSwgY19idG4yLCBjX2J0bjMgPSBzdC5jb2x1bW5zKDMpCiAgICAgICAgICAgICAgICAgICAgd2l0aCBjX2J0bjE6CiAgICAgICAgICAgICAgICAgICAgICAgIGlmIHN0LmJ1dHRvbigiU3RvcCIsIGtleT1mInN0b3Bfe3Jvd1snaWQnXX0iKToKICAgICAgICAgICAgICAgICAgICAgICAgICAgIGNvbm4uZXhlY3V0ZSgiVVBEQVRFIGluc3RhbmNlcyBTRVQgc3RhdHVzPSdTVE9QUEVEJyBXSEVSRSBpZD0/IiwgKHJvd1snaWQnXSwpKQogICAgICAgICAgICAgICAgICAgICAgICAgICAgY29ubi5jb21taXQoKQogICAgICAgICAgICAgICAgICAgICAgICAgICAgc3QucmVydW4oKQogICAgICAgICAgICAgICAgICAgIHdpdGggY19idG4zOgogICAgICAgICAgICAgICAgICAgICAgICBpZiBzdC5idXR0b24oIkRlbGV0ZSIsIGtleT1mImRlbF97cm93WydpZCddfSIpOgogICAgICAgICAgICAgICAgICAgICAgICAgICAgY29ubi5leGVjdXRlKCJVUERBVEUgaW5zdGFuY2VzIFNFVCBzdGF0dXM9J0RFTEVURUQnIFdIRVJFIGlkPT8iLCAocm93WydpZCddLCkpCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBjb25uLmNvbW1pdCgpCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBzdC5yZXJ1bigpCiAgICAgICAgY29ubi5jbG9zZSgpCiAgICAgICAgY19jb25uLmNsb3NlKCkK
\ No newline at end of file
+aW1wb3J0IHN0cmVhbWxpdCBhcyBzdAppbXBvcnQgc3FsaXRlMwppbXBvcnQgcGFuZGFzIGFzIHBkCmltcG9ydCB0aW1lCmltcG9ydCBjb25jdXJyZW50LmZ1dHVyZXMKaW1wb3J0IHV1aWQKaW1wb3J0IGpzb24KCmltcG9ydCBzeXMKaW1wb3J0IG9zCgojIEFkZCBtb25pdG9yaW5nX2JvdCB0byBwYXRoIGZvciBTdHJhdGVneSBpbXBvcnRzCnN5cy5wYXRoLmFwcGVuZChvcy5wYXRoLmpvaW4ob3MuZ2V0Y3dkKCksICdtb25pdG9yaW5nX2JvdCcpKQpmcm9tIHN0cmF0ZWd5IGltcG9ydCBTdHJhdGVneQpmcm9tIHRpY2tlcl9zbmFwc2hvdCBpbXBvcnQgVGlja2VyU25hcHNob3RTZXJ2aWNlCmZyb20gZGF0YV9mZXRjaGVyIGltcG9ydCBjcmVhdGVfZXhjaGFuZ2UKZnJvbSByZWFkX21vZGVsIGltcG9ydCBSZWFkTW9kZWwsIFRyYWRlRmVlZAoKIyBQYWdlIENvbmZpZwpzdC5zZXRfcGFnZV9jb25maWcocGFnZV90aXRsZT0iQ3J5cHRvLVRyYWRlciIsIGxheW91dD0id2lkZSIsIHBhZ2VfaWNvbj0i8J+mgiIsIGluaXRpYWxfc2lkZWJhcl9zdGF0ZT0iZXhwYW5kZWQiKQoKIyBJbml0aWFsaXplIFN0cmF0ZWd5IEVuZ2luZSBmb3IgVUkgdXNlCnN0cmF0ZWd5X2VuZ2luZSA9IFN0cmF0ZWd5KCkKCiMgQ3VzdG9tIENTUyBmb3IgRGFyayBNb2RlICYgTW9kZXJuIExvb2sKc3QubWFya2Rvd24oIiIiCjxzdHlsZT4KICAgIC8qIEdsb2JhbCBCYWNrZ3JvdW5kICovCiAgICAuc3RBcHAgewogICAgICAgIGJhY2tncm91bmQtY29sb3I6ICMwRTExMTc7CiAgICAgICAgY29sb3I6ICNGQUZBRkE7CiAgICB9CiAgICAKICAgIC8qIFNpZGViYXIgQmFja2dyb3VuZCAqLwogICAgc2VjdGlvbltkYXRhLXRlc3RpZD0ic3RTaWRlYmFyIl0gewogICAgICAgIGJhY2tncm91bmQtY29sb3I6ICMxNjFCMjI7CiAgICAgICAgYm9yZGVyLXJpZ2h0OiAxcHggc29saWQgIzMwMzYzRDsKICAgIH0KICAgIAogICAgLyogRm9yY2UgU2lkZWJhciBUZXh0IENvbG9yICovCiAgICAuY3NzLTE3bG50a24gewogICAgICAgIGNvbG9yOiAjQzlEMUQ5ICFpbXBvcnRhbnQ7CiAgICB9CiAgICAKICAgIC8qIEJ1dHRvbnMgKi8KICAgIGRpdi5zdEJ1dHRvbiA+IGJ1dHRvbiB7CiAgICAgICAgd2lkdGg6IDEwMCU7CiAgICAgICAgYm9yZGVyLXJhZGl1czogOHB4OwogICAgICAgIGZvbnQtd2VpZ2h0OiA2MDA7CiAgICAgICAgYmFja2dyb3VuZC1jb2xvcjogIzIxMjYyRDsKICAgICAgICBjb2xvcjogI0M5RDFEOTsKICAgICAgICBib3JkZXI6IDFweCBzb2xpZCAjMzAzNjNEOwogICAgICAgIHRyYW5zaXRpb246IGFsbCAwLjJzIGVhc2U7CiAgICB9CiAgICBkaXYuc3RCdXR0b24gPiBidXR0b246aG92ZXIgewogICAgICAgIGJvcmRlci1jb2xvcjogIzhCNUNGNjsKICAgICAgICBjb2xvcjogI0ZGRkZGRjsKICAgICAgICBiYWNrZ3JvdW5kLWNvbG9yOiAjMzAzNjNEOwogICAgICAgIGJveC1zaGFkb3c6IDAgNHB4IDZweCByZ2JhKDAsIDAsIDAsIDAuMyk7CiAgICB9CiAgICBkaXYuc3RCdXR0b24gPiBidXR0b246YWN0aXZlLCBkaXYuc3RCdXR0b24gPiBidXR0b246Zm9jdXMgewogICAgICAgIGJhY2tncm91bmQtY29sb3I6ICM4QjVDRjYgIWltcG9ydGFudDsKICAgICAgICBjb2xvcjogd2hpdGUgIWltcG9ydGFudDsKICAgICAgICBib3JkZXItY29sb3I6ICM4QjVDRjYgIWltcG9ydGFudDsKICAgIH0KCiAgICAvKiBTdGFydCBUcmFkaW5nIEJ1dHRvbiAqLwogICAgLnN0YXJ0LXRyYWRpbmctYnRuID4gYnV0dG9uIHsKICAgICAgICBiYWNrZ3JvdW5kLWNvbG9yOiAjOEI1Q0Y2ICFpbXBvcnRhbnQ7CiAgICAgICAgY29sb3I6IHdoaXRlICFpbXBvcnRhbnQ7CiAgICAgICAgYm9yZGVyOiBub25lICFpbXBvcnRhbnQ7CiAgICAgICAgaGVpZ2h0OiA0ZW0gIWltcG9ydGFudDsKICAgICAgICBmb250LXNpemU6IDEuMmVtICFpbXBvcnRhbnQ7CiAgICB9CiAgICAKICAgIC8qIEhlYWRlcnMgKi8KICAgIGgxLCBoMiwgaDMsIGg0IHsKICAgICAgICBmb250LWZhbWlseTogJ0ludGVyJywgc2Fucy1zZXJpZjsKICAgICAgICBmb250LXdlaWdodDogNzAwOwogICAgICAgIGNvbG9yOiAjRjBGNkZDOwogICAgfQogICAgCiAgICAvKiBNZXRyaWNzIENhcmRzICovCiAgICBkaXZbZGF0YS10ZXN0aWQ9InN0TWV0cmljIl0gewogICAgICAgIGJhY2tncm91bmQtY29sb3I6ICMyMTI2MkQ7CiAgICAgICAgcGFkZGluZzogMTVweDsKICAgICAgICBib3JkZXItcmFkaXVzOiAxMHB4OwogICAgICAgIGJvcmRlcjogMXB4IHNvbGlkICMzMDM2M0Q7CiAgICAgICAgYm94LXNoYWRvdzogMCAycHggNHB4IHJnYmEoMCwwLDAsMC4yKTsKICAgIH0KCiAgICAvKiBUcmVuZCBCYWRnZSBTdHlsaW5nICovCiAgICAudHJlbmQtYmFkZ2UgewogICAgICAgIHBhZGRpbmc6IDJweCAxMHB4OwogICAgICAgIGJvcmRlci1yYWRpdXM6IDRweDsKICAgICAgICBmb250LXdlaWdodDogYm9sZDsKICAgICAgICBmb250LXNpemU6IDAuODVlbTsKICAgICAgICB0ZXh0LXRyYW5zZm9ybTogdXBwZXJjYXNlOwogICAgICAgIGRpc3BsYXk6IGlubGluZS1ibG9jazsKICAgICAgICBtYXJnaW46IDJweDsKICAgIH0KICAgIC50cmVuZC11cCB7IGJhY2tncm91bmQtY29sb3I6ICMwNTJlMTY7IGNvbG9yOiAjNGFkZTgwOyBib3JkZXI6IDFweCBzb2xpZCAjMTQ1MzJkOyB9CiAgICAudHJlbmQtZG93biB7IGJhY2tncm91bmQtY29sb3I6ICM0NTBhMGE7IGNvbG9yOiAjZjg3MTcxOyBib3JkZXI6IDFweCBzb2xpZCAjN2YxZDFkOyB9CiAgICAudHJlbmQtbmV1dHJhbCB7IGJhY2tncm91bmQtY29sb3I6ICMxZTFiNGI7IGNvbG9yOiAjODE4Y2Y4OyBib3JkZXI6IDFweCBzb2xpZCAjMzEyZTgxOyB9CiAgICAKICAgIC8qIFRhYmxlIFN0eWxpbmcgKi8KICAgIGRpdltkYXRhLXRlc3RpZD0ic3REYXRhRnJhbWUiXSB7CiAgICAgICAgYm9yZGVyOiAxcHggc29saWQgIzMwMzYzRDsKICAgICAgICBib3JkZXItcmFkaXVzOiA4cHg7CiAgICAgICAgYmFja2dyb3VuZC1jb2xvcjogIzBEMTExNzsKICAgIH0KICAgIAogICAgLyogU3RyYXRlZ3kgRGVmaW5pdGlvbiBCb3ggKi8KICAgIC5zdHJhdC1ib3ggewogICAgICAgIGJhY2tncm91bmQtY29sb3I6ICMxNjFCMjI7CiAgICAgICAgcGFkZGluZzogMTVweDsKICAgICAgICBib3JkZXItcmFkaXVzOiA4cHg7CiAgICAgICAgYm9yZGVyOiAxcHggc29saWQgIzMwMzYzRDsKICAgICAgICBtYXJnaW4tYm90dG9tOiAxMHB4OwogICAgfQoKICAgIC8qIEhpZGUgU3RyZWFtbGl0IEJyYW5kaW5nICovCiAgICAjTWFpbk1lbnUge3Zpc2liaWxpdHk6IGhpZGRlbjt9CiAgICBmb290ZXIge3Zpc2liaWxpdHk6IGhpZGRlbjt9Cjwvc3R5bGU+CiIiIiwgdW5zYWZlX2FsbG93X2h0bWw9VHJ1ZSkKCiMgRGF0YWJhc2UgQ29ubmVjdGlvbgpEQl9QQVRIID0gInRyYWRlcy5kYiIKCmRlZiBnZXRfY29ubmVjdGlvbigpOgogICAgdHJ5OgogICAgICAgIGNvbm4gPSBzcWxpdGUzLmNvbm5lY3QoREJfUEFUSCkKICAgICAgICByZXR1cm4gY29ubgogICAgZXhjZXB0IEV4Y2VwdGlvbiBhcyBlOgogICAgICAgIHN0LmVycm9yKGYiRmFpbGVkIHRvIGNvbm5lY3QgdG8gREI6IHtlfSIpCiAgICAgICAgcmV0dXJuIE5vbmUKCiMgUmVhZCBtb2RlbDogc2hhcmVkIHJlYWQtb25seSBjb25uZWN0aW9ucyArIFRUTC1jYWNoZWQgcXVlcmllcyAod3JpdGVzIHVzZSBnZXRfY29ubmVjdGlvbikKQ0FORExFU19EQl9QQVRIID0gImNhbmRsZXMuZGIiCgpAc3QuY2FjaGVfcmVzb3VyY2UKZGVmIGdldF9yZWFkX21vZGVsKCk6CiAgICByZXR1cm4gUmVhZE1vZGVsKERCX1BBVEgsIENBTkRMRVNfREJfUEFUSCkKCkBzdC5jYWNoZV9kYXRhKHR0bD01KQpkZWYgZ2V0X2luc3RhbmNlcygpOgogICAgcmV0dXJuIGdldF9yZWFkX21vZGVsKCkuZ2V0X2luc3RhbmNlcygpCgpAc3QuY2FjaGVfZGF0YSh0dGw9MTApCmRlZiBnZXRfaW5zdGFuY2Vfc3VtbWFyaWVzKCk6CiAgICByZXR1cm4gZ2V0X3JlYWRfbW9kZWwoKS5nZXRfaW5zdGFuY2Vfc3VtbWFyaWVzKCkKCkBzdC5jYWNoZV9kYXRhKHR0bD0zMCkKZGVmIGdldF90cmVuZF9iYWRnZXMoaW5zdGFuY2VfaWQsIHBhaXJzLCB0ZnMsIHN0cmF0X2xvZ2ljX2pzb24pOgogICAgIiIiVHJlbmQgYmFkZ2UgSFRNTCBwZXIgKHBhaXIsIHRpbWVmcmFtZSkgb2Ygb25lIGluc3RhbmNlLiIiIgogICAgc3RyYXRfbG9naWMgPSBqc29uLmxvYWRzKHN0cmF0X2xvZ2ljX2pzb24pCiAgICByZWFkX21vZGVsID0gZ2V0X3JlYWRfbW9kZWwoKQogICAgYmFkZ2VzID0ge30KICAgIGZvciBwIGluIHBhaXJzOgogICAgICAgIGZvciBpLCB0ZiBpbiBlbnVtZXJhdGUodGZzKToKICAgICAgICAgICAgdGZfa2V5ID0gJ3NtYWxsJyBpZiBpID09IDAgZWxzZSAnbWVkJyBpZiBpID09IDEgZWxzZSAnbGFyZ2UnCiAgICAgICAgICAgIHRmX2luZGljYXRvcnMgPSBzdHJhdF9sb2dpYy5nZXQodGZfa2V5LCBbXSkKICAgICAgICAgICAgY19kZiA9IHJlYWRfbW9kZWwuZ2V0X2NhbmRsZXMoaW5zdGFuY2VfaWQsIHAsIHRmKQoKICAgICAgICAgICAgYmFkZ2UgPSAnPHNwYW4gY2xhc3M9InRyZW5kLWJhZGdlIHRyZW5kLW5ldXRyYWwiPlNZTkNJTkc8L3NwYW4+JwogICAgICAgICAgICBpZiBub3QgY19kZi5lbXB0eToKICAgICAgICAgICAgICAgIGlmIHRmX2luZGljYXRvcnM6CiAgICAgICAgICAgICAgICAgICAgdHJ5OgogICAgICAgICAgICAgICAgICAgICAgICBkZl9pbmQgPSBzdHJhdGVneV9lbmdpbmUuY2FsY3VsYXRlX2luZGljYXRvcnMoY19kZiwgdGZfaW5kaWNhdG9ycykKICAgICAgICAgICAgICAgICAgICAgICAgcmVzID0gc3RyYXRlZ3lfZW5naW5lLmV2YWx1YXRlX2FsaWdubWVudChkZl9pbmQsIHRmX2luZGljYXRvcnMpCiAgICAgICAgICAgICAgICAgICAgICAgIGlmIHJlcyA9PSAnQlVZJzogYmFkZ2UgPSBmJzxzcGFuIGNsYXNzPSJ0cmVuZC1iYWRnZSB0cmVuZC11cCI+4payIHt0Zn0gQlVZPC9zcGFuPicKICAgICAgICAgICAgICAgICAgICAgICAgZWxpZiByZXMgPT0gJ1NFTEwnOiBiYWRnZSA9IGYnPHNwYW4gY2xhc3M9InRyZW5kLWJhZGdlIHRyZW5kLWRvd24iPuKWvCB7dGZ9IFNFTEw8L3NwYW4+JwogICAgICAgICAgICAgICAgICAgICAgICBlbHNlOiBiYWRnZSA9IGYnPHNwYW4gY2xhc3M9InRyZW5kLWJhZGdlIHRyZW5kLW5ldXRyYWwiPuKXjyB7dGZ9IE5FVVQ8L3NwYW4+JwogICAgICAgICAgICAgICAgICAgIGV4Y2VwdDogcGFzcwogICAgICAgICAgICAgICAgZWxzZToKICAgICAgICAgICAgICAgICAgICAjIEZhbGxiYWNrIGZvciBvbGQgaW5zdGFuY2VzIG9yIHRpbWVmcmFtZXMgd2l0aCBubyBpbmRpY2F0b3JzCiAgICAgICAgICAgICAgICAgICAgdHJ5OgogICAgICAgICAgICAgICAgICAgICAgICBkZl9pbmQgPSBzdHJhdGVneV9lbmdpbmUuY2FsY3VsYXRlX2luZGljYXRvcnMoY19kZikKICAgICAgICAgICAgICAgICAgICAgICAgdHJlbmQgPSBzdHJhdGVneV9lbmdpbmUuZ2V0X3Jvd190cmVuZChkZl9pbmQuaWxvY1stMV0pCiAgICAgICAgICAgICAgICAgICAgICAgIGlmIHRyZW5kID09ICdVUCc6IGJhZGdlID0gZic8c3BhbiBjbGFzcz0idHJlbmQtYmFkZ2UgdHJlbmQtdXAiPuKWsiB7dGZ9IFVQPC9zcGFuPicKICAgICAgICAgICAgICAgICAgICAgICAgZWxpZiB0cmVuZCA9PSAnRE9XTic6IGJhZGdlID0gZic8c3BhbiBjbGFzcz0idHJlbmQtYmFkZ2UgdHJlbmQtZG93biI+4pa8IHt0Zn0gRE9XTjwvc3Bhbj4nCiAgICAgICAgICAgICAgICAgICAgICAgIGVsc2U6IGJhZGdlID0gZic8c3BhbiBjbGFzcz0idHJlbmQtYmFkZ2UgdHJlbmQtbmV1dHJhbCI+4pePIHt0Zn0gTkVVVDwvc3Bhbj4nCiAgICAgICAgICAgICAgICAgICAgZXhjZXB0OiBwYXNzCiAgICAgICAgICAgIGJhZGdlc1socCwgdGYpXSA9IGJhZGdlCiAgICByZXR1cm4gYmFkZ2VzCgpkZWYgc2V0X2luc3RhbmNlX3N0YXR1cyhpbnN0YW5jZV9pZCwgc3RhdHVzKToKICAgIGNvbm4gPSBnZXRfY29ubmVjdGlvbigpCiAgICBpZiBub3QgY29ubjogcmV0dXJuCiAgICBjb25uLmV4ZWN1dGUoIlVQREFURSBpbnN0YW5jZXMgU0VUIHN0YXR1cz0/IFdIRVJFIGlkPT8iLCAoc3RhdHVzLCBpbnN0YW5jZV9pZCkpCiAgICBjb25uLmNvbW1pdCgpCiAgICBjb25uLmNsb3NlKCkKICAgIGdldF9pbnN0YW5jZXMuY2xlYXIoKQoKIyBSZWdpc3RlciBJbnN0YW5jZSBpbiBEQgpkZWYgcmVnaXN0ZXJfaW5zdGFuY2UoY29uZmlnLCBwYWlyc19saXN0KToKICAgIHRyeToKICAgICAgICBjb25uID0gZ2V0X2Nvbm5lY3Rpb24oKQogICAgICAgIGlmIG5vdCBjb25uOiByZXR1cm4gRmFsc2UKICAgICAgICAKICAgICAgICAjIEVuc3VyZSB0YWJsZSBleGlzdHMKICAgICAgICBjb25uLmV4ZWN1dGUoJycnQ1JFQVRFIFRBQkxFIElGIE5PVCBFWElTVFMgaW5zdGFuY2VzICgKICAgICAgICAgICAgaWQgVEVYVCBQUklNQVJZIEtFWSwgbmFtZSBURVhULCBleGNoYW5nZSBURVhULCBiYXNlX2N1cnJlbmN5IFRFWFQsIAogICAgICAgICAgICBtYXJrZXRfdHlwZSBURVhULCBzdHJhdGVneV9jb25maWcgVEVYVCwgcGFpcnMgVEVYVCwgCiAgICAgICAgICAgIHN0YXR1cyBURVhUIERFRkFVTFQgJ1NUT1BQRUQnLCBjcmVhdGVkX2F0IERBVEVUSU1FIERFRkFVTFQgQ1VSUkVOVF9USU1FU1RBTVAsCiAgICAgICAgICAgIHN0cmF0ZWd5X2pzb24gVEVYVAogICAgICAgICknJycpCiAgICAgICAgCiAgICAgICAgaW5zdGFuY2VfaWQgPSBzdHIodXVpZC51dWlkNCgpKVs6OF0KICAgICAgICBuYW1lID0gZiJ7Y29uZmlnWydleGNoYW5nZSddfV97Y29uZmlnWydtYXJrZXRfdHlwZSddfV97aW5zdGFuY2VfaWR9IgogICAgICAgIAogICAgICAgIGNvbm4uZXhlY3V0ZSgKICAgICAgICAgICAgIklOU0VSVCBJTlRPIGluc3RhbmNlcyAoaWQsIG5hbWUsIGV4Y2hhbmdlLCBiYXNlX2N1cnJlbmN5LCBtYXJrZXRfdHlwZSwgc3RyYXRlZ3lfY29uZmlnLCBwYWlycywgc3RhdHVzLCBzdHJhdGVneV9qc29uKSBWQUxVRVMgKD8sID8sID8sID8sID8sID8sID8sID8sID8pIiwKICAgICAgICAgICAgKAogICAgICAgICAgICAgICAgaW5zdGFuY2VfaWQsCiAgICAgICAgICAgICAgICBuYW1lLAogICAgICAgICAgICAgICAgY29uZmlnWydleGNoYW5nZSddLAogICAgICAgICAgICAgICAgY29uZmlnWydiYXNlX2N1cnJlbmN5J10sCiAgICAgICAgICAgICAgICBjb25maWdbJ21hcmtldF90eXBlJ10sCiAgICAgICAgICAgICAgICBqc29uLmR1bXBzKGNvbmZpZ1snc3RyYXRlZ3lfcGFyYW1zJ10pLAogICAgICAgICAgICAgICAganNvbi5kdW1wcyhwYWlyc19saXN0KSwKICAgICAgICAgICAgICAgICdBQ1RJVkUnLAogICAgICAgICAgICAgICAganNvbi5kdW1wcyhjb25maWdbJ3N0cmF0ZWd5X2xvZ2ljJ10pCiAgICAgICAgICAgICkKICAgICAgICApCiAgICAgICAgY29ubi5jb21taXQoKQogICAgICAgIGNvbm4uY2xvc2UoKQogICAgICAgIGdldF9pbnN0YW5jZXMuY2xlYXIoKQogICAgICAgIHJldHVybiBuYW1lCiAgICBleGNlcHQgRXhjZXB0aW9uIGFzIGU6CiAgICAgICAgc3QuZXJyb3IoZiJGYWlsZWQgdG8gcmVnaXN0ZXIgaW5zdGFuY2U6IHtlfSIpCiAgICAgICAgcmV0dXJuIEZhbHNlCgojIFNoYXJlZCBidWxrIHRpY2tlciBzbmFwc2hvdHM6IG9uZSBmZXRjaF90aWNrZXJzIHBlciBleGNoYW5nZS9tYXJrZXQgcGVyIGludGVydmFsCkBzdC5jYWNoZV9yZXNvdXJjZQpkZWYgZ2V0X3RpY2tlcl9zZXJ2aWNlKCk6CiAgICByZXR1cm4gVGlja2VyU25hcHNob3RTZXJ2aWNlKGludGVydmFsPTYwKQoKZGVmIGdldF90aWNrZXJfc25hcHNob3QoZXhjaGFuZ2VfaWQsIG1hcmtldF90eXBlKToKICAgIHNlcnZpY2UgPSBnZXRfdGlja2VyX3NlcnZpY2UoKQogICAga2V5ID0gZiJ7ZXhjaGFuZ2VfaWR9X3ttYXJrZXRfdHlwZX0iCiAgICBpZiBrZXkgbm90IGluIHNlcnZpY2UuZXhjaGFuZ2VzOgogICAgICAgIHNlcnZpY2UucmVnaXN0ZXIoa2V5LCBjcmVhdGVfZXhjaGFuZ2UoZXhjaGFuZ2VfaWQsIG1hcmtldF90eXBlLCB7J3RpbWVvdXQnOiAxNTAwMCwgJ2VuYWJsZVJhdGVMaW1pdCc6IFRydWV9KSkKICAgIHJldHVybiBzZXJ2aWNlLCBrZXkKCiMgT1BUSU1JWkVEOiBGZXRjaCBUb3AgR2FpbmVycy9Mb3NlcnMKQHN0LmNhY2hlX2RhdGEodHRsPTEyMCkKZGVmIGdldF9tYXJrZXRfbW92ZXJzKGV4Y2hhbmdlX2lkKToKICAgIHRyeToKICAgICAgICBzZXJ2aWNlLCBrZXkgPSBnZXRfdGlja2VyX3NuYXBzaG90KGV4Y2hhbmdlX2lkLCAnU3BvdCcpCiAgICAgICAgZGYgPSBzZXJ2aWNlLmdldF9mcmFtZShrZXkpCiAgICAgICAgaWYgZGYuZW1wdHk6IHJldHVybiBwZC5EYXRhRnJhbWUoKSwgcGQuRGF0YUZyYW1lKCkKICAgICAgICBkZiA9IGRmW2RmWydzeW1ib2wnXS5zdHIuY29udGFpbnMoJy9VU0RUJywgcmVnZXg9RmFsc2UpICYgZGZbJ2NoYW5nZV9wY3QnXS5ub3RuYSgpXQogICAgICAgIGRmID0gZGYucmVuYW1lKGNvbHVtbnM9eydzeW1ib2wnOiAnU3ltYm9sJywgJ2xhc3QnOiAnUHJpY2UnLCAnY2hhbmdlX3BjdCc6ICdDaGFuZ2UgJSd9KVtbJ1N5bWJvbCcsICdQcmljZScsICdDaGFuZ2UgJSddXQogICAgICAgIGlmIGRmLmVtcHR5OiByZXR1cm4gcGQuRGF0YUZyYW1lKCksIHBkLkRhdGFGcmFtZSgpCiAgICAgICAgZGYgPSBkZi5zb3J0X3ZhbHVlcyhieT0nQ2hhbmdlICUnLCBhc2NlbmRpbmc9RmFsc2UpCiAgICAgICAgcmV0dXJuIGRmLmhlYWQoMTApLCBkZi50YWlsKDEwKS5zb3J0X3ZhbHVlcyhieT0nQ2hhbmdlICUnLCBhc2NlbmRpbmc9VHJ1ZSkKICAgIGV4Y2VwdCBFeGNlcHRpb246IHJldHVybiBwZC5EYXRhRnJhbWUoKSwgcGQuRGF0YUZyYW1lKCkKCiMgT1BUSU1JWkVEOiBGZXRjaCBUb3AgUGFpcnMKQHN0LmNhY2hlX2RhdGEodHRsPTMwMCkKZGVmIGdldF90b3BfcGFpcnMoZXhjaGFuZ2VfaWQsIG1hcmtldF90eXBlLCBiYXNlX2N1cnJlbmN5KToKICAgIHRyeToKICAgICAgICBzZXJ2aWNlLCBrZXkgPSBnZXRfdGlja2VyX3NuYXBzaG90KGV4Y2hhbmdlX2lkLCBtYXJrZXRfdHlwZSkKICAgICAgICBtYXJrZXRzID0gc2VydmljZS5leGNoYW5nZXNba2V5XS5sb2FkX21hcmtldHMoKQogICAgICAgIFNUQUJMRUNPSU5TID0geydVU0RUJywgJ1VTREMnLCAnQlVTRCcsICdEQUknLCAnVFVTRCcsICdGRFVTRCcsICdVU0RFJywgJ1VTRFAnLCAnUFlVU0QnLCAnRVVSJywgJ1VTRCd9CiAgICAgICAgdGFyZ2V0X3N5bWJvbHMgPSBbXQogICAgICAgIGZvciBzeW1ib2wsIG1hcmtldCBpbiBtYXJrZXRzLml0ZW1zKCk6CiAgICAgICAgICAgICBpZiBtYXJrZXRbJ3F1b3RlJ10gIT0gYmFzZV9jdXJyZW5jeTogY29udGludWUKICAgICAgICAgICAgIGlmIG1hcmtldFsnYmFzZSddIGluIFNUQUJMRUNPSU5TOiBjb250aW51ZQogICAgICAgICAgICAgaWYgbWFya2V0X3R5cGUgPT0gJ1Nwb3QnIGFuZCBub3QgbWFya2V0LmdldCgnc3BvdCcsIEZhbHNlKTogY29udGludWUKICAgICAgICAgICAgIGlmIG1hcmtldF90eXBlID09ICdGdXR1cmVzJyBhbmQgbm90IChtYXJrZXQuZ2V0KCdmdXR1cmUnLCBGYWxzZSkgb3IgbWFya2V0LmdldCgnc3dhcCcsIEZhbHNlKSk6IGNvbnRpbnVlCiAgICAgICAgICAgICBpZiBub3QgbWFya2V0LmdldCgnYWN0aXZlJywgVHJ1ZSk6IGNvbnRpbnVlCiAgICAgICAgICAgICB0YXJnZXRfc3ltYm9scy5hcHBlbmQoc3ltYm9sKQoKICAgICAgICAjIFZvbHVtZS1yYW5rZWQgdW5pdmVyc2Ugc3RyYWlnaHQgZnJvbSB0aGUgaW4tbWVtb3J5IHNuYXBzaG90CiAgICAgICAgdG9wID0gc2VydmljZS50b3BfYnlfdm9sdW1lKGtleSwgbj0xMDAsIHN5bWJvbHM9dGFyZ2V0X3N5bWJvbHMpCiAgICAgICAgaWYgdG9wLmVtcHR5OiByZXR1cm4gcGQuRGF0YUZyYW1lKCkKICAgICAgICBkZiA9IHBkLkRhdGFGcmFtZSh7CiAgICAgICAgICAgICdTZWxlY3QnOiBGYWxzZSwKICAgICAgICAgICAgJ1N5bWJvbCc6IHRvcFsnc3ltYm9sJ10sCiAgICAgICAgICAgICdQcmljZSc6IHRvcFsnbGFzdCddLAogICAgICAgICAgICAnVm9sdW1lJzogdG9wWydxdW90ZV92b2x1bWUnXSwKICAgICAgICAgICAgJ0NoYW5nZSAyNGggJSc6IHRvcFsnY2hhbmdlX3BjdCddCiAgICAgICAgfSkKICAgICAgICByZXR1cm4gZGYKICAgIGV4Y2VwdCBFeGNlcHRpb246IHJldHVybiBwZC5EYXRhRnJhbWUoKQoKIyBJbml0aWFsaXplIFNlc3Npb24gU3RhdGUgTmF2aWdhdGlvbgppZiAncGFnZScgbm90IGluIHN0LnNlc3Npb25fc3RhdGU6IHN0LnNlc3Npb25fc3RhdGUucGFnZSA9ICJIb21lIgoKZGVmIG5hdmlnYXRlX3RvKHBhZ2VfbmFtZSk6CiAgICBzdC5zZXNzaW9uX3N0YXRlLnBhZ2UgPSBwYWdlX25hbWUKICAgIHN0LnJlcnVuKCkKCiMgU2lkZWJhciBOYXZpZ2F0aW9uCndpdGggc3Quc2lkZWJhcjoKICAgIHN0LnRpdGxlKCLwn6aCIENyeXB0by1UcmFkZXIiKQogICAgc3QubWFya2Rvd24oIi0tLSIpCiAgICBzZWxlY3RlZF9wYWdlID0gc3QucmFkaW8oIk5hdmlnYXRpb24iLCBbIkhvbWUiLCAiU3RyYXRlZ3kgQnVpbGRlciIsICJMaXZlIE1vbml0b3IiLCAiUG9zdC1UcmFkZSBSZXZpZXciLCAiU2V0dGluZ3MiXSwgaW5kZXg9WyJIb21lIiwgIlN0cmF0ZWd5IEJ1aWxkZXIiLCAiTGl2ZSBNb25pdG9yIiwgIlBvc3QtVHJhZGUgUmV2aWV3IiwgIlNldHRpbmdzIl0uaW5kZXgoc3Quc2Vzc2lvbl9zdGF0ZS5wYWdlKSkKICAgIGlmIHNlbGVjdGVkX3BhZ2UgIT0gc3Quc2Vzc2lvbl9zdGF0ZS5wYWdlOgogICAgICAgIHN0LnNlc3Npb25fc3RhdGUucGFnZSA9IHNlbGVjdGVkX3BhZ2UKICAgICAgICBzdC5yZXJ1bigpCgojIC0tLSBQQUdFIFJPVVRJTkcgLS0tCgppZiBzdC5zZXNzaW9uX3N0YXRlLnBhZ2UgPT0gIkhvbWUiOgogICAgc3QudGl0bGUoIkNyeXB0by1UcmFkZXIgRGFzaGJvYXJkIikKICAgIHN0Lm1hcmtkb3duKCIqKkF1dG9ub21vdXMuIE1vZHVsYXIuIEludGVsbGlnZW50LioqIFNlbGVjdCBhbiBleGNoYW5nZSBiZWxvdyB0byB2aWV3IGxpdmUgbWFya2V0IG1vdmVycy4iKQogICAgc3QubWFya2Rvd24oIi0tLSIpCiAgICBpZiAnc2VsZWN0ZWRfZXhjaGFuZ2UnIG5vdCBpbiBzdC5zZXNzaW9uX3N0YXRlOiBzdC5zZXNzaW9uX3N0YXRlLnNlbGVjdGVkX2V4Y2hhbmdlID0gImJpbmFuY2UiCiAgICBjb2wxLCBjb2wyLCBjb2wzID0gc3QuY29sdW1ucygzKQogICAgYl9sYWJlbCA9ICLwn5S2IEJpbmFuY2UgIiArICgi4pyFIiBpZiBzdC5zZXNzaW9uX3N0YXRlLnNlbGVjdGVkX2V4Y2hhbmdlID09ICJiaW5hbmNlIiBlbHNlICIiKQogICAga19sYWJlbCA9ICLwn5+pIEt1Q29pbiAiICsgKCLinIUiIGlmIHN0LnNlc3Npb25fc3RhdGUuc2VsZWN0ZWRfZXhjaGFuZ2UgPT0gImt1Y29pbiIgZWxzZSAiIikKICAgIGdfbGFiZWwgPSAi8J+aqiBHYXRlLmlvICIgKyAoIuKchSIgaWYgc3Quc2Vzc2lvbl9zdGF0ZS5zZWxlY3RlZF9leGNoYW5nZSA9PSAiZ2F0ZWlvIiBlbHNlICIiKQoKICAgIHdpdGggY29sMToKICAgICAgICBpZiBzdC5idXR0b24oYl9sYWJlbCwga2V5PSJidG5fYmluYW5jZSIpOgogICAgICAgICAgICBzdC5zZXNzaW9uX3N0YXRlLnNlbGVjdGVkX2V4Y2hhbmdlID0gImJpbmFuY2UiCiAgICAgICAgICAgIHN0LnJlcnVuKCkKICAgIHdpdGggY29sMjoKICAgICAgICBpZiBzdC5idXR0b24oa19sYWJlbCwga2V5PSJidG5fa3Vjb2luIik6CiAgICAgICAgICAgIHN0LnNlc3Npb25fc3RhdGUuc2VsZWN0ZWRfZXhjaGFuZ2UgPSAia3Vjb2luIgogICAgICAgICAgICBzdC5yZXJ1bigpCiAgICB3aXRoIGNvbDM6CiAgICAgICAgaWYgc3QuYnV0dG9uKGdfbGFiZWwsIGtleT0iYnRuX2dhdGVpbyIpOgogICAgICAgICAgICBzdC5zZXNzaW9uX3N0YXRlLnNlbGVjdGVkX2V4Y2hhbmdlID0gImdhdGVpbyIKICAgICAgICAgICAgc3QucmVydW4oKQogICAgICAgICAgICAKICAgIHNlbGVjdGVkX2V4Y2hhbmdlID0gc3Quc2Vzc2lvbl9zdGF0ZS5zZWxlY3RlZF9leGNoYW5nZQogICAgc3QubWFya2Rvd24oZiIjIyMgTWFya2V0IE1vdmVyczoge3NlbGVjdGVkX2V4Y2hhbmdlLmNhcGl0YWxpemUoKX0iKQogICAgCiAgICB3aXRoIHN0LnNwaW5uZXIoZiJGZXRjaGluZyBsaXZlIGRhdGEgZnJvbSB7c2VsZWN0ZWRfZXhjaGFuZ2V9Li4uIik6CiAgICAgICAgZ2FpbmVycywgbG9zZXJzID0gZ2V0X21hcmtldF9tb3ZlcnMoc2VsZWN0ZWRfZXhjaGFuZ2UpCiAgICAgICAgCiAgICBpZiBub3QgZ2FpbmVycy5lbXB0eToKICAgICAgICBjb2xfZ2FpbiwgY29sX2xvc3MgPSBzdC5jb2x1bW5zKDIpCiAgICAgICAgd2l0aCBjb2xfZ2FpbjoKICAgICAgICAgICAgc3QubWFya2Rvd24oIiMjIyMg8J+agCBUb3AgMTAgR2FpbmVycyAoMjRoKSIpCiAgICAgICAgICAgIHN0LmRhdGFmcmFtZShnYWluZXJzLnN0eWxlLmZvcm1hdCh7J1ByaWNlJzogJyR7Oi40Zn0nLCAnQ2hhbmdlICUnOiAnezorLjJmfSUnfSkuYmFja2dyb3VuZF9ncmFkaWVudChzdWJzZXQ9WydDaGFuZ2UgJSddLCBjbWFwPSdHcmVlbnMnKSwgdXNlX2NvbnRhaW5lcl93aWR0aD1UcnVlLCBoaWRlX2luZGV4PVRydWUpCiAgICAgICAgd2l0aCBjb2xfbG9zczoKICAgICAgICAgICAgc3QubWFya2Rvd24oIiMjIyMg8J+UuyBUb3AgMTAgTG9zZXJzICgyNGgpIikKICAgICAgICAgICAgc3QuZGF0YWZyYW1lKGxvc2Vycy5zdHlsZS5mb3JtYXQoeydQcmljZSc6ICckezouNGZ9JywgJ0NoYW5nZSAlJzogJ3s6Ky4yZn0lJ30pLmJhY2tncm91bmRfZ3JhZGllbnQoc3Vic2V0PVsnQ2hhbmdlICUnXSwgY21hcD0nUmVkc19yJyksIHVzZV9jb250YWluZXJfd2lkdGg9VHJ1ZSwgaGlkZV9pbmRleD1UcnVlKQogICAgZWxzZToKICAgICAgICBzdC5lcnJvcihmIuKaoO+4jyBDb3VsZCBub3QgZmV0Y2ggbWFya2V0IGRhdGEgZm9yIHtzZWxlY3RlZF9leGNoYW5nZX0uIikKCiAgICBzdC5tYXJrZG93bigiLS0tIikKICAgIHN0Lm1hcmtkb3duKCI8YnI+IiwgdW5zYWZlX2FsbG93X2h0bWw9VHJ1ZSkKICAgIGMxLCBjMiwgYzMgPSBzdC5jb2x1bW5zKFsxLCAyLCAxXSkKICAgIHdpdGggYzI6CiAgICAgICAgc3QubWFya2Rvd24oJzxkaXYgY2xhc3M9InN0YXJ0LXRyYWRpbmctYnRuIj4nLCB1bnNhZmVfYWxsb3dfaHRtbD1UcnVlKQogICAgICAgIGlmIHN0LmJ1dHRvbigi8J+agCBTdGFydCBUcmFkaW5nIiwgdXNlX2NvbnRhaW5lcl93aWR0aD1UcnVlKTogbmF2aWdhdGVfdG8oIlN0cmF0ZWd5IEJ1aWxkZXIiKQogICAgICAgIHN0Lm1hcmtkb3duKCc8L2Rpdj4nLCB1bnNhZmVfYWxsb3dfaHRtbD1UcnVlKQoKZWxpZiBzdC5zZXNzaW9uX3N0YXRlLnBhZ2UgPT0gIlN0cmF0ZWd5IEJ1aWxkZXIiOgogICAgc3QudGl0bGUoIvCfp6kgU3RyYXRlZ3kgQnVpbGRlciIpCiAgICBzdC5tYXJrZG93bigiQ29uZmlndXJlIHlvdXIgYXV0b25vbW91cyBhZ2VudCBwYXJhbWV0ZXJzLiIpCiAgICAKICAgIGlmICd3YXRjaGxpc3QnIG5vdCBpbiBzdC5zZXNzaW9uX3N0YXRlOgogICAgICAgIHN0LnNlc3Npb25fc3RhdGUud2F0Y2hsaXN0ID0gcGQuRGF0YUZyYW1lKGNvbHVtbnM9WydTeW1ib2wnLCAnUHJpY2UnLCAnVm9sdW1lJywgJ0NoYW5nZSAyNGggJSddKQoKICAgICMgTGF5b3V0OiBMZWZ0IChNYXJrZXQgRGF0YSkgLSBSaWdodCAoU3RyYXRlZ3kgUGFuZWwpCiAgICBjb2xfbGVmdCwgY29sX3JpZ2h0ID0gc3QuY29sdW1ucyhbMiwgMV0pCgogICAgIyAtLS0gTEVGVCBQQU5FTDogTWFya2V0IERhdGEgLS0tCiAgICB3aXRoIGNvbF9sZWZ0OgogICAgICAgICMgMS4gQ29uZmlndXJhdGlvbiBDb250cm9scwogICAgICAgIHdpdGggc3QuY29udGFpbmVyKCk6CiAgICAgICAgICAgIGMxLCBjMiwgYzMgPSBzdC5jb2x1bW5zKDMpCiAgICAgICAgICAgIHdpdGggYzE6IHN0cmF0X2V4Y2hhbmdlID0gc3Quc2VsZWN0Ym94KCJFeGNoYW5nZSIsIFsiYmluYW5jZSIsICJrdWNvaW4iLCAiZ2F0ZWlvIl0sIGluZGV4PTApCiAgICAgICAgICAgIHdpdGggYzI6IGJhc2VfY3VycmVuY3kgPSBzdC5zZWxlY3Rib3goIkJhc2UgQ3VycmVuY3kiLCBbIlVTRFQiLCAiVVNEQyIsICJCVEMiLCAiRVRIIl0sIGluZGV4PTApCiAgICAgICAgICAgIHdpdGggYzM6IG1hcmtldF90eXBlID0gc3QucmFkaW8oIk1hcmtldCBUeXBlIiwgWyJTcG90IiwgIkZ1dHVyZXMiXSwgaG9yaXpvbnRhbD1UcnVlKQoKICAgICAgICBzdC5tYXJrZG93bigiLS0tIikKICAgICAgICAKICAgICAgICAjIDIuIEZldGNoIFBhaXJzIERhdGEKICAgICAgICBzdC5zdWJoZWFkZXIoZiJUb3AgMTAwIHttYXJrZXRfdHlwZX0gUGFpcnMgKHtiYXNlX2N1cnJlbmN5fSkiKQogICAgICAgIHdpdGggc3Quc3Bpbm5lcigiU2Nhbm5pbmcgbWFya2V0IGRhdGEuLi4iKToKICAgICAgICAgICAgcGFpcnNfZGYgPSBnZXRfdG9wX3BhaXJzKHN0cmF0X2V4Y2hhbmdlLCBtYXJrZXRfdHlwZSwgYmFzZV9jdXJyZW5jeSkKICAgICAgICAgICAgCiAgICAgICAgaWYgbm90IHBhaXJzX2RmLmVtcHR5OgogICAgICAgICAgICBzZWFyY2hfcXVlcnkgPSBzdC50ZXh0X2lucHV0KCLwn5SNIFNlYXJjaCBUb2tlbiIsIHBsYWNlaG9sZGVyPSJlLmcuLCBCVEMsIEVUSCwgU09MIikKICAgICAgICAgICAgZmlsdGVyZWRfZGYgPSBwYWlyc19kZltwYWlyc19kZlsnU3ltYm9sJ10uc3RyLmNvbnRhaW5zKHNlYXJjaF9xdWVyeS51cHBlcigpKV0gaWYgc2VhcmNoX3F1ZXJ5IGVsc2UgcGFpcnNfZGYKCiAgICAgICAgICAgIGlmICdzaG93X2FsbF9wYWlycycgbm90IGluIHN0LnNlc3Npb25fc3RhdGU6IHN0LnNlc3Npb25fc3RhdGUuc2hvd19hbGxfcGFpcnMgPSBGYWxzZQogICAgICAgICAgICBkaXNwbGF5X2xpbWl0ID0gMjAgaWYgbm90IHN0LnNlc3Npb25fc3RhdGUuc2hvd19hbGxfcGFpcnMgZWxzZSAxMDAKICAgICAgICAgICAgCiAgICAgICAgICAgICMgUHJlcGFyZSBEYXRhIGZvciBFZGl0b3IKICAgICAgICAgICAgZWRpdG9yX2RmID0gZmlsdGVyZWRfZGYuaGVhZChkaXNwbGF5X2xpbWl0KS5jb3B5KCkKICAgICAgICAgICAgY29scyA9IFsnU2VsZWN0J10gKyBbYyBmb3IgYyBpbiBlZGl0b3JfZGYuY29sdW1ucyBpZiBjICE9ICdTZWxlY3QnXQogICAgICAgICAgICBlZGl0b3JfZGYgPSBlZGl0b3JfZGZbY29sc10KCiAgICAgICAgICAgIGVkaXRlZF9kZiA9IHN0LmRhdGFfZWRpdG9yKAogICAgICAgICAgICAgICAgZWRpdG9yX2RmLAogICAgICAgICAgICAgICAgaGlkZV9pbmRleD1UcnVlLAogICAgICAgICAgICAgICAgY29sdW1uX2NvbmZpZz17CiAgICAgICAgICAgICAgICAgICAgIlNlbGVjdCI6IHN0LmNvbHVtbl9jb25maWcuQ2hlY2tib3hDb2x1bW4oIkFkZCIsIGRlZmF1bHQ9RmFsc2UpLAogICAgICAgICAgICAgICAgICAgICJQcmljZSI6IHN0LmNvbHVtbl9jb25maWcuTnVtYmVyQ29sdW1uKGZvcm1hdD0iJCUuNGYiKSwKICAgICAgICAgICAgICAgICAgICAiVm9sdW1lIjogc3QuY29sdW1uX2NvbmZpZy5OdW1iZXJDb2x1bW4oZm9ybWF0PSIkJS4wZiIpLAogICAgICAgICAgICAgICAgICAgICJDaGFuZ2UgMjRoICUiOiBzdC5jb2x1bW5fY29uZmlnLk51bWJlckNvbHVtbihmb3JtYXQ9IiUuMmYlJSIpLAogICAgICAgICAgICAgICAgfSwKICAgICAgICAgICAgICAgIGRpc2FibGVkPVsiU3ltYm9sIiwgIlByaWNlIiwgIlZvbHVtZSIsICJDaGFuZ2UgMjRoICUiXSwKICAgICAgICAgICAgICAgIHVzZV9jb250YWluZXJfd2lkdGg9VHJ1ZQogICAgICAgICAgICApCiAgICAgICAgICAgIAogICAgICAgICAgICBzZWxlY3RlZF9yb3dzID0gZWRpdGVkX2RmW2VkaXRlZF9kZi5TZWxlY3RdCiAgICAgICAgICAgIGlmIG5vdCBzZWxlY3RlZF9yb3dzLmVtcHR5OgogICAgICAgICAgICAgICAgbmV3X3BpY2tzID0gc2VsZWN0ZWRfcm93cy5kcm9wKGNvbHVtbnM9WydTZWxlY3QnXSkKICAgICAgICAgICAgICAgIGNvbWJpbmVkID0gcGQuY29uY2F0KFtzdC5zZXNzaW9uX3N0YXRlLndhdGNobGlzdCwgbmV3X3BpY2tzXSkKICAgICAgICAgICAgICAgIHN0LnNlc3Npb25fc3RhdGUud2F0Y2hsaXN0ID0gY29tYmluZWQuZHJvcF9kdXBsaWNhdGVzKHN1YnNldD1bJ1N5bWJvbCddKQoKICAgICAgICAgICAgaWYgbGVuKGZpbHRlcmVkX2RmKSA+IDIwIGFuZCBub3Qgc3Quc2Vzc2lvbl9zdGF0ZS5zaG93X2FsbF9wYWlyczoKICAgICAgICAgICAgICAgIGlmIHN0LmJ1dHRvbihmIlNob3cgQWxsIHtsZW4oZmlsdGVyZWRfZGYpfSBQYWlycyIpOgogICAgICAgICAgICAgICAgICAgIHN0LnNlc3Npb25fc3RhdGUuc2hvd19hbGxfcGFpcnMgPSBUcnVlCiAgICAgICAgICAgICAgICAgICAgc3QucmVydW4oKQogICAgICAgICAgICBlbGlmIHN0LnNlc3Npb25fc3RhdGUuc2hvd19hbGxfcGFpcnM6CiAgICAgICAgICAgICAgICBpZiBzdC5idXR0b24oIlNob3cgTGVzcyIpOgogICAgICAgICAgICAgICAgICAgIHN0LnNlc3Npb25fc3RhdGUuc2hvd19hbGxfcGFpcnMgPSBGYWxzZQogICAgICAgICAgICAgICAgICAgIHN0LnJlcnVuKCkKICAgICAgICBlbHNlOgogICAgICAgICAgICBzdC53YXJuaW5nKCJObyBwYWlycyBmb3VuZC4iKQoKICAgICAgICAjIFdhdGNobGlzdCBTZWN0aW9uCiAgICAgICAgc3QubWFya2Rvd24oIi0tLSIpCiAgICAgICAgc3Quc3ViaGVhZGVyKCLwn5OLIFlvdXIgV2F0Y2hsaXN0IChTZWxlY3RlZCBQYWlycykiKQogICAgICAgIGlmIG5vdCBzdC5zZXNzaW9uX3N0YXRlLndhdGNobGlzdC5lbXB0eToKICAgICAgICAgICAgd2F0Y2hsaXN0X2VkaXRvciA9IHN0LmRhdGFfZWRpdG9yKAogICAgICAgICAgICAgICAgc3Quc2Vzc2lvbl9zdGF0ZS53YXRjaGxpc3QsCiAgICAgICAgICAgICAgICBoaWRlX2luZGV4PVRydWUsCiAgICAgICAgICAgICAgICBjb2x1bW5fY29uZmlnPXsiUHJpY2UiOiBzdC5jb2x1bW5fY29uZmlnLk51bWJlckNvbHVtbihmb3JtYXQ9IiQlLjRmIil9LAogICAgICAgICAgICAgICAgZGlzYWJsZWQ9WyJTeW1ib2wiLCAiUHJpY2UiLCAiVm9sdW1lIiwgIkNoYW5nZSAyNGggJSJdLAogICAgICAgICAgICAgICAgdXNlX2NvbnRhaW5lcl93aWR0aD1UcnVlLAogICAgICAgICAgICAgICAga2V5PSJ3YXRjaGxpc3RfZWRpdG9yIiwKICAgICAgICAgICAgICAgIG51bV9yb3dzPSJkeW5hbWljIgogICAgICAgICAgICApCiAgICAgICAgICAgIGlmIG5vdCB3YXRjaGxpc3RfZWRpdG9yLmVxdWFscyhzdC5zZXNzaW9uX3N0YXRlLndhdGNobGlzdCk6CiAgICAgICAgICAgICAgICAgc3Quc2Vzc2lvbl9zdGF0ZS53YXRjaGxpc3QgPSB3YXRjaGxpc3RfZWRpdG9yCiAgICAgICAgICAgICAgICAgc3QucmVydW4oKQogICAgICAgICAgICBpZiBzdC5idXR0b24oIvCfl5HvuI8gQ2xlYXIgV2F0Y2hsaXN0Iik6CiAgICAgICAgICAgICAgICBzdC5zZXNzaW9uX3N0YXRlLndhdGNobGlzdCA9IHBkLkRhdGFGcmFtZShjb2x1bW5zPVsnU3ltYm9sJywgJ1ByaWNlJywgJ1ZvbHVtZScsICdDaGFuZ2UgMjRoICUnXSkKICAgICAgICAgICAgICAgIHN0LnJlcnVuKCkKICAgICAgICBlbHNlOgogICAgICAgICAgICBzdC5pbmZvKCJObyBwYWlycyBzZWxlY3RlZC4iKQoKICAgICAgICAjIC0tLSBTVFJBVEVHWSBTRVRVUCBTRUNUSU9OIC0tLQogICAgICAgIHN0Lm1hcmtkb3duKCItLS0iKQogICAgICAgIHN0LnN1YmhlYWRlcigi8J+boO+4jyBTdHJhdGVneSBTZXR1cCAoVjIgQ29tcG9uZW50IEJ1aWxkZXIpIikKICAgICAgICAKICAgICAgICBBVkFJTEFCTEVfSU5ESUNBVE9SUyA9IHsKICAgICAgICAgICAgIkVNQSI6IFsiVmFsdWUgdnMgUHJpY2UiXSwKICAgICAgICAgICAgIlNNQSI6IFsiVmFsdWUgdnMgUHJpY2UiXSwKICAgICAgICAgICAgIlJTSSI6IFsiRGlyZWN0aW9uIChBYm92ZS9CZWxvdyA1MCkiXSwKICAgICAgICAgICAgIlZvcnRleCI6IFsiVHJlbmQgKFZJKyAvIFZJLSkiXSwKICAgICAgICAgICAgIkxpblJlZyBTbG9wZSI6IFsiU2xvcGUgRGlyZWN0aW9uIl0sCiAgICAgICAgICAgICJUVE0gU3F1ZWV6ZSI6IFsiSGlzdG9ncmFtIE1vbWVudHVtIl0sCiAgICAgICAgICAgICJDaGFpa2luIE1vbmV5IEZsb3ciOiBbIkNNRiBaZXJvLUNyb3NzIl0sCiAgICAgICAgICAgICJJY2hpbW9rdSI6IFsiQ2xvdWQiLCAiVGVua2FuL0tpanVuIl0KICAgICAgICB9CgogICAgICAgIGRlZiByZW5kZXJfaW5kaWNhdG9yX3NlbGVjdG9yKHRmX2tleSk6CiAgICAgICAgICAgIHNlbGVjdGVkID0gc3QubXVsdGlzZWxlY3QoZiJTZWxlY3QgSW5kaWNhdG9ycyBmb3Ige3RmX2tleS5jYXBpdGFsaXplKCl9IiwgbGlzdChBVkFJTEFCTEVfSU5ESUNBVE9SUy5rZXlzKCkpLCBrZXk9ZiJtdWx0aV97dGZfa2V5fSIpCiAgICAgICAgICAgIAogICAgICAgICAgICBpbmRzX2NvbmZpZyA9IFtdCiAgICAgICAgICAgIGZvciBuYW1lIGluIHNlbGVjdGVkOgogICAgICAgICAgICAgICAgY29sX25hbWUsIGNvbF9nZWFyID0gc3QuY29sdW1ucyhbNCwgMV0pCiAgICAgICAgICAgICAgICBjb2xfbmFtZS5tYXJrZG93bihmIioqe25hbWV9KioiKQogICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICBwYXJhbXMgPSB7Imxlbmd0aCI6IDE0LCAic291cmNlIjogImNsb3NlIn0KICAgICAgICAgICAgICAgIGlmIG5hbWUgPT0gIkljaGltb2t1IjogcGFyYW1zID0geyJ0ZW5rYW4iOiA5LCAia2lqdW4iOiAyNiwgInNlbmtvdSI6IDUyfQogICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICB3aXRoIGNvbF9nZWFyOgogICAgICAgICAgICAgICAgICAgIHdpdGggc3QucG9wb3Zlcigi4pqZ77iPIik6CiAgICAgICAgICAgICAgICAgICAgICAgIHN0LndyaXRlKGYiQ29uZmlndXJlIHtuYW1lfSIpCiAgICAgICAgICAgICAgICAgICAgICAgIHNyYyA9IHN0LnNlbGVjdGJveCgiU291cmNlIiwgWyJjbG9zZSIsICJvcGVuIiwgImhpZ2giLCAibG93Il0sIGtleT1mInNyY197dGZfa2V5fV97bmFtZX0iKQogICAgICAgICAgICAgICAgICAgICAgICBwYXJhbXNbJ3NvdXJjZSddID0gc3JjCiAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICBpZiBuYW1lIGluIFsiRU1BIiwgIlNNQSIsICJSU0kiLCAiVm9ydGV4IiwgIkxpblJlZyBTbG9wZSIsICJDaGFpa2luIE1vbmV5IEZsb3ciXToKICAgICAgICAgICAgICAgICAgICAgICAgICAgIHBhcmFtc1snbGVuZ3RoJ10gPSBzdC5udW1iZXJfaW5wdXQoIlBlcmlvZCIsIHZhbHVlPTE0IGlmIG5hbWUgIT0gIkNoYWlraW4gTW9uZXkgRmxvdyIgZWxzZSAyMCwga2V5PWYibGVuX3t0Zl9rZXl9X3tuYW1lfSIpCiAgICAgICAgICAgICAgICAgICAgICAgIGVsaWYgbmFtZSA9PSAiSWNoaW1va3UiOgogICAgICAgICAgICAgICAgICAgICAgICAgICAgcGFyYW1zWyd0ZW5rYW4nXSA9IHN0Lm51bWJlcl9pbnB1dCgiVGVua2FuIiwgdmFsdWU9OSwga2V5PWYidF97dGZfa2V5fV97bmFtZX0iKQogICAgICAgICAgICAgICAgICAgICAgICAgICAgcGFyYW1zWydraWp1biddID0gc3QubnVtYmVyX2lucHV0KCJLaWp1biIsIHZhbHVlPTI2LCBrZXk9ZiJrX3t0Zl9rZXl9X3tuYW1lfSIpCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBwYXJhbXNbJ3NlbmtvdSddID0gc3QubnVtYmVyX2lucHV0KCJTZW5rb3UiLCB2YWx1ZT01Miwga2V5PWYic197dGZfa2V5fV97bmFtZX0iKQogICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgc3Qud3JpdGUoIkNvbXBvbmVudHMgdG8gQ2hlY2sgKENvbmZpcm1hdGlvbikiKQogICAgICAgICAgICAgICAgICAgICAgICBzZWxlY3RlZF9jb21wb25lbnRzID0gW10KICAgICAgICAgICAgICAgICAgICAgICAgZm9yIGNvbXAgaW4gQVZBSUxBQkxFX0lORElDQVRPUlNbbmFtZV06CiAgICAgICAgICAgICAgICAgICAgICAgICAgICBpZiBzdC5jaGVja2JveChjb21wLCB2YWx1ZT1UcnVlLCBrZXk9ZiJjb21wX3t0Zl9rZXl9X3tuYW1lfV97Y29tcH0iKToKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBzZWxlY3RlZF9jb21wb25lbnRzLmFwcGVuZChjb21wKQogICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICBpbmRzX2NvbmZpZy5hcHBlbmQoewogICAgICAgICAgICAgICAgICAgICJuYW1lIjogbmFtZSwKICAgICAgICAgICAgICAgICAgICAicGFyYW1zIjogcGFyYW1zLAogICAgICAgICAgICAgICAgICAgICJzZWxlY3RlZF9jb21wb25lbnRzIjogc2VsZWN0ZWRfY29tcG9uZW50cwogICAgICAgICAgICAgICAgfSkKICAgICAgICAgICAgcmV0dXJuIGluZHNfY29uZmlnCgogICAgICAgIHN0LmluZm8oIkdsb2JhbCBBbGlnbm1lbnQgTG9naWM6IFRyaWdnZXIgQWdlbnQgb25seSB3aGVuIEFMTCBzZWxlY3RlZCBpbmRpY2F0b3JzIG9uIEFMTCB0aW1lZnJhbWVzIGFsaWduLiIpCiAgICAgICAgCiAgICAgICAgd2l0aCBzdC5jb250YWluZXIoYm9yZGVyPVRydWUpOgogICAgICAgICAgICBzdC5tYXJrZG93bigiIyMjIPCflZIgSGlnaCBUaW1lZnJhbWUgKFRyZW5kIEZpbHRlcikiKQogICAgICAgICAgICBsYXJnZV9jZmcgPSByZW5kZXJfaW5kaWNhdG9yX3NlbGVjdG9yKCJsYXJnZSIpCiAgICAgICAgICAgIAogICAgICAgIHdpdGggc3QuY29udGFpbmVyKGJvcmRlcj1UcnVlKToKICAgICAgICAgICAgc3QubWFya2Rvd24oIiMjIyDwn5WSIE1lZGl1bSBUaW1lZnJhbWUgKFRyZW5kIEZpbHRlcikiKQogICAgICAgICAgICBtZWRfY2ZnID0gcmVuZGVyX2luZGljYXRvcl9zZWxlY3RvcigibWVkIikKCiAgICAgICAgd2l0aCBzdC5jb250YWluZXIoYm9yZGVyPVRydWUpOgogICAgICAgICAgICBzdC5tYXJrZG93bigiIyMjIPCflZIgU2hvcnQgVGltZWZyYW1lIChFbnRyeSBUcmlnZ2VyKSIpCiAgICAgICAgICAgIHNtYWxsX2NmZyA9IHJlbmRlcl9pbmRpY2F0b3Jfc2VsZWN0b3IoInNtYWxsIikKCiAgICAgICAgaWYgc3QuYnV0dG9uKCLwn5K+IEFwcGx5IFYyIFN0cmF0ZWd5IFNldHVwIiwgdXNlX2NvbnRhaW5lcl93aWR0aD1UcnVlKToKICAgICAgICAgICAgc3Quc2Vzc2lvbl9zdGF0ZS5jdXJyZW50X3N0cmF0ZWd5X2xvZ2ljID0gewogICAgICAgICAgICAgICAgInZlcnNpb24iOiAiMi4wIiwKICAgICAgICAgICAgICAgICJzbWFsbCI6IHNtYWxsX2NmZywKICAgICAgICAgICAgICAgICJtZWQiOiBtZWRfY2ZnLAogICAgICAgICAgICAgICAgImxhcmdlIjogbGFyZ2VfY2ZnCiAgICAgICAgICAgIH0KICAgICAgICAgICAgc3Quc3VjY2VzcygiVjIgU3RyYXRlZ3kgQXBwbGllZCEiKQoKICAgICMgLS0tIFJJR0hUIFBBTkVMOiBTdHJhdGVneSBTZXR0aW5ncyAtLS0KICAgIHdpdGggY29sX3JpZ2h0OgogICAgICAgIHN0Lm1hcmtkb3duKCIjIyMg4pqZ77iPIFN0cmF0ZWd5IFNldHRpbmdzIikKICAgICAgICAKICAgICAgICB3aXRoIHN0LmNvbnRhaW5lcihib3JkZXI9VHJ1ZSk6CiAgICAgICAgICAgIHN0LnN1YmhlYWRlcigi8J+SsCBVc2VyIEFjY291bnQiKQogICAgICAgICAgICB1c2VyX2FjY291bnQgPSBzdC5udW1iZXJfaW5wdXQoIlRvdGFsIEJhbGFuY2UgKFVTRFQpIiwgdmFsdWU9MTAwMC4wLCBzdGVwPTEwMC4wKQogICAgICAgICAgICAKICAgICAgICAgICAgc3Quc3ViaGVhZGVyKCLwn5qAIFBvc2l0aW9uIFNpemluZyIpCiAgICAgICAgICAgIHN0YXJ0X2Ftb3VudCA9IHN0Lm51bWJlcl9pbnB1dCgiU3RhcnRpbmcgQW1vdW50IChVU0RUKSIsIG1pbl92YWx1ZT0xMC4wLCB2YWx1ZT0xMDAuMCwgc3RlcD0xMC4wKQogICAgICAgICAgICBsaXF1aWRpdHkgPSBzdC5udW1iZXJfaW5wdXQoIkxpcXVpZGl0eSBQb29sIChVU0RUKSIsIG1pbl92YWx1ZT0wLjAsIHZhbHVlPTUwMC4wLCBzdGVwPTUwLjApCiAgICAgICAgICAgIAogICAgICAgICAgICBzdC5tYXJrZG93bigiLS0tIikKICAgICAgICAgICAgc3Quc3ViaGVhZGVyKCLwn5OKIFRyYWRpbmcgTGV2ZWxzIChNYXJ0aW5nYWxlKSIpCiAgICAgICAgICAgIG1heF9sZXZlbHMgPSBzdC5udW1iZXJfaW5wdXQoIk1heCBMZXZlbHMiLCBtaW5fdmFsdWU9MSwgbWF4X3ZhbHVlPTEwLCB2YWx1ZT01LCBzdGVwPTEpCiAgICAgICAgICAgIGxldmVscyA9IFtdCiAgICAgICAgICAgIGZvciBpIGluIHJhbmdlKDEsIG1heF9sZXZlbHMgKyAxKToKICAgICAgICAgICAgICAgIGx2bF92YWwgPSBzdC5udW1iZXJfaW5wdXQoZiJMZXZlbCB7aX0gKCQpIiwgdmFsdWU9ZmxvYXQoaSAqIDEwMCksIHN0ZXA9MTAuMCwga2V5PWYibGV2ZWxfe2l9IikKICAgICAgICAgICAgICAgIGxldmVscy5hcHBlbmQobHZsX3ZhbCkKICAgICAgICAgICAgCiAgICAgICAgICAgIHN0Lm1hcmtkb3duKCIjIyMjIPCfm6HvuI8gU2FmZSBMZXZlbHMiKQogICAgICAgICAgICBzbDEgPSBzdC5udW1iZXJfaW5wdXQoIlNMZXZlbCAxICgkKSIsIHZhbHVlPTgwLjAsIHN0ZXA9MTAuMCkKICAgICAgICAgICAgc2wyID0gc3QubnVtYmVyX2lucHV0KCJTTGV2ZWwgMiAoJCkiLCB2YWx1ZT02MC4wLCBzdGVwPTEwLjApCiAgICAgICAgICAgIAogICAgICAgICAgICBzdC5tYXJrZG93bigiLS0tIikKICAgICAgICAgICAgc3Quc3ViaGVhZGVyKCLimpbvuI8gUmlzayBNYW5hZ2VtZW50IikKICAgICAgICAgICAgbWF4X29wZW5fdHJhZGVzID0gc3QubnVtYmVyX2lucHV0KCJNYXggT3BlbiBUcmFkZXMiLCBtaW5fdmFsdWU9MSwgdmFsdWU9NSkKICAgICAgICAgICAgcmlza192YWwgPSBzdC5udW1iZXJfaW5wdXQoIlJpc2sgRmFjdG9yIiwgdmFsdWU9MS4wLCBzdGVwPTAuMSkKICAgICAgICAgICAgcmV3YXJkX3ZhbCA9IHN0Lm51bWJlcl9pbnB1dCgiUmV3YXJkIEZhY3RvciIsIHZhbHVlPTMuMCwgc3RlcD0wLjEpCiAgICAgICAgICAgIHJpc2tfcGVyX3RyYWRlID0gc3QubnVtYmVyX2lucHV0KCJSaXNrIFBlciBUcmFkZSAoJSkiLCBtaW5fdmFsdWU9MC4xLCBtYXhfdmFsdWU9MTAwLjAsIHZhbHVlPTIuMCwgc3RlcD0wLjEpCiAgICAgICAgICAgIAogICAgICAgICAgICAjIEZ1dHVyZXMgRGlyZWN0aW9uCiAgICAgICAgICAgIGlmIG1hcmtldF90eXBlID09ICJGdXR1cmVzIjoKICAgICAgICAgICAgICAgIHRyYWRlX2RpcmVjdGlvbiA9IHN0LnJhZGlvKCJUcmFkZSBEaXJlY3Rpb24iLCBbIkxvbmcgT25seSIsICJTaG9ydCBPbmx5IiwgIkJvdGgiXSwgaW5kZXg9MiwgaG9yaXpvbnRhbD1UcnVlKQogICAgICAgICAgICBlbHNlOgogICAgICAgICAgICAgICAgdHJhZGVfZGlyZWN0aW9uID0gIkxvbmcgT25seSIKICAgICAgICAgICAgCiAgICAgICAgICAgIHN0Lm1hcmtkb3duKCItLS0iKQogICAgICAgICAgICBzdC5zdWJoZWFkZXIoIuKPse+4jyBUaW1lZnJhbWVzIikKICAgICAgICAgICAgdGZfc21hbGwgPSBzdC5zZWxlY3Rib3goIlNtYWxsIFRGIiwgWyIxNW0iLCAiMzBtIiwgIjFoIiwgIjRoIl0sIGluZGV4PTApCiAgICAgICAgICAgIHRmX21lZGl1bSA9IHN0LnNlbGVjdGJveCgiTWVkaXVtIFRGIiwgWyIzMG0iLCAiMWgiLCAiNGgiLCAiMWQiXSwgaW5kZXg9MikKICAgICAgICAgICAgdGZfbGFyZ2UgPSBzdC5zZWxlY3Rib3goIkxhcmdlIFRGIiwgWyIxaCIsICI0aCIsICIxZCIsICIxdyJdLCBpbmRleD0yKQogICAgICAgICAgICAKICAgICAgICAgICAgaWYgc3QuYnV0dG9uKCLwn5qAIFNUQVJUIElOU1RBTkNFIiwgdHlwZT0icHJpbWFyeSIsIHVzZV9jb250YWluZXJfd2lkdGg9VHJ1ZSk6CiAgICAgICAgICAgICAgICBpZiBzdC5zZXNzaW9uX3N0YXRlLndhdGNobGlzdC5lbXB0eToKICAgICAgICAgICAgICAgICAgICBzdC5lcnJvcigiQWRkIHBhaXJzIGZpcnN0ISIpCiAgICAgICAgICAgICAgICBlbHNlOgogICAgICAgICAgICAgICAgICAgIGxvZ2ljID0gc3Quc2Vzc2lvbl9zdGF0ZS5nZXQoJ2N1cnJlbnRfc3RyYXRlZ3lfbG9naWMnLCB7InZlcnNpb24iOiAiMi4wIiwgInNtYWxsIjogW10sICJtZWQiOiBbXSwgImxhcmdlIjogW119KQogICAgICAgICAgICAgICAgICAgIGNvbmZpZyA9IHsKICAgICAgICAgICAgICAgICAgICAgICAgImV4Y2hhbmdlIjogc3RyYXRfZXhjaGFuZ2UsCiAgICAgICAgICAgICAgICAgICAgICAgICJiYXNlX2N1cnJlbmN5IjogYmFzZV9jdXJyZW5jeSwKICAgICAgICAgICAgICAgICAgICAgICAgIm1hcmtldF90eXBlIjogbWFya2V0X3R5cGUsCiAgICAgICAgICAgICAgICAgICAgICAgICJzdHJhdGVneV9wYXJhbXMiOiB7CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAidXNlcl9hY2NvdW50IjogdXNlcl9hY2NvdW50LAogICAgICAgICAgICAgICAgICAgICAgICAgICAgInN0YXJ0X2Ftb3VudCI6IHN0YXJ0X2Ftb3VudCwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICJsaXF1aWRpdHkiOiBsaXF1aWRpdHksCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAibGV2ZWxzIjogbGV2ZWxzLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgInNhZmVfbGV2ZWxzIjogW3NsMSwgc2wyXSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICJyaXNrIjogeyJtYXhfdHJhZGVzIjogbWF4X29wZW5fdHJhZGVzLCAicnIiOiBmIntyaXNrX3ZhbH06e3Jld2FyZF92YWx9IiwgInBjdCI6IHJpc2tfcGVyX3RyYWRlfSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICJ0aW1lZnJhbWVzIjogW3RmX3NtYWxsLCB0Zl9tZWRpdW0sIHRmX2xhcmdlXSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICJ0cmFkZV9kaXJlY3Rpb24iOiB0cmFkZV9kaXJlY3Rpb24KICAgICAgICAgICAgICAgICAgICAgICAgfSwKICAgICAgICAgICAgICAgICAgICAgICAgInN0cmF0ZWd5X2xvZ2ljIjogbG9naWMKICAgICAgICAgICAgICAgICAgICB9CiAgICAgICAgICAgICAgICAgICAgcGFpcnNfbGlzdCA9IHN0LnNlc3Npb25fc3RhdGUud2F0Y2hsaXN0WydTeW1ib2wnXS50b2xpc3QoKQogICAgICAgICAgICAgICAgICAgIGluc3RhbmNlX25hbWUgPSByZWdpc3Rlcl9pbnN0YW5jZShjb25maWcsIHBhaXJzX2xpc3QpCiAgICAgICAgICAgICAgICAgICAgaWYgaW5zdGFuY2VfbmFtZToKICAgICAgICAgICAgICAgICAgICAgICAgc3QuYmFsbG9vbnMoKQogICAgICAgICAgICAgICAgICAgICAgICBzdC5zZXNzaW9uX3N0YXRlLndhdGNobGlzdCA9IHBkLkRhdGFGcmFtZShjb2x1bW5zPVsnU3ltYm9sJywgJ1ByaWNlJywgJ1ZvbHVtZScsICdDaGFuZ2UgMjRoICUnXSkKICAgICAgICAgICAgICAgICAgICAgICAgdGltZS5zbGVlcCgxKQogICAgICAgICAgICAgICAgICAgICAgICBuYXZpZ2F0ZV90bygiTGl2ZSBNb25pdG9yIikKCmVsaWYgc3Quc2Vzc2lvbl9zdGF0ZS5wYWdlID09ICJMaXZlIE1vbml0b3IiOgogICAgc3QudGl0bGUoIvCflLQgTGl2ZSBNb25pdG9yIikKCiAgICAjIEluY3JlbWVudGFsIHRyYWRlIHRhaWw6IGVhY2ggcmVydW4gb25seSByZWFkcyB0cmFkZXMgbmV3ZXIgdGhhbiB0aGUgbGFzdCBzZWVuIGlkCiAgICBpZiAndHJhZGVfZmVlZCcgbm90IGluIHN0LnNlc3Npb25fc3RhdGU6IHN0LnNlc3Npb25fc3RhdGUudHJhZGVfZmVlZCA9IFRyYWRlRmVlZCh3aW5kb3c9MjAwKQogICAgdHJhZGVfZmVlZCA9IHN0LnNlc3Npb25fc3RhdGUudHJhZGVfZmVlZAogICAgdHJhZGVfZmVlZC5wb2xsKGdldF9yZWFkX21vZGVsKCkpCgogICAgZGZfaW5zdGFuY2VzID0gZ2V0X2luc3RhbmNlcygpCiAgICBzdW1tYXJpZXMgPSBnZXRfaW5zdGFuY2Vfc3VtbWFyaWVzKCkKICAgIGlmIG5vdCBkZl9pbnN0YW5jZXMuZW1wdHk6CiAgICAgICAgZm9yIF8sIHJvdyBpbiBkZl9pbnN0YW5jZXMuaXRlcnJvd3MoKToKICAgICAgICAgICAgc3VtbWFyeSA9IHN1bW1hcmllcy5nZXQocm93WydpZCddLCB7fSkKICAgICAgICAgICAgd2l0aCBzdC5leHBhbmRlcihmIvCfkJ0ge3Jvd1snbmFtZSddfSAoe3Jvd1snc3RhdHVzJ119KSIsIGV4cGFuZGVkPVRydWUpOgogICAgICAgICAgICAgICAgbTEsIG0yLCBtMywgbTQsIG01LCBtNiA9IHN0LmNvbHVtbnMoNikKICAgICAgICAgICAgICAgIG0xLm1ldHJpYygiRXhjaGFuZ2UiLCByb3dbJ2V4Y2hhbmdlJ10uY2FwaXRhbGl6ZSgpKQogICAgICAgICAgICAgICAgbTIubWV0cmljKCJNYXJrZXQgVHlwZSIsIHJvd1snbWFya2V0X3R5cGUnXSkKICAgICAgICAgICAgICAgIG0zLm1ldHJpYygiU3RhdHVzIiwgcm93WydzdGF0dXMnXSkKICAgICAgICAgICAgICAgIG00Lm1ldHJpYygiVHJhZGVzIiwgaW50KHN1bW1hcnkuZ2V0KCd0cmFkZXNfb3BlbmVkJykgb3IgMCksIGYie2ludChzdW1tYXJ5LmdldCgnb3Blbl9wb3NpdGlvbnMnKSBvciAwKX0gb3BlbiIsIGRlbHRhX2NvbG9yPSJvZmYiKQogICAgICAgICAgICAgICAgbTUubWV0cmljKCJSZWFsaXplZCBQbkwiLCBmIntzdW1tYXJ5LmdldCgncmVhbGl6ZWRfcG5sJykgb3IgMDorLjJmfSIpCiAgICAgICAgICAgICAgICB3aW5fcmF0ZSA9IHN1bW1hcnkuZ2V0KCd3aW5fcmF0ZScpCiAgICAgICAgICAgICAgICBtNi5tZXRyaWMoIldpbiBSYXRlIiwgZiJ7d2luX3JhdGU6LjAlfSIgaWYgd2luX3JhdGUgaXMgbm90IE5vbmUgZWxzZSAiLSIpCiAgICAgICAgICAgICAgICBpZiBzdW1tYXJ5LmdldCgnaGFsdGVkJyk6CiAgICAgICAgICAgICAgICAgICAgc3Qud2FybmluZygiSW5zdGFuY2UgaGFsdGVkIGJ5IHRoZSByaXNrIGVuZ2luZSAoZHJhd2Rvd24gbGltaXQpLiIpCgogICAgICAgICAgICAgICAgc3QubWFya2Rvd24oIiMjIyMg8J+TiiBQYWlycyBBY3Rpdml0eSAmIFRyZW5kcyIpCiAgICAgICAgICAgICAgICBwYWlycyA9IGpzb24ubG9hZHMocm93WydwYWlycyddKQoKICAgICAgICAgICAgICAgICMgUm9idXN0IGxvYWRpbmcgd2l0aCBmYWxsYmFja3MgZm9yIG9sZGVyIGluc3RhbmNlcwogICAgICAgICAgICAgICAgc3RyYXRfbG9naWNfcmF3ID0gcm93LmdldCgnc3RyYXRlZ3lfanNvbicpCiAgICAgICAgICAgICAgICBzdHJhdF9sb2dpY19qc29uID0gc3RyYXRfbG9naWNfcmF3IGlmIHN0cmF0X2xvZ2ljX3JhdyBlbHNlIGpzb24uZHVtcHMoeyJ2ZXJzaW9uIjogIjEuMCIsICJzbWFsbCI6IFtdLCAibWVkIjogW10sICJsYXJnZSI6IFtdfSkKCiAgICAgICAgICAgICAgICBzdHJhdF9wYXJhbXNfcmF3ID0gcm93LmdldCgnc3RyYXRlZ3lfY29uZmlnJykKICAgICAgICAgICAgICAgIHN0cmF0X3BhcmFtcyA9IGpzb24ubG9hZHMoc3RyYXRfcGFyYW1zX3JhdykgaWYgc3RyYXRfcGFyYW1zX3JhdyBlbHNlIHt9CgogICAgICAgICAgICAgICAgdGZzID0gc3RyYXRfcGFyYW1zLmdldCgndGltZWZyYW1lcycsIFtdKQogICAgICAgICAgICAgICAgYmFkZ2VzID0gZ2V0X3RyZW5kX2JhZGdlcyhyb3dbJ2lkJ10sIHR1cGxlKHBhaXJzKSwgdHVwbGUodGZzKSwgc3RyYXRfbG9naWNfanNvbikKCiAgICAgICAgICAgICAgICBmb3IgcCBpbiBwYWlyczoKICAgICAgICAgICAgICAgICAgICBwX2NvbHMgPSBzdC5jb2x1bW5zKFsxLjVdICsgWzFdICogbGVuKHRmcykpCiAgICAgICAgICAgICAgICAgICAgcF9jb2xzWzBdLm1hcmtkb3duKGYiKip7cH0qKiIpCiAgICAgICAgICAgICAgICAgICAgZm9yIGksIHRmIGluIGVudW1lcmF0ZSh0ZnMpOgogICAgICAgICAgICAgICAgICAgICAgICBwX2NvbHNbaSsxXS5tYXJrZG93bihiYWRnZXNbKHAsIHRmKV0sIHVuc2FmZV9hbGxvd19odG1sPVRydWUpCgogICAgICAgICAgICAgICAgc3QubWFya2Rvd24oIi0tLSIpCiAgICAgICAgICAgICAgICBjX2J0bjEsIGNfYnRuMiwgY19idG4zID0gc3QuY29sdW1ucygzKQogICAgICAgICAgICAgICAgd2l0aCBjX2J0bjE6CiAgICAgICAgICAgICAgICAgICAgaWYgc3QuYnV0dG9uKCJTdG9wIiwga2V5PWYic3RvcF97cm93WydpZCddfSIpOgogICAgICAgICAgICAgICAgICAgICAgICBzZXRfaW5zdGFuY2Vfc3RhdHVzKHJvd1snaWQnXSwgJ1NUT1BQRUQnKQogICAgICAgICAgICAgICAgICAgICAgICBzdC5yZXJ1bigpCiAgICAgICAgICAgICAgICB3aXRoIGNfYnRuMzoKICAgICAgICAgICAgICAgICAgICBpZiBzdC5idXR0b24oIkRlbGV0ZSIsIGtleT1mImRlbF97cm93WydpZCddfSIpOgogICAgICAgICAgICAgICAgICAgICAgICBzZXRfaW5zdGFuY2Vfc3RhdHVzKHJvd1snaWQnXSwgJ0RFTEVURUQnKQogICAgICAgICAgICAgICAgICAgICAgICBzdC5yZXJ1bigpCgogICAgc3QubWFya2Rvd24oIiMjIyMg8J+nviBSZWNlbnQgVHJhZGVzIikKICAgIGlmIG5vdCB0cmFkZV9mZWVkLnRyYWRlcy5lbXB0eToKICAgICAgICBzdC5kYXRhZnJhbWUodHJhZGVfZmVlZC50cmFkZXMuaWxvY1s6Oi0xXSwgdXNlX2NvbnRhaW5lcl93aWR0aD1UcnVlLCBoaWRlX2luZGV4PVRydWUpCiAgICBlbHNlOgogICAgICAgIHN0LmluZm8oIk5vIHRyYWRlcyB5ZXQuIikK
\ No newline at end of file
@@ -0,0 +1,138 @@
+import sqlite3
+import threading
+import pandas as pd
+
+class ReadModel:
+    """
+    Read-only access to trades.db / candles.db for the dashboard.
+
+    Connections are opened with mode=ro and query_only, so Streamlit reruns
+    never take write locks; with the writers in WAL mode, reads do not block
+    the Hive or the trading bot (and vice versa). One connection per database
+    is shared by all sessions and serialized with a lock. Caching is left to
+    the caller (st.cache_data), every method here hits the database.
+    """
+    def __init__(self, trades_db="trades.db", candles_db="candles.db", busy_timeout_ms=2000):
+        self.paths = {"trades": trades_db, "candles": candles_db}
+        self.busy_timeout_ms = busy_timeout_ms
+        self.conns = {} # {name: sqlite3.Connection}
+        self.lock = threading.Lock()
+
+    def _connect(self, name):
+        conn = self.conns.get(name)
+        if conn is None:
+            try:
+                conn = sqlite3.connect(f"file:{self.paths[name]}?mode=ro", uri=True, check_same_thread=False)
+            except sqlite3.OperationalError:
+                # Database not created yet (engine never started)
+                return None
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            conn.execute("PRAGMA query_only=1")
+            self.conns[name] = conn
+        return conn
+
+    def _read(self, name, query, params=()):
+        """Runs a query and returns a DataFrame (empty if the db/table does not exist yet)."""
+        with self.lock:
+            conn = self._connect(name)
+            if conn is None:
+                return pd.DataFrame()
+            try:
+                return pd.read_sql(query, conn, params=params)
+            except (sqlite3.OperationalError, pd.errors.DatabaseError):
+                return pd.DataFrame()
+
+    def get_instances(self):
+        return self._read("trades", "SELECT * FROM instances WHERE status != 'DELETED' ORDER BY created_at DESC")
+
+    def get_instance_summaries(self):
+        """
+        Per-instance totals from the precomputed daily rollups, joined with
+        the latest capital and risk snapshot. One grouped query over the
+        rollup table instead of scanning trades; cost grows with
+        instances x days, not with trade history.
+        """
+        df = self._read("trades", '''
+            SELECT r.instance_id,
+                   SUM(r.trades_opened) AS trades_opened,
+                   SUM(r.trades_closed) AS trades_closed,
+                   SUM(r.wins) AS wins,
+                   SUM(r.losses) AS losses,
+                   SUM(r.realized_pnl) AS realized_pnl,
+                   MAX(r.day) AS last_day
+            FROM trade_rollups_daily r
+            GROUP BY r.instance_id
+        ''')
+        if df.empty:
+            return {}
+        df['win_rate'] = df['wins'] / df['trades_closed'].where(df['trades_closed'] > 0)
+
+        state = self._read("trades", "SELECT instance_id, total_capital, current_level FROM instance_state WHERE instance_id IS NOT NULL")
+        risk = self._read("trades", "SELECT instance_id, open_exposure, open_positions, peak_capital, halted FROM risk_snapshots")
+        for extra in (state, risk):
+            if not extra.empty:
+                df = df.merge(extra, on='instance_id', how='left')
+        df = df.astype(object).where(df.notna(), None)
+        return {row['instance_id']: row for row in df.to_dict('records')}
+
+    def get_recent_trades(self, limit=200):
+        df = self._read("trades", "SELECT * FROM trades ORDER BY id DESC LIMIT ?", (limit,))
+        return df.iloc[::-1].reset_index(drop=True)
+
+    def get_trades_since(self, last_id, limit=500):
+        """Trades with id > last_id in id order (uses the primary key, O(new rows))."""
+        return self._read("trades", "SELECT * FROM trades WHERE id > ? ORDER BY id LIMIT ?", (last_id, limit))
+
+    def get_trade_updates(self, ids):
+        """Current rows of the given trade ids (e.g. to refresh ones still OPEN)."""
+        if not ids:
+            return pd.DataFrame()
+        placeholders = ",".join("?" * len(ids))
+        return self._read("trades", f"SELECT * FROM trades WHERE id IN ({placeholders})", tuple(ids))
+
+    def get_candles(self, instance_id, symbol, timeframe, limit=250):
+        """Latest `limit` candles in ascending time order."""
+        df = self._read(
+            "candles",
+            "SELECT * FROM candles WHERE instance_id=? AND symbol=? AND timeframe=? ORDER BY timestamp DESC LIMIT ?",
+            (instance_id, symbol, timeframe, limit)
+        )
+        return df.iloc[::-1].reset_index(drop=True)
+
+    def close(self):
+        with self.lock:
+            for conn in self.conns.values():
+                conn.close()
+            self.conns.clear()
+
+class TradeFeed:
+    """
+    Incremental trade tail for one dashboard session.
+
+    Each poll only asks for rows newer than the last seen id and refreshes
+    the few rows still OPEN in the window, keeping at most `window` trades.
+    """
+    def __init__(self, window=200):
+        self.window = window
+        self.last_id = None
+        self.trades = pd.DataFrame()
+
+    def poll(self, read_model):
+        if self.last_id is None:
+            new = read_model.get_recent_trades(self.window)
+        else:
+            new = read_model.get_trades_since(self.last_id, self.window)
+            if len(new) >= self.window:
+                # Fell behind by a full window: the tail is all new rows anyway
+                self.trades = pd.DataFrame()
+                new = read_model.get_recent_trades(self.window)
+            elif not self.trades.empty and 'status' in self.trades:
+                open_ids = self.trades.loc[self.trades['status'] == 'OPEN', 'id'].tolist()
+                updated = read_model.get_trade_updates(open_ids)
+                if not updated.empty:
+                    self.trades = pd.concat([self.trades[~self.trades['id'].isin(updated['id'])], updated]).sort_values('id')
+        if not new.empty:
+            self.trades = pd.concat([self.trades, new]) if not self.trades.empty else new
+            self.last_id = int(new['id'].max())
+        self.trades = self.trades.tail(self.window).reset_index(drop=True)
+        return len(new)
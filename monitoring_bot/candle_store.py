@@ -0,0 +1,209 @@
+import os
+import re
+import time
+import shutil
+import tempfile
+import logging
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+def current_rss_bytes():
+    """Resident set size of this process (Linux /proc, falls back to peak RSS)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+class CandleSeries:
+    """One candle series as compact typed arrays: int64 ms timestamps + (n, 5) OHLCV matrix."""
+    def __init__(self, ts, ohlcv):
+        self.ts = ts
+        self.ohlcv = ohlcv
+        self.last_access = time.time()
+
+    @classmethod
+    def from_frame(cls, df, dtype):
+        ts = pd.to_datetime(df['timestamp']).values.astype('datetime64[ms]').astype(np.int64)
+        ohlcv = df[OHLCV_COLUMNS].to_numpy(dtype=dtype)
+        return cls(ts, ohlcv)
+
+    @property
+    def nbytes(self):
+        return self.ts.nbytes + self.ohlcv.nbytes
+
+    def to_frame(self):
+        df = pd.DataFrame(self.ohlcv, columns=OHLCV_COLUMNS)
+        df.insert(0, 'timestamp', pd.to_datetime(self.ts, unit='ms'))
+        return df
+
+class CandleStore:
+    """
+    Memory-budgeted residency for market data shared by all fetchers.
+
+    Series are held as typed arrays (float64 or float32 OHLCV, per config)
+    instead of DataFrames. When the store's own arrays exceed `budget_mb`,
+    the lowest-priority, least recently used series are spilled to disk and
+    reloaded transparently on the next read. Process RSS is only a secondary
+    trigger: above `rss_limit_mb` the store shrinks to half its budget (RSS
+    itself is mostly pandas/ccxt and won't drop by spilling candles).
+
+    Spill files are private to one process: with a `node_id` they live in
+    `spill_dir/<node_id>` (emptied on start), otherwise in a fresh temporary
+    directory under `spill_dir`. close() removes it.
+    """
+    def __init__(self, budget_mb=1024, dtype='float64', spill_dir='candle_cache', max_candles=500, rss_limit_mb=None, node_id=None):
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self.rss_limit_bytes = rss_limit_mb * 1024 * 1024 if rss_limit_mb else None
+        self.dtype = np.dtype(dtype)
+        os.makedirs(spill_dir, exist_ok=True)
+        if node_id:
+            spill_dir = os.path.join(spill_dir, re.sub(r'[^A-Za-z0-9_.-]', '_', node_id))
+            # Leftovers of a previous run are unreachable (the spill index is in memory)
+            shutil.rmtree(spill_dir, ignore_errors=True)
+            os.makedirs(spill_dir)
+        else:
+            spill_dir = tempfile.mkdtemp(prefix='store-', dir=spill_dir)
+        self.spill_dir = spill_dir
+        self.max_candles = max_candles
+        self.resident = OrderedDict() # {(instance_id, symbol, timeframe): CandleSeries}, LRU first
+        self.resident_bytes = 0
+        self.spilled = {} # {key: npz path}
+        self.priorities = {} # {instance_id: priority}, lower is evicted first
+        logger.info(f"Candle Store: budget {budget_mb}MB, {self.dtype.name} OHLCV, spill dir {spill_dir}")
+
+    def _spill_path(self, key):
+        name = re.sub(r'[^A-Za-z0-9_.-]', '_', '__'.join(key))
+        return os.path.join(self.spill_dir, f"{name}.npz")
+
+    def _touch(self, key, series):
+        series.last_access = time.time()
+        self.resident.move_to_end(key)
+
+    def _load(self, key):
+        """Returns the resident series for `key`, reloading it from disk if spilled."""
+        series = self.resident.get(key)
+        if series is not None:
+            self._touch(key, series)
+            return series
+        path = self.spilled.pop(key, None)
+        if path is None:
+            return None
+        with np.load(path) as data:
+            series = CandleSeries(data['ts'], data['ohlcv'])
+        os.remove(path)
+        self.resident[key] = series
+        self.resident_bytes += series.nbytes
+        self.enforce_budget(protect=key)
+        return series
+
+    def contains(self, key):
+        return key in self.resident or key in self.spilled
+
+    def put(self, key, df):
+        """Replaces a series with the (timestamp-sorted) candles in `df`."""
+        self.discard(key)
+        series = CandleSeries.from_frame(df.tail(self.max_candles), self.dtype)
+        self.resident[key] = series
+        self.resident_bytes += series.nbytes
+        self.enforce_budget(protect=key)
+
+    def append(self, key, df):
+        """Appends newer candles to a known series (no-op if the series isn't cached)."""
+        series = self._load(key)
+        if series is None or df.empty:
+            return
+        new = CandleSeries.from_frame(df, self.dtype)
+        newer = new.ts > series.ts[-1] if len(series.ts) else np.ones(len(new.ts), dtype=bool)
+        before = series.nbytes
+        series.ts = np.concatenate([series.ts, new.ts[newer]])[-self.max_candles:]
+        series.ohlcv = np.concatenate([series.ohlcv, new.ohlcv[newer]])[-self.max_candles:]
+        self.resident_bytes += series.nbytes - before
+        self.enforce_budget(protect=key)
+
+    def get_frame(self, key, limit=None):
+        series = self._load(key)
+        if series is None:
+            return None
+        df = series.to_frame()
+        return df.tail(limit) if limit else df
+
+    def last_timestamp(self, key):
+        series = self._load(key)
+        if series is None or not len(series.ts):
+            return None
+        return pd.to_datetime(series.ts[-1], unit='ms')
+
+    def discard(self, key):
+        series = self.resident.pop(key, None)
+        if series is not None:
+            self.resident_bytes -= series.nbytes
+        path = self.spilled.pop(key, None)
+        if path and os.path.exists(path):
+            os.remove(path)
+
+    def set_priority(self, instance_id, priority):
+        self.priorities[instance_id] = priority
+
+    def drop_instance(self, instance_id):
+        for key in [k for k in list(self.resident) + list(self.spilled) if k[0] == instance_id]:
+            self.discard(key)
+        self.priorities.pop(instance_id, None)
+
+    def evict(self, key):
+        """Spills a resident series to disk."""
+        series = self.resident.pop(key)
+        self.resident_bytes -= series.nbytes
+        path = self._spill_path(key)
+        np.savez(path, ts=series.ts, ohlcv=series.ohlcv)
+        self.spilled[key] = path
+        return series.nbytes
+
+    def enforce_budget(self, protect=None):
+        """
+        Evicts cold series until the store's own arrays fit its cap.
+        Victims: lowest instance priority first, then least recently used.
+        """
+        cap = self.budget_bytes
+        if self.rss_limit_bytes and self.resident_bytes > cap // 2 and current_rss_bytes() > self.rss_limit_bytes:
+            cap //= 2
+        excess = self.resident_bytes - cap
+        if excess <= 0:
+            return 0
+        victims = sorted(
+            (k for k in self.resident if k != protect),
+            key=lambda k: (self.priorities.get(k[0], 0), self.resident[k].last_access)
+        )
+        freed = 0
+        for key in victims:
+            if freed >= excess:
+                break
+            freed += self.evict(key)
+        if freed:
+            logger.debug(f"Candle Store over budget by {excess / 1e6:.2f}MB: spilled {freed / 1e6:.2f}MB to disk")
+        return freed
+
+    def close(self):
+        """Drops all series and removes this store's spill directory (shutdown)."""
+        self.resident.clear()
+        self.resident_bytes = 0
+        self.spilled.clear()
+        shutil.rmtree(self.spill_dir, ignore_errors=True)
+
+    def get_memory_report(self):
+        """Resident bytes and series counts per instance, for node sizing."""
+        report = {}
+        for (instance_id, _, _), series in self.resident.items():
+            entry = report.setdefault(instance_id, {"resident_bytes": 0, "resident_series": 0, "spilled_series": 0})
+            entry["resident_bytes"] += series.nbytes
+            entry["resident_series"] += 1
+        for instance_id, _, _ in self.spilled:
+            entry = report.setdefault(instance_id, {"resident_bytes": 0, "resident_series": 0, "spilled_series": 0})
+            entry["spilled_series"] += 1
+        return report
@@ -0,0 +1,135 @@
+import logging
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+class SeriesHealth:
+    """
+    Continuity report for one (instance, symbol, timeframe) candle series.
+    `gaps` holds inclusive (start_ms, end_ms) ranges of missing candles.
+    """
+    def __init__(self, candles, gaps, duplicates, out_of_order, ignored_gaps=0):
+        self.candles = candles
+        self.gaps = gaps
+        self.duplicates = duplicates
+        self.out_of_order = out_of_order
+        self.ignored_gaps = ignored_gaps
+
+    @property
+    def missing_candles(self):
+        return sum(g[2] for g in self.gaps)
+
+    @property
+    def is_healthy(self):
+        # Duplicates and disorder are fixed locally; only real holes are fatal
+        return not self.gaps
+
+    def as_dict(self):
+        return {
+            "candles": self.candles,
+            "gaps": len(self.gaps),
+            "missing_candles": self.missing_candles,
+            "duplicates": self.duplicates,
+            "out_of_order": self.out_of_order,
+            "ignored_gaps": self.ignored_gaps,
+            "healthy": self.is_healthy,
+        }
+
+def to_epoch_ms(timestamps):
+    """Converts a timestamp column (strings, datetimes or ms ints) to an int64 ms array."""
+    values = np.asarray(timestamps)
+    if np.issubdtype(values.dtype, np.integer):
+        return values.astype(np.int64)
+    return pd.to_datetime(values).values.astype('datetime64[ms]').astype(np.int64)
+
+def check_continuity(ts_ms, interval_ms):
+    """
+    Vectorized "Option B" check over a timestamp array (ms).
+    Returns (gaps, duplicates, out_of_order) where gaps are (start_ms, end_ms, count).
+    """
+    if len(ts_ms) < 2:
+        return [], 0, 0
+
+    diffs = np.diff(ts_ms)
+    out_of_order = int(np.count_nonzero(diffs < 0))
+
+    # Gaps & duplicates are measured on the sorted series so disorder isn't double counted
+    ordered = np.sort(ts_ms)
+    steps = np.diff(ordered)
+    duplicates = int(np.count_nonzero(steps == 0))
+
+    idx = np.flatnonzero(steps > interval_ms)
+    starts = ordered[idx] + interval_ms
+    ends = ordered[idx + 1] - interval_ms
+    counts = steps[idx] // interval_ms - 1
+    gaps = [(int(s), int(e), int(c)) for s, e, c in zip(starts, ends, counts) if c > 0]
+    return gaps, duplicates, out_of_order
+
+class CandleValidator:
+    """
+    Validates candle series before analysis and queues missing ranges for
+    targeted re-fetch instead of a full re-download.
+    """
+    def __init__(self):
+        self.health = {} # {(instance_id, symbol, timeframe): SeriesHealth}
+        self.repair_queue = {} # {instance_id: [(symbol, timeframe, start_ms, end_ms)]}
+        self.unrepairable = {} # {(instance_id, symbol, timeframe): {(start_ms, end_ms)}}
+
+    def validate(self, instance_id, symbol, timeframe, df, interval_ms):
+        """
+        Checks continuity of `df`, records its health and queues any gaps.
+        Returns (clean_df, health); clean_df is sorted and de-duplicated.
+        """
+        key = (instance_id, symbol, timeframe)
+        ts_ms = to_epoch_ms(df['timestamp'])
+        gaps, duplicates, out_of_order = check_continuity(ts_ms, interval_ms)
+
+        # Ranges the exchange itself has no data for (e.g. maintenance) are accepted
+        known_holes = self.unrepairable.get(key, set())
+        real_gaps = [g for g in gaps if (g[0], g[1]) not in known_holes]
+
+        health = SeriesHealth(len(df), real_gaps, duplicates, out_of_order, ignored_gaps=len(gaps) - len(real_gaps))
+        self.health[key] = health
+
+        if duplicates or out_of_order:
+            logger.warning(f"{symbol} ({timeframe}): {duplicates} duplicate / {out_of_order} out-of-order candles fixed")
+            df = df.assign(_ts=ts_ms).sort_values('_ts', kind='stable')
+            df = df.drop_duplicates(subset='_ts', keep='last').drop(columns='_ts')
+
+        if real_gaps:
+            logger.warning(f"{symbol} ({timeframe}): {len(real_gaps)} gaps / {health.missing_candles} missing candles queued for repair")
+            queue = self.repair_queue.setdefault(instance_id, [])
+            for start, end, _ in real_gaps:
+                queue.append((symbol, timeframe, start, end))
+
+        return df, health
+
+    def pop_repairs(self, instance_id):
+        """Returns and clears the queued gap ranges for an instance."""
+        return self.repair_queue.pop(instance_id, [])
+
+    def mark_unrepairable(self, instance_id, ranges):
+        """Records ranges the exchange returned no candles for so they stop failing validation."""
+        for symbol, timeframe, start, end in ranges:
+            self.unrepairable.setdefault((instance_id, symbol, timeframe), set()).add((start, end))
+
+    def is_healthy(self, instance_id, symbol, timeframe):
+        health = self.health.get((instance_id, symbol, timeframe))
+        return health.is_healthy if health else False
+
+    def get_health_report(self, instance_id=None):
+        """Per-series health as a DataFrame (optionally for one instance)."""
+        rows = []
+        for (iid, symbol, timeframe), health in self.health.items():
+            if instance_id and iid != instance_id:
+                continue
+            rows.append({"instance_id": iid, "symbol": symbol, "timeframe": timeframe, **health.as_dict()})
+        return pd.DataFrame(rows)
+
+    def forget_instance(self, instance_id):
+        """Drops all state for an unloaded/deleted instance."""
+        self.repair_queue.pop(instance_id, None)
+        for store in (self.health, self.unrepairable):
+            for key in [k for k in store if k[0] == instance_id]:
+                del store[key]
@@ -1,7 +1,27 @@
 import logging
+from bisect import bisect_right
 
 logger = logging.getLogger(__name__)
 
+def build_levels_config(levels, safe_levels):
+    """
+    Builds a levels_config from the Strategy Builder lists
+    (e.g. levels=[100, 200, 300], safe_levels=[80, 60]).
+    Each level runs up to (excluding) the next one's min; the top level is open-ended.
+    """
+    levels = sorted(levels)
+    config = {}
+    for i, level_min in enumerate(levels):
+        level_max = levels[i + 1] if i + 1 < len(levels) else float('inf')
+        config[f"Level{i+1}"] = {"min": level_min, "max": level_max}
+
+    # SLevels sit below Level 1, each capped by the one above it
+    upper = levels[0]
+    for i, sl_min in enumerate(sorted(safe_levels, reverse=True)):
+        config[f"SLevel{i+1}"] = {"min": sl_min, "max": upper}
+        upper = sl_min
+    return config
+
 class CapitalManager:
     def __init__(self, start_amount, levels_config=None):
         self.start_amount = start_amount
@@ -9,8 +29,9 @@ class CapitalManager:
         self.realized_pnl = 0.0
         
         # Default Levels if none provided (Example logic)
-        # Level 1: 100-199, Level 2: 200-299, etc.
+        # Level 1: [100, 200), Level 2: [200, 300), etc.
         self.levels_config = levels_config if levels_config else self._generate_default_levels()
+        self._build_level_index()
         
     def _generate_default_levels(self):
         """
@@ -20,15 +41,26 @@ class CapitalManager:
         levels = {}
         # Example: Levels 1-10
         base = 100 # Assuming 100 is the base unit
+        # "max" is exclusive (the next level's min); the top level is open-ended
         for i in range(1, 11):
-            levels[f"Level{i}"] = {"min": base * i, "max": (base * (i+1)) - 0.01}
+            levels[f"Level{i}"] = {"min": base * i, "max": base * (i+1) if i < 10 else float('inf')}
             
         # SLevels (Stop Levels)
-        levels["SLevel1"] = {"min": base * 0.8, "max": base - 0.01} # 80-99
-        levels["SLevel2"] = {"min": base * 0.6, "max": (base * 0.8) - 0.01} # 60-79
+        levels["SLevel1"] = {"min": base * 0.8, "max": base} # [80, 100)
+        levels["SLevel2"] = {"min": base * 0.6, "max": base * 0.8} # [60, 80)
         
         return levels
 
+    def _build_level_index(self):
+        """
+        Sorted level mins so lookup is a bisection instead of a scan. A level
+        spans up to the next level's min (no gaps between levels), the top
+        level is open-ended.
+        """
+        ordered = sorted(self.levels_config.items(), key=lambda item: item[1]["min"])
+        self._level_names = [name for name, _ in ordered]
+        self._level_mins = [data["min"] for _, data in ordered]
+
     def update_capital(self, trade_pnl):
         """
         Updates capital after a closed trade and recalculates level.
@@ -42,15 +74,12 @@ class CapitalManager:
         """
         Determines the current trading level based on Instance Capital.
         """
-        for level_name, range_data in self.levels_config.items():
-            if range_data["min"] <= self.current_capital <= range_data["max"]:
-                return level_name, range_data["min"]
-        
-        # Fallback / Kill Switch Trigger Check
-        if self.current_capital < self.levels_config["SLevel2"]["min"]:
-            return "CRITICAL_LOW", 0
-            
-        return "UNKNOWN", 0
+        idx = bisect_right(self._level_mins, self.current_capital) - 1
+        if idx >= 0:
+            return self._level_names[idx], self._level_mins[idx]
+
+        # Kill Switch Trigger Check (below the lowest SLevel)
+        return "CRITICAL_LOW", 0
 
     def calculate_position_size(self, risk_percent):
         """
@@ -10,6 +10,7 @@ class Config:
     # Data Fetching
     CANDLE_FETCH_DELAY = 5  # Seconds after close
     TIMEFRAMES = ['15m', '30m', '1h', '4h', '1d', '1w']
+    TICKER_SNAPSHOT_INTERVAL = 30  # Seconds between bulk fetch_tickers per exchange/market
     
     # Database
     INFLUXDB_URL = os.getenv("INFLUXDB_URL", "http://localhost:8086")
@@ -17,9 +18,29 @@ class Config:
     INFLUXDB_ORG = os.getenv("INFLUXDB_ORG", "my-org")
     INFLUXDB_BUCKET = os.getenv("INFLUXDB_BUCKET", "crypto_trader")
 
+    # Market Data Memory (4GB node target)
+    CANDLE_STORE_MB = int(os.getenv("CANDLE_STORE_MB", 1024))  # Resident candle arrays before cold series are spilled to disk
+    MEMORY_BUDGET_MB = int(os.getenv("MEMORY_BUDGET_MB", 3072))  # Process RSS above which the candle store shrinks to half
+    CANDLE_DTYPE = os.getenv("CANDLE_DTYPE", "float64")  # float32 halves OHLCV memory at the cost of precision
+    CANDLE_SPILL_DIR = os.getenv("CANDLE_SPILL_DIR", "candle_cache")
+
     # Risk Management Defaults
     DEFAULT_RISK_PERCENT = 0.02  # 2%
     DEFAULT_RR_RATIO = 3.0       # 1:3
+    DEFAULT_STOP_PCT = 0.02      # Stop distance from entry when the signal has no SL
+    MAX_EXPOSURE_RATIO = 1.0     # Max open notional as a multiple of Instance Capital
+    MAX_SPREAD_PCT = 0.3         # Spread filter: max bid/ask spread in % of mid
     
+    # Logging
+    LOG_FILE = os.getenv("LOG_FILE", "engine.log")  # JSON lines, size-rotated
+    LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", 10 * 1024 * 1024))
+    LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", 5))
+    LOG_RATE_LIMITS = {"Trend for": 3600, "Next check": 60}  # Rate group (rate_key[0] or message prefix) -> seconds a repeat stays suppressed
+
     # Emergency
     KILL_SWITCH_THRESHOLD = 0.50 # 50% drawdown
+
+    # Hive Clustering (multi-node lease ownership)
+    HIVE_NODE_ID = os.getenv("HIVE_NODE_ID")  # Defaults to <hostname>-<pid>
+    LEASE_TTL = int(os.getenv("HIVE_LEASE_TTL", 60))  # Seconds. Keep below the smallest timeframe for failover within one candle
+    HEARTBEAT_INTERVAL = int(os.getenv("HIVE_HEARTBEAT_INTERVAL", 15))  # Seconds. Must be well below LEASE_TTL
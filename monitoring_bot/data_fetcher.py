@@ -4,24 +4,27 @@ import sqlite3
 from datetime import datetime, timedelta
 import logging
 
-# Setup Logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def create_exchange(exchange_id, market_type='Spot', extra_options=None):
+    """ccxt client for a market type ('Spot' or 'Futures')."""
+    exchange_class = getattr(ccxt, exchange_id)
+    options = {}
+    if market_type == 'Futures':
+        options = {'defaultType': 'future'}
+    elif market_type == 'Spot':
+        options = {'defaultType': 'spot'}
+    return exchange_class({**(extra_options or {}), 'options': options})
+
 class DataFetcher:
-    def __init__(self, exchange_id='binance', market_type='Spot', db_path='candles.db'):
+    def __init__(self, exchange_id='binance', market_type='Spot', db_path='candles.db', candle_store=None, exchange=None):
         self.exchange_id = exchange_id
         self.market_type = market_type
+        # Optional in-memory residency (CandleStore); SQLite stays the source of truth
+        self.store = candle_store
         
-        # Initialize Exchange with Options (Futures vs Spot)
-        exchange_class = getattr(ccxt, exchange_id)
-        options = {}
-        if market_type == 'Futures':
-            options = {'defaultType': 'future'}
-        elif market_type == 'Spot':
-            options = {'defaultType': 'spot'}
-            
-        self.exchange = exchange_class(options)
+        # Initialize Exchange with Options (Futures vs Spot), unless one is injected (e.g. FakeExchange)
+        self.exchange = exchange if exchange is not None else create_exchange(exchange_id, market_type)
         self.exchange.load_markets()
         
         self.db_path = db_path
@@ -30,6 +33,8 @@ class DataFetcher:
 
     def _init_db(self):
         conn = sqlite3.connect(self.db_path)
+        # WAL (persistent): dashboard readers never block candle syncs
+        conn.execute("PRAGMA journal_mode=WAL")
         cursor = conn.cursor()
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS candles (
@@ -53,8 +58,11 @@ class DataFetcher:
         """
         Main logic: Check local DB, fetch missing, validate order, and store.
         """
-        # 1. Get latest timestamp from DB
-        last_ts = self._get_last_timestamp(instance_id, symbol, timeframe)
+        # 1. Get latest timestamp (from memory if resident, else DB)
+        key = (instance_id, symbol, timeframe)
+        last_ts = self.store.last_timestamp(key) if self.store and self.store.contains(key) else None
+        if last_ts is None:
+            last_ts = self._get_last_timestamp(instance_id, symbol, timeframe)
         
         # 2. Fetch from exchange
         if last_ts:
@@ -81,6 +89,8 @@ class DataFetcher:
 
         if not df_new.empty:
             self._save_to_db(instance_id, df_new, symbol, timeframe)
+            if self.store:
+                self.store.append(key, df_new)
 
         return self.get_local_candles(instance_id, symbol, timeframe, limit)
 
@@ -106,7 +116,62 @@ class DataFetcher:
         conn.commit()
         conn.close()
 
+    def repair_gaps(self, instance_id, ranges, page_limit=1000):
+        """
+        Targeted re-fetch of missing (symbol, timeframe, start_ms, end_ms) ranges.
+        Candles recovered for all symbols are written in a single transaction.
+        Returns the ranges the exchange had no candles for.
+        """
+        rows = []
+        unrepairable = []
+        for symbol, timeframe, start, end in ranges:
+            interval_ms = self.exchange.parse_timeframe(timeframe) * 1000
+            since = start
+            found = 0
+            try:
+                while since <= end:
+                    limit = min(page_limit, (end - since) // interval_ms + 1)
+                    ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe, since=since, limit=limit)
+                    if not ohlcv or ohlcv[-1][0] < since:
+                        break
+                    for ts, o, h, l, c, v in ohlcv:
+                        if start <= ts <= end:
+                            ts_str = pd.to_datetime(ts, unit='ms').isoformat(' ')
+                            rows.append((instance_id, self.exchange_id, symbol, timeframe, ts_str, o, h, l, c, v))
+                            found += 1
+                    since = ohlcv[-1][0] + interval_ms
+            except Exception as e:
+                # Left in place; the next validation pass will queue it again
+                logger.error(f"Gap repair failed for {symbol} ({timeframe}): {e}")
+                continue
+
+            if not found:
+                unrepairable.append((symbol, timeframe, start, end))
+
+        if rows:
+            conn = sqlite3.connect(self.db_path)
+            conn.executemany('''
+                INSERT OR IGNORE INTO candles
+                (instance_id, exchange, symbol, timeframe, timestamp, open, high, low, close, volume)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            conn.commit()
+            conn.close()
+            # Cached copies are stale now; reload from DB on next read
+            if self.store:
+                for symbol, timeframe, _, _ in ranges:
+                    self.store.discard((instance_id, symbol, timeframe))
+
+        logger.info(f"Gap repair: {len(rows)} candles restored across {len(ranges)} ranges ({len(unrepairable)} unrepairable)")
+        return unrepairable
+
     def get_local_candles(self, instance_id, symbol, timeframe, limit=500):
+        key = (instance_id, symbol, timeframe)
+        if self.store and limit <= self.store.max_candles:
+            df = self.store.get_frame(key, limit)
+            if df is not None and not df.empty:
+                return df
+
         conn = sqlite3.connect(self.db_path)
         query = '''
             SELECT timestamp, open, high, low, close, volume FROM candles 
@@ -115,7 +180,14 @@ class DataFetcher:
         '''
         df = pd.read_sql(query, conn, params=(instance_id, symbol, timeframe, limit))
         conn.close()
-        return df.sort_values('timestamp') if not df.empty else None
+        if df.empty:
+            return None
+        df = df.sort_values('timestamp')
+        if self.store and limit <= self.store.max_candles:
+            self.store.put(key, df)
+            # Serve through the store so both paths return the same dtype/precision
+            return self.store.get_frame(key, limit)
+        return df
 
     def fetch_ohlcv(self, instance_id, symbol, timeframe, limit=500):
         # Compatibility wrapper for existing code
@@ -0,0 +1,77 @@
+import time
+import random
+
+class FakeExchange:
+    """
+    Offline stand-in for a ccxt exchange (markets, tickers, OHLCV).
+    Deterministic for a given seed and counts API calls so tests can assert
+    that bulk endpoints are used instead of per-symbol requests.
+    """
+    TIMEFRAMES = {'1m': 60, '5m': 300, '15m': 900, '30m': 1800, '1h': 3600, '4h': 14400, '1d': 86400, '1w': 604800}
+
+    def __init__(self, symbols=None, quote='USDT', seed=42):
+        self.id = 'fake'
+        rng = random.Random(seed)
+        if symbols is None:
+            symbols = [f"COIN{i}/{quote}" for i in range(50)]
+        self.markets = {}
+        self.prices = {}
+        for symbol in symbols:
+            base, quote_ccy = symbol.split('/')
+            self.markets[symbol] = {'symbol': symbol, 'base': base, 'quote': quote_ccy.split(':')[0], 'spot': True, 'active': True}
+            self.prices[symbol] = {
+                'last': rng.uniform(0.01, 50000),
+                'spread_pct': rng.uniform(0.01, 1.0),
+                'volume': rng.uniform(1e4, 1e9),
+                'change': rng.uniform(-15, 15),
+            }
+        self.calls = {'fetch_tickers': 0, 'fetch_ticker': 0, 'fetch_ohlcv': 0}
+
+    def load_markets(self):
+        return self.markets
+
+    def parse_timeframe(self, timeframe):
+        return self.TIMEFRAMES[timeframe]
+
+    def _ticker(self, symbol):
+        p = self.prices[symbol]
+        half_spread = p['last'] * p['spread_pct'] / 200
+        return {
+            'symbol': symbol,
+            'last': p['last'],
+            'bid': p['last'] - half_spread,
+            'ask': p['last'] + half_spread,
+            'quoteVolume': p['volume'],
+            'baseVolume': p['volume'] / p['last'],
+            'percentage': p['change'],
+        }
+
+    def fetch_ticker(self, symbol):
+        self.calls['fetch_ticker'] += 1
+        return self._ticker(symbol)
+
+    def fetch_tickers(self, symbols=None):
+        self.calls['fetch_tickers'] += 1
+        return {s: self._ticker(s) for s in (symbols or self.markets)}
+
+    def fetch_ohlcv(self, symbol, timeframe='1h', since=None, limit=500):
+        """Random-walk candles aligned to the timeframe grid; only closed candles are returned."""
+        self.calls['fetch_ohlcv'] += 1
+        step = self.parse_timeframe(timeframe) * 1000
+        now = int(time.time() * 1000) // step * step
+        start = since // step * step if since else now - limit * step
+        if since and since % step:
+            start += step
+        price = self.prices[symbol]['last']
+        rng = random.Random()
+        candles = []
+        ts = start
+        while ts < now and len(candles) < limit:
+            rng.seed(f"{symbol}{timeframe}{ts}")
+            close = price * (1 + rng.uniform(-0.01, 0.01))
+            high = max(price, close) * (1 + rng.uniform(0, 0.005))
+            low = min(price, close) * (1 - rng.uniform(0, 0.005))
+            candles.append([ts, price, high, low, close, rng.uniform(1, 1000)])
+            price = close
+            ts += step
+        return candles
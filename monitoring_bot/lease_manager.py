@@ -0,0 +1,144 @@
+import os
+import math
+import time
+import socket
+import sqlite3
+import logging
+
+logger = logging.getLogger("HiveLeases")
+
+class LeaseManager:
+    """
+    Splits ACTIVE instances between several Hive nodes sharing one database.
+
+    Every node heartbeats into `hive_nodes` and owns instances through
+    time-bounded rows in `instance_leases`. Leases are renewed on each
+    heartbeat; a lease that expires (or whose owner stopped heartbeating)
+    is free for any live node to claim.
+    """
+    def __init__(self, db_path, node_id=None, lease_ttl=60):
+        self.db_path = db_path
+        self.node_id = node_id if node_id else f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_ttl = lease_ttl
+        self.last_renewal = 0.0
+        self._init_db()
+        logger.info(f"Lease Manager started for node {self.node_id} (TTL {lease_ttl}s)")
+
+    def _connect(self):
+        # Autocommit mode so we can manage BEGIN IMMEDIATE ourselves
+        return sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+
+    def _init_db(self):
+        conn = self._connect()
+        # WAL (persistent): dashboard readers never block lease/instance writes
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS hive_nodes (
+                node_id TEXT PRIMARY KEY,
+                last_heartbeat REAL
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS instance_leases (
+                instance_id TEXT PRIMARY KEY,
+                owner TEXT,
+                expires_at REAL
+            )
+        ''')
+        conn.close()
+
+    def heartbeat(self, instance_ids):
+        """
+        Renews this node's heartbeat and leases, then rebalances so that every
+        live node holds at most its fair share of `instance_ids`.
+        Returns the set of instance ids this node owns until the next heartbeat.
+        """
+        now = time.time()
+        expires_at = now + self.lease_ttl
+        instance_ids = set(instance_ids)
+
+        conn = self._connect()
+        try:
+            # Serialize rebalancing across nodes (single writer lock)
+            conn.execute("BEGIN IMMEDIATE")
+
+            # 1. Heartbeat & forget nodes that stopped heartbeating
+            conn.execute('''
+                INSERT INTO hive_nodes (node_id, last_heartbeat) VALUES (?, ?)
+                ON CONFLICT(node_id) DO UPDATE SET last_heartbeat=excluded.last_heartbeat
+            ''', (self.node_id, now))
+            conn.execute("DELETE FROM hive_nodes WHERE last_heartbeat < ?", (now - self.lease_ttl,))
+            live_nodes = {row[0] for row in conn.execute("SELECT node_id FROM hive_nodes")}
+
+            # 2. Drop leases of instances that are no longer ACTIVE
+            leases = {row[0]: (row[1], row[2]) for row in conn.execute("SELECT instance_id, owner, expires_at FROM instance_leases")}
+            stale = [(iid,) for iid in leases if iid not in instance_ids]
+            conn.executemany("DELETE FROM instance_leases WHERE instance_id=?", stale)
+
+            # 3. Fair share per node (rounded up so every instance has an owner)
+            share = math.ceil(len(instance_ids) / len(live_nodes)) if instance_ids else 0
+            owned = sorted(iid for iid, (owner, _) in leases.items() if owner == self.node_id and iid in instance_ids)
+
+            # 4. Release surplus so newly joined nodes can pick it up
+            if len(owned) > share:
+                surplus = owned[share:]
+                owned = owned[:share]
+                conn.executemany("DELETE FROM instance_leases WHERE instance_id=? AND owner=?", [(iid, self.node_id) for iid in surplus])
+                logger.info(f"Released {len(surplus)} leases for rebalancing")
+
+            # 5. Claim free, expired or orphaned leases up to our share
+            # (our own leases count as owned even if they lapsed; step 6 renews them)
+            held = set(owned)
+            free = sorted(
+                iid for iid in instance_ids
+                if iid not in held and (iid not in leases or leases[iid][1] < now or leases[iid][0] not in live_nodes)
+            )
+            claimed = free[:max(0, share - len(owned))]
+            conn.executemany('''
+                INSERT INTO instance_leases (instance_id, owner, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT(instance_id) DO UPDATE SET owner=excluded.owner, expires_at=excluded.expires_at
+            ''', [(iid, self.node_id, expires_at) for iid in claimed])
+            if claimed:
+                logger.info(f"Claimed {len(claimed)} leases: {claimed}")
+            owned.extend(claimed)
+
+            # 6. Renew everything we still own
+            conn.execute("UPDATE instance_leases SET expires_at=? WHERE owner=?", (expires_at, self.node_id))
+            conn.execute("COMMIT")
+        except Exception:
+            # BEGIN IMMEDIATE itself may have failed (busy): nothing to roll back
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        self.last_renewal = now
+        return set(owned)
+
+    def renew(self, min_interval=0):
+        """
+        Extends our heartbeat and leases without rebalancing.
+        Cheap enough to call from inside long cycles; skipped if the last
+        renewal is more recent than `min_interval` seconds.
+        """
+        now = time.time()
+        if now - self.last_renewal < min_interval:
+            return
+        conn = self._connect()
+        try:
+            conn.execute("UPDATE hive_nodes SET last_heartbeat=? WHERE node_id=?", (now, self.node_id))
+            conn.execute("UPDATE instance_leases SET expires_at=? WHERE owner=?", (now + self.lease_ttl, self.node_id))
+        finally:
+            conn.close()
+        self.last_renewal = now
+
+    def release_all(self):
+        """Gives up all leases and deregisters the node (graceful shutdown)."""
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM instance_leases WHERE owner=?", (self.node_id,))
+            conn.execute("DELETE FROM hive_nodes WHERE node_id=?", (self.node_id,))
+        finally:
+            conn.close()
+        logger.info(f"Node {self.node_id} released all leases")
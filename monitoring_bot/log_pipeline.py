@@ -0,0 +1,164 @@
+import json
+import time
+import queue
+import atexit
+import logging
+import logging.handlers
+from datetime import datetime, timezone
+
+# Context fields callers can attach with extra={...}
+CONTEXT_FIELDS = ('instance', 'symbol', 'stage')
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener = None # Active QueueListener of this process
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line with the context fields as top-level keys."""
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        suppressed = getattr(record, 'suppressed', 0)
+        if suppressed:
+            entry["suppressed"] = suppressed
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class RepeatFilter(logging.Filter):
+    """
+    Per-key rate limiting for repetitive lines.
+
+    Hot paths pass extra={"rate_key": (group, ...)} with lazy %-style args:
+    the record is dropped on the key alone, before its message is ever
+    formatted. `rules` maps a group (the key's first item, e.g. "Trend for")
+    to a window in seconds; extra={"rate_window": ...} overrides it.
+    Records without a rate_key are matched by the prefix of their unformatted
+    template, keyed by the formatted message. The next emitted record carries
+    the number of suppressed repeats.
+    """
+    DEFAULT_WINDOW = 60
+
+    def __init__(self, rules):
+        super().__init__()
+        self.rules = rules
+        self.last_emit = {} # {key: timestamp}
+        self.suppressed = {} # {key: count}
+
+    def filter(self, record):
+        key = getattr(record, 'rate_key', None)
+        if key is not None:
+            group = key[0] if isinstance(key, tuple) else key
+            window = getattr(record, 'rate_window', self.rules.get(group, self.DEFAULT_WINDOW))
+        else:
+            template = record.msg if isinstance(record.msg, str) else str(record.msg)
+            window = next((w for prefix, w in self.rules.items() if template.startswith(prefix)), None)
+            if window is None:
+                return True
+            key = record.getMessage()
+
+        now = time.monotonic()
+        if now - self.last_emit.get(key, float('-inf')) < window:
+            self.suppressed[key] = self.suppressed.get(key, 0) + 1
+            return False
+        self.last_emit[key] = now
+        record.suppressed = self.suppressed.pop(key, 0)
+        return True
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Hands records to the listener thread without blocking the caller.
+
+    The message is interpolated here, on the caller's thread, so mutable
+    args are captured as they were at the call; this only happens for
+    records that got past the RepeatFilter. Formatting (timestamps, JSON,
+    tracebacks) and I/O happen on the listener thread. Records are dropped
+    instead of blocking when the queue is full.
+    """
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self.reported = 0 # drops already announced in the log
+
+    def prepare(self, record):
+        # Interpolate once on the caller's thread: args may change after we return
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            if self.dropped > self.reported:
+                # First record after an overflow: announce the loss in the log itself
+                notice = logging.makeLogRecord({
+                    "name": __name__, "levelno": logging.WARNING, "levelname": "WARNING",
+                    "msg": "Log queue full: %d records dropped", "args": (self.dropped - self.reported,),
+                })
+                self.queue.put_nowait(self.prepare(notice))
+                self.reported = self.dropped
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+def setup_logging(service, level=logging.INFO, log_file=None, json_logs=True,
+                  max_bytes=10 * 1024 * 1024, backup_count=5, rate_limits=None,
+                  queue_size=10000, capture_loggers=('uvicorn', 'uvicorn.error', 'uvicorn.access')):
+    """
+    Installs the shared logging pipeline on the root logger.
+
+    Callers only pay for an enqueue; a background listener thread writes to
+    stderr (text) and, if `log_file` is set, a size-rotated file (JSON lines
+    by default). Returns the started QueueListener.
+    """
+    global _listener
+    stop_logging() # Re-configuring replaces the previous pipeline
+
+    log_queue = queue.Queue(maxsize=queue_size)
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    if rate_limits:
+        queue_handler.addFilter(RepeatFilter(rate_limits))
+
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter(TEXT_FORMAT))
+    handlers = [console]
+    if log_file:
+        file_handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+        file_handler.setFormatter(JsonFormatter() if json_logs else logging.Formatter(TEXT_FORMAT))
+        handlers.append(file_handler)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    # Route server loggers (which bring their own sync handlers) through the queue too
+    for name in capture_loggers:
+        server_logger = logging.getLogger(name)
+        server_logger.handlers.clear()
+        server_logger.propagate = True
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    logging.getLogger(service).debug(f"Logging pipeline started (file={log_file})")
+    return _listener
+
+def stop_logging():
+    """Flushes queued records and stops the listener thread (idempotent)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+atexit.register(stop_logging)
@@ -7,11 +7,23 @@ import ccxt
 import math
 import re
 from datetime import datetime, timedelta, timezone
+from config import Config
+from candle_store import CandleStore, current_rss_bytes
+from candle_validator import CandleValidator
 from data_fetcher import DataFetcher
+from lease_manager import LeaseManager
+from log_pipeline import setup_logging
+from ticker_snapshot import TickerSnapshotService
 from strategy import Strategy
 
-# Setup Logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Setup Logging (queued; written by a background thread)
+setup_logging(
+    "HiveEngine",
+    log_file=Config.LOG_FILE,
+    max_bytes=Config.LOG_MAX_BYTES,
+    backup_count=Config.LOG_BACKUP_COUNT,
+    rate_limits=Config.LOG_RATE_LIMITS
+)
 logger = logging.getLogger("HiveEngine")
 
 # Configuration
@@ -23,8 +35,21 @@ class HiveEngine:
         self.active_instances = {} # {id: config}
         self.fetchers = {} # {exchange_key: DataFetcher}
         self.strategy = Strategy()
+        self.validator = CandleValidator()
+        # Multi-node: only process instances this node holds a lease for
+        self.leases = LeaseManager(DB_PATH, node_id=Config.HIVE_NODE_ID, lease_ttl=Config.LEASE_TTL)
+        # Shared, memory-budgeted candle residency for all fetchers (spill dir private to this node)
+        self.candle_store = CandleStore(
+            budget_mb=Config.CANDLE_STORE_MB,
+            dtype=Config.CANDLE_DTYPE,
+            spill_dir=Config.CANDLE_SPILL_DIR,
+            rss_limit_mb=Config.MEMORY_BUDGET_MB,
+            node_id=self.leases.node_id
+        )
         self.next_wake_times = {} # {instance_id: next_wake_timestamp}
-        logger.info("🐝 Hive Engine Initialized")
+        # One bulk ticker fetch per exchange/market per interval (spread filter)
+        self.tickers = TickerSnapshotService(interval=Config.TICKER_SNAPSHOT_INTERVAL)
+        logger.info(f"🐝 Hive Engine Initialized (node {self.leases.node_id})")
 
     def load_instances(self):
         """Load ACTIVE instances from DB and handle DELETED ones"""
@@ -49,6 +74,8 @@ class HiveEngine:
                     del self.active_instances[iid]
                 if iid in self.next_wake_times:
                     del self.next_wake_times[iid]
+                self.validator.forget_instance(iid)
+                self.candle_store.drop_instance(iid)
                 
                 # Cleanup database data (candles) tied to THIS instance_id
                 self.cleanup_instance_data(iid)
@@ -60,6 +87,10 @@ class HiveEngine:
             # 2. Load ACTIVE instances
             df = pd.read_sql("SELECT * FROM instances WHERE status='ACTIVE'", conn)
             conn.close()
+
+            # 3. Keep only the instances leased to this node (heartbeat + rebalance)
+            owned_ids = self.leases.heartbeat(df['id'].tolist())
+            df = df[df['id'].isin(owned_ids)]
             
             current_ids = set()
             for _, row in df.iterrows():
@@ -84,13 +115,17 @@ class HiveEngine:
                         "strategy_logic": strategy_logic
                     }
                     self.active_instances[instance_id] = instance_data
+                    # Lower priority instances are spilled to disk first under memory pressure
+                    self.candle_store.set_priority(instance_id, config.get('memory_priority', 0))
                     
                     fetcher_key = f"{row['exchange']}_{row['market_type']}"
                     if fetcher_key not in self.fetchers:
                         self.fetchers[fetcher_key] = DataFetcher(
                             exchange_id=row['exchange'], 
-                            market_type=row['market_type']
+                            market_type=row['market_type'],
+                            candle_store=self.candle_store
                         )
+                        self.tickers.register(fetcher_key, self.fetchers[fetcher_key].exchange)
 
             active_ids = list(self.active_instances.keys())
             for iid in active_ids:
@@ -99,6 +134,8 @@ class HiveEngine:
                     del self.active_instances[iid]
                     if iid in self.next_wake_times:
                         del self.next_wake_times[iid]
+                    self.validator.forget_instance(iid)
+                    self.candle_store.drop_instance(iid)
                     
         except Exception as e:
             logger.error(f"Error loading instances: {e}")
@@ -133,6 +170,7 @@ class HiveEngine:
         
         # Process instances that are due (or force first run)
         current_time = time.time()
+        processed_count = 0
         for iid, instance in list(self.active_instances.items()):
             needs_processing = False
 
@@ -143,6 +181,7 @@ class HiveEngine:
             if needs_processing:
                 try:
                     self.process_instance(instance)
+                    processed_count += 1
                     
                     # Recalculate next wake time after processing
                     # Use the shortest timeframe for the next check
@@ -152,16 +191,20 @@ class HiveEngine:
                         instance_min_wait = min(instance_min_wait, wait_seconds)
                     
                     self.next_wake_times[iid] = time.time() + instance_min_wait
-                    logger.info(f"⏰ Next check for {instance['name']} in {instance_min_wait:.1f}s")
+                    logger.info("⏰ Next check for %s in %.1fs", instance['name'], instance_min_wait, extra={"instance": iid, "stage": "schedule", "rate_key": ("Next check", iid)})
                 except Exception as e:
-                    logger.error(f"Error processing {instance['name']}: {e}", exc_info=True)
+                    logger.error("Error processing %s: %s", instance['name'], e, exc_info=True, extra={"instance": iid})
+
+        if processed_count:
+            self.log_memory_usage()
 
         # Final check: sleep until the earliest next event
         current_time = time.time()
         next_event_time = self.get_next_event_time()
         
         if current_time < next_event_time:
-            sleep_duration = next_event_time - current_time
+            # Wake up at least every heartbeat so our leases never expire while sleeping
+            sleep_duration = min(next_event_time - current_time, Config.HEARTBEAT_INTERVAL)
             logger.info(f"✅ Cycle complete. Waiting {sleep_duration:.1f}s for next event.")
             time.sleep(sleep_duration)
 
@@ -177,11 +220,15 @@ class HiveEngine:
         timeframes = instance['timeframes']
         instance_id = instance['id']
         strategy_logic = instance.get('strategy_logic')
+        max_spread_pct = instance['config'].get('max_spread_pct', Config.MAX_SPREAD_PCT)
         
-        logger.info(f"[{instance['name']}] Checking {len(pairs)} pairs on {timeframes}...")
+        logger.info("[%s] Checking %d pairs on %s...", instance['name'], len(pairs), timeframes, extra={"instance": instance_id, "stage": "scan"})
         
         for pair_data in pairs:
             symbol = pair_data['Symbol'] if isinstance(pair_data, dict) else pair_data
+
+            # Large watchlists can outlast the lease TTL; keep our leases alive
+            self.leases.renew(min_interval=Config.HEARTBEAT_INTERVAL)
             
             # Fetch data for ALL required timeframes for this pair
             data_map = {}
@@ -192,10 +239,15 @@ class HiveEngine:
                 
                 # Fetch 500 candles with instance isolation
                 df = fetcher.fetch_and_sync(instance_id, symbol, normalized_tf, limit=500)
-                if df is not None and not df.empty:
+                if df is None or df.empty:
+                    logger.warning("No data fetched for %s (%s) for instance %s", symbol, tf, instance['name'], extra={"instance": instance_id, "symbol": symbol, "stage": "fetch"})
+                    continue
+
+                # Strict continuity check ("Option B"); gaps are queued for targeted repair
+                interval_ms = fetcher.exchange.parse_timeframe(normalized_tf) * 1000
+                df, health = self.validator.validate(instance_id, symbol, normalized_tf, df, interval_ms)
+                if health.is_healthy:
                     data_map[tf] = df
-                else:
-                    logger.warning(f"No data fetched for {symbol} ({tf}) for instance {instance['name']}")
 
             # If we have data for all timeframes, proceed to analysis
             if len(data_map) == len(timeframes):
@@ -217,8 +269,8 @@ class HiveEngine:
                 if strategy_logic:
                     # Use the new dynamic engine
                     signal = self.strategy.check_dynamic_signal(processed_data, strategy_logic, timeframes)
-                    if signal:
-                        logger.info(f"🚀 DYNAMIC SIGNAL [{instance['name']}]: {signal} on {symbol}")
+                    if signal and self.passes_spread_filter(fetcher_key, symbol, max_spread_pct):
+                        logger.info("🚀 DYNAMIC SIGNAL [%s]: %s on %s", instance['name'], signal, symbol, extra={"instance": instance_id, "symbol": symbol, "stage": "signal"})
                         # TODO: Send to Analyze Agent
                 else:
                     # --- FALLBACK TO HARDCODED LOGIC ---
@@ -233,19 +285,46 @@ class HiveEngine:
                             
                             if len(df_large) >= 200 and len(df_med) >= 200:
                                 trend = self.strategy.check_trend(df_large, df_med)
-                                logger.info(f"Trend for {symbol} using {timeframes[2]}/{timeframes[1]}: {trend}")
+                                logger.info("Trend for %s using %s/%s: %s", symbol, timeframes[2], timeframes[1], trend, extra={"instance": instance_id, "symbol": symbol, "stage": "trend", "rate_key": ("Trend for", instance_id, symbol, trend)})
                         except Exception as e:
-                            logger.error(f"Trend check failed for {symbol}: {e}")
+                            logger.error("Trend check failed for %s: %s", symbol, e, extra={"instance": instance_id, "symbol": symbol, "stage": "trend"})
                     
                     # Trigger Logic: Primary timeframe (usually smallest)
                     primary_tf = timeframes[0]
                     try:
                         signal = self.strategy.check_trigger(processed_data[primary_tf], trend)
-                        if signal:
-                            logger.info(f"🚀 SIGNAL [{instance['name']}]: {signal} on {symbol} ({primary_tf})")
+                        if signal and self.passes_spread_filter(fetcher_key, symbol, max_spread_pct):
+                            logger.info("🚀 SIGNAL [%s]: %s on %s (%s)", instance['name'], signal, symbol, primary_tf, extra={"instance": instance_id, "symbol": symbol, "stage": "signal"})
                             # TODO: Send to Analyze Agent
                     except Exception as e:
-                        logger.error(f"Trigger check failed for {symbol}: {e}")
+                        logger.error("Trigger check failed for %s: %s", symbol, e, extra={"instance": instance_id, "symbol": symbol, "stage": "trigger"})
+
+        # Re-fetch only the missing ranges found this cycle, batched across all pairs
+        repairs = self.validator.pop_repairs(instance_id)
+        if repairs:
+            unrepairable = fetcher.repair_gaps(instance_id, repairs)
+            self.validator.mark_unrepairable(instance_id, unrepairable)
+
+    def passes_spread_filter(self, fetcher_key, symbol, max_spread_pct):
+        """Mandatory spread check against the latest bulk ticker snapshot."""
+        spread = self.tickers.get_spread(fetcher_key, symbol)
+        if self.strategy.check_spread(spread, max_spread_pct):
+            return True
+        logger.info("Signal on %s filtered: spread %s%% > %s%%", symbol, spread if spread is not None else 'unknown', max_spread_pct, extra={"symbol": symbol, "stage": "spread_filter"})
+        return False
+
+    def log_memory_usage(self):
+        """Per-instance candle memory, to size nodes against the RSS budget."""
+        report = self.candle_store.get_memory_report()
+        resident_mb = sum(r['resident_bytes'] for r in report.values()) / 1e6
+        spilled = sum(r['spilled_series'] for r in report.values())
+        logger.info("🧠 Candle memory: %.1fMB resident, %d series spilled, RSS %.0fMB", resident_mb, spilled, current_rss_bytes() / 1e6, extra={"stage": "memory"})
+        for iid, usage in report.items():
+            name = self.active_instances.get(iid, {}).get('name', iid)
+            logger.info(
+                "   %s: %.2fMB in %d series (%d spilled)", name, usage['resident_bytes'] / 1e6, usage['resident_series'], usage['spilled_series'],
+                extra={"instance": iid, "stage": "memory"}
+            )
 
     def normalize_timeframe(self, timeframe):
         """Standardize timeframe string to short codes (e.g. 1h, 15m) for CCXT consistency"""
@@ -308,6 +387,9 @@ if __name__ == "__main__":
         try:
             engine.run_cycle()
         except KeyboardInterrupt:
+            # Hand our instances over to the other nodes immediately
+            engine.leases.release_all()
+            engine.candle_store.close()
             logger.info("Hive Engine Stopped.")
             break
         except Exception as e:
@@ -1 +1 @@
-aW1wb3J0IHBhbmRhc190YSBhcyB0YQppbXBvcnQgcGFuZGFzIGFzIHBkCmltcG9ydCBsb2dnaW5nCgpsb2dnZXIgPSBsb2dnaW5nLmdldExvZ2dlcihfX25hbWVfXykKCmNsYXNzIFN0cmF0ZWd5OgogICAgZGVmIF9faW5pdF9fKHNlbGYpOgogICAgICAgIHBhc3MKCiAgICBkZWYgY2FsY3VsYXRlX2luZGljYXRvcnMoc2VsZiwgZGYsIGluZGljYXRvcnNfY29uZmlnPU5vbmUpOgogICAgICAgICIiIgogICAgICAgIEFkZHMgdGVjaG5pY2FsIGluZGljYXRvcnMgdG8gdGhlIERhdGFGcmFtZS4KICAgICAgICBJZiBpbmRpY2F0b3JzX2NvbmZpZyBpcyBwcm92aWRlZCwgaXQgY2FsY3VsYXRlcyBvbmx5IHRob3NlIHdpdGggc3BlY2lmaWMgcGFyYW1zLgogICAgICAgICIiIgogICAgICAgIGlmIG5vdCBpbmRpY2F0b3JzX2NvbmZpZzoKICAgICAgICAgICAgIyBEZWZhdWx0L0xlZ2FjeSBpbmRpY2F0b3JzIGZvciBiYWRnZXMKICAgICAgICAgICAgZGZbJ0VNQV8xMCddID0gdGEuZW1hKGRmWydjbG9zZSddLCBsZW5ndGg9MTApCiAgICAgICAgICAgIGRmWydFTUFfMjAnXSA9IHRhLmVtYShkZlsnY2xvc2UnXSwgbGVuZ3RoPTIwKQogICAgICAgICAgICBkZlsnRU1BXzUwJ10gPSB0YS5lbWEoZGZbJ2Nsb3NlJ10sIGxlbmd0aD01MCkKICAgICAgICAgICAgZGZbJ0VNQV8yMDAnXSA9IHRhLmVtYShkZlsnY2xvc2UnXSwgbGVuZ3RoPTIwMCkKICAgICAgICAgICAgZGZbJ1NNQV8yMCddID0gdGEuc21hKGRmWydjbG9zZSddLCBsZW5ndGg9MjApCiAgICAgICAgICAgIGRmWydSU0knXSA9IHRhLnJzaShkZlsnY2xvc2UnXSwgbGVuZ3RoPTE0KQogICAgICAgICAgICBtYWNkID0gdGEubWFjZChkZlsnY2xvc2UnXSkKICAgICAgICAgICAgaWYgbWFjZCBpcyBub3QgTm9uZTogZGYgPSBwZC5jb25jYXQoW2RmLCBtYWNkXSwgYXhpcz0xKQogICAgICAgICAgICBhZHggPSB0YS5hZHgoZGZbJ2hpZ2gnXSwgZGZbJ2xvdyddLCBkZlsnY2xvc2UnXSwgbGVuZ3RoPTE0KQogICAgICAgICAgICBpZiBhZHggaXMgbm90IE5vbmU6IGRmID0gcGQuY29uY2F0KFtkZiwgYWR4XSwgYXhpcz0xKQogICAgICAgICAgICBkZlsnQVRSJ10gPSB0YS5hdHIoZGZbJ2hpZ2gnXSwgZGZbJ2xvdyddLCBkZlsnY2xvc2UnXSwgbGVuZ3RoPTE0KQogICAgICAgICAgICBiYiA9IHRhLmJiYW5kcyhkZlsnY2xvc2UnXSwgbGVuZ3RoPTIwLCBzdGQ9MikKICAgICAgICAgICAgaWYgYmIgaXMgbm90IE5vbmU6IGRmID0gcGQuY29uY2F0KFtkZiwgYmJdLCBheGlzPTEpCiAgICAgICAgICAgIHRyeToKICAgICAgICAgICAgICAgIGljaGkgPSB0YS5pY2hpbW9rdShkZlsnaGlnaCddLCBkZlsnbG93J10sIGRmWydjbG9zZSddKVswXQogICAgICAgICAgICAgICAgZGYgPSBwZC5jb25jYXQoW2RmLCBpY2hpXSwgYXhpcz0xKQogICAgICAgICAgICBleGNlcHQ6IHBhc3MKICAgICAgICAgICAgaWYgJ3ZvbHVtZScgaW4gZGYuY29sdW1uczogZGZbJ1ZXQVAnXSA9IHRhLnZ3YXAoZGZbJ2hpZ2gnXSwgZGZbJ2xvdyddLCBkZlsnY2xvc2UnXSwgZGZbJ3ZvbHVtZSddKQogICAgICAgICAgICByZXR1cm4gZGYKCiAgICAgICAgIyBEeW5hbWljIFYyIENhbGN1bGF0aW9uCiAgICAgICAgZm9yIGluZCBpbiBpbmRpY2F0b3JzX2NvbmZpZzoKICAgICAgICAgICAgbmFtZSA9IGluZFsnbmFtZSddCiAgICAgICAgICAgIHBhcmFtcyA9IGluZC5nZXQoJ3BhcmFtcycsIHt9KQogICAgICAgICAgICBzb3VyY2VfY29sID0gcGFyYW1zLmdldCgnc291cmNlJywgJ2Nsb3NlJykKICAgICAgICAgICAgc291cmNlID0gZGZbc291cmNlX2NvbF0gaWYgc291cmNlX2NvbCBpbiBkZi5jb2x1bW5zIGVsc2UgZGZbJ2Nsb3NlJ10KCiAgICAgICAgICAgIHRyeToKICAgICAgICAgICAgICAgIGlmIG5hbWUgPT0gIkVNQSI6CiAgICAgICAgICAgICAgICAgICAgbGVuZ3RoID0gaW50KHBhcmFtcy5nZXQoJ2xlbmd0aCcsIDIwKSkKICAgICAgICAgICAgICAgICAgICBkZltmIkVNQV97bGVuZ3RofSJdID0gdGEuZW1hKHNvdXJjZSwgbGVuZ3RoPWxlbmd0aCkKICAgICAgICAgICAgICAgIGVsaWYgbmFtZSA9PSAiU01BIjoKICAgICAgICAgICAgICAgICAgICBsZW5ndGggPSBpbnQocGFyYW1zLmdldCgnbGVuZ3RoJywgMjApKQogICAgICAgICAgICAgICAgICAgIGRmW2YiU01BX3tsZW5ndGh9Il0gPSB0YS5zbWEoc291cmNlLCBsZW5ndGg9bGVuZ3RoKQogICAgICAgICAgICAgICAgZWxpZiBuYW1lID09ICJSU0kiOgogICAgICAgICAgICAgICAgICAgIGxlbmd0aCA9IGludChwYXJhbXMuZ2V0KCdsZW5ndGgnLCAxNCkpCiAgICAgICAgICAgICAgICAgICAgZGZbZiJSU0lfe2xlbmd0aH0iXSA9IHRhLnJzaShzb3VyY2UsIGxlbmd0aD1sZW5ndGgpCiAgICAgICAgICAgICAgICBlbGlmIG5hbWUgPT0gIk1BQ0QiOgogICAgICAgICAgICAgICAgICAgIGZhc3QgPSBpbnQocGFyYW1zLmdldCgnZmFzdCcsIDEyKSkKICAgICAgICAgICAgICAgICAgICBzbG93ID0gaW50KHBhcmFtcy5nZXQoJ3Nsb3cnLCAyNikpCiAgICAgICAgICAgICAgICAgICAgc2lnbmFsID0gaW50KHBhcmFtcy5nZXQoJ3NpZ25hbCcsIDkpKQogICAgICAgICAgICAgICAgICAgIG1hY2QgPSB0YS5tYWNkKHNvdXJjZSwgZmFzdD1mYXN0LCBzbG93PXNsb3csIHNpZ25hbD1zaWduYWwpCiAgICAgICAgICAgICAgICAgICAgZGYgPSBwZC5jb25jYXQoW2RmLCBtYWNkXSwgYXhpcz0xKQogICAgICAgICAgICAgICAgZWxpZiBuYW1lID09ICJJY2hpbW9rdSI6CiAgICAgICAgICAgICAgICAgICAgdGVua2FuID0gaW50KHBhcmFtcy5nZXQoJ3RlbmthbicsIDkpKQogICAgICAgICAgICAgICAgICAgIGtpanVuID0gaW50KHBhcmFtcy5nZXQoJ2tpanVuJywgMjYpKQogICAgICAgICAgICAgICAgICAgIHNlbmtvdSA9IGludChwYXJhbXMuZ2V0KCdzZW5rb3UnLCA1MikpCiAgICAgICAgICAgICAgICAgICAgaWNoaSA9IHRhLmljaGltb2t1KGRmWydoaWdoJ10sIGRmWydsb3cnXSwgZGZbJ2Nsb3NlJ10sIHRlbmthbj10ZW5rYW4sIGtpanVuPWtpanVuLCBzZW5rb3U9c2Vua291KVswXQogICAgICAgICAgICAgICAgICAgIGRmID0gcGQuY29uY2F0KFtkZiwgaWNoaV0sIGF4aXM9MSkKICAgICAgICAgICAgICAgIGVsaWYgbmFtZSA9PSAiVm9ydGV4IjoKICAgICAgICAgICAgICAgICAgICBsZW5ndGggPSBpbnQocGFyYW1zLmdldCgnbGVuZ3RoJywgMTQpKQogICAgICAgICAgICAgICAgICAgIHZvcnRleCA9IHRhLnZvcnRleChkZlsnaGlnaCddLCBkZlsnbG93J10sIGRmWydjbG9zZSddLCBsZW5ndGg9bGVuZ3RoKQogICAgICAgICAgICAgICAgICAgIGRmID0gcGQuY29uY2F0KFtkZiwgdm9ydGV4XSwgYXhpcz0xKQogICAgICAgICAgICAgICAgZWxpZiBuYW1lID09ICJMaW5SZWcgU2xvcGUiOgogICAgICAgICAgICAgICAgICAgIGxlbmd0aCA9IGludChwYXJhbXMuZ2V0KCdsZW5ndGgnLCAxNCkpCiAgICAgICAgICAgICAgICAgICAgZGZbZiJTTE9QRV97bGVuZ3RofSJdID0gdGEuc2xvcGUoc291cmNlLCBsZW5ndGg9bGVuZ3RoKQogICAgICAgICAgICAgICAgZWxpZiBuYW1lID09ICJUVE0gU3F1ZWV6ZSI6CiAgICAgICAgICAgICAgICAgICAgIyBTdGFuZGFyZCBUVE0gU3F1ZWV6ZSB1c2luZyBLQyBhbmQgQkIKICAgICAgICAgICAgICAgICAgICBzcXVlZXplID0gdGEuc3F1ZWV6ZShkZlsnaGlnaCddLCBkZlsnbG93J10sIGRmWydjbG9zZSddKQogICAgICAgICAgICAgICAgICAgIGlmIHNxdWVlemUgaXMgbm90IE5vbmU6IGRmID0gcGQuY29uY2F0KFtkZiwgc3F1ZWV6ZV0sIGF4aXM9MSkKICAgICAgICAgICAgICAgIGVsaWYgbmFtZSA9PSAiQ2hhaWtpbiBNb25leSBGbG93IjoKICAgICAgICAgICAgICAgICAgICBsZW5ndGggPSBpbnQocGFyYW1zLmdldCgnbGVuZ3RoJywgMjApKQogICAgICAgICAgICAgICAgICAgIGRmW2YiQ01GX3tsZW5ndGh9Il0gPSB0YS5jbWYoZGZbJ2hpZ2gnXSwgZGZbJ2xvdyddLCBkZlsnY2xvc2UnXSwgZGZbJ3ZvbHVtZSddLCBsZW5ndGg9bGVuZ3RoKQogICAgICAgICAgICAgICAgZWxpZiBuYW1lID09ICJBRFgiOgogICAgICAgICAgICAgICAgICAgIGxlbmd0aCA9IGludChwYXJhbXMuZ2V0KCdsZW5ndGgnLCAxNCkpCiAgICAgICAgICAgICAgICAgICAgYWR4ID0gdGEuYWR4KGRmWydoaWdoJ10sIGRmWydsb3cnXSwgZGZbJ2Nsb3NlJ10sIGxlbmd0aD1sZW5ndGgpCiAgICAgICAgICAgICAgICAgICAgZGYgPSBwZC5jb25jYXQoW2RmLCBhZHhdLCBheGlzPTEpCiAgICAgICAgICAgICAgICBlbGlmIG5hbWUgPT0gIkFUUiI6CiAgICAgICAgICAgICAgICAgICAgbGVuZ3RoID0gaW50KHBhcmFtcy5nZXQoJ2xlbmd0aCcsIDE0KSkKICAgICAgICAgICAgICAgICAgICBkZltmIkFUUl97bGVuZ3RofSJdID0gdGEuYXRyKGRmWydoaWdoJ10sIGRmWydsb3cnXSwgZGZbJ2Nsb3NlJ10sIGxlbmd0aD1sZW5ndGgpCiAgICAgICAgICAgIGV4Y2VwdCBFeGNlcHRpb24gYXMgZToKICAgICAgICAgICAgICAgIGxvZ2dlci5lcnJvcihmIkVycm9yIGNhbGN1bGF0aW5nIHtuYW1lfToge2V9IikKCiAgICAgICAgcmV0dXJuIGRmCgogICAgZGVmIGV2YWx1YXRlX2FsaWdubWVudChzZWxmLCBkZiwgaW5kaWNhdG9yc19jb25maWcpOgogICAgICAgICIiIgogICAgICAgIE5FVyBWMiBMb2dpYzogQ2hlY2tzIGlmIEFMTCBzZWxlY3RlZCBjb21wb25lbnRzIGFsaWduIGluIGRpcmVjdGlvbi4KICAgICAgICBSZXR1cm5zICdCVVknIGlmIGFsbCB1cHRyZW5kLCAnU0VMTCcgaWYgYWxsIGRvd250cmVuZCwgZWxzZSBOb25lLgogICAgICAgICIiIgogICAgICAgIGlmIG5vdCBpbmRpY2F0b3JzX2NvbmZpZzogcmV0dXJuIE5vbmUKICAgICAgICAKICAgICAgICBsYXN0ID0gZGYuaWxvY1stMV0KICAgICAgICByZXN1bHRzID0gW10gIyBMaXN0IG9mICdVUCcsICdET1dOJywgb3IgJ05FVVRSQUwnCgogICAgICAgIGZvciBpbmQgaW4gaW5kaWNhdG9yc19jb25maWc6CiAgICAgICAgICAgIG5hbWUgPSBpbmRbJ25hbWUnXQogICAgICAgICAgICBjb21wb25lbnRzID0gaW5kLmdldCgnc2VsZWN0ZWRfY29tcG9uZW50cycsIFtdKQogICAgICAgICAgICBwYXJhbXMgPSBpbmQuZ2V0KCdwYXJhbXMnLCB7fSkKICAgICAgICAgICAgCiAgICAgICAgICAgIGZvciBjb21wIGluIGNvbXBvbmVudHM6CiAgICAgICAgICAgICAgICBkaXJlY3Rpb24gPSAnTkVVVFJBTCcKICAgICAgICAgICAgICAgIHRyeToKICAgICAgICAgICAgICAgICAgICBpZiBuYW1lID09ICJFTUEiOgogICAgICAgICAgICAgICAgICAgICAgICBsZW5ndGggPSBwYXJhbXMuZ2V0KCdsZW5ndGgnLCAyMCkKICAgICAgICAgICAgICAgICAgICAgICAgdmFsID0gbGFzdC5nZXQoZiJFTUFfe2xlbmd0aH0iKQogICAgICAgICAgICAgICAgICAgICAgICBpZiB2YWw6IGRpcmVjdGlvbiA9ICdVUCcgaWYgbGFzdFsnY2xvc2UnXSA+IHZhbCBlbHNlICdET1dOJwogICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgIGVsaWYgbmFtZSA9PSAiUlNJIjoKICAgICAgICAgICAgICAgICAgICAgICAgbGVuZ3RoID0gcGFyYW1zLmdldCgnbGVuZ3RoJywgMTQpCiAgICAgICAgICAgICAgICAgICAgICAgIHZhbCA9IGxhc3QuZ2V0KGYiUlNJX3tsZW5ndGh9IikKICAgICAgICAgICAgICAgICAgICAgICAgaWYgdmFsOiBkaXJlY3Rpb24gPSAnVVAnIGlmIHZhbCA+IDUwIGVsc2UgJ0RPV04nCgogICAgICAgICAgICAgICAgICAgIGVsaWYgbmFtZSA9PSAiVm9ydGV4IjoKICAgICAgICAgICAgICAgICAgICAgICAgdmlwID0gbGFzdC5nZXQoZiJWVFhQX3twYXJhbXMuZ2V0KCdsZW5ndGgnLCAxNCl9IikKICAgICAgICAgICAgICAgICAgICAgICAgdmluID0gbGFzdC5nZXQoZiJWVFhNX3twYXJhbXMuZ2V0KCdsZW5ndGgnLCAxNCl9IikKICAgICAgICAgICAgICAgICAgICAgICAgaWYgdmlwIGFuZCB2aW46IGRpcmVjdGlvbiA9ICdVUCcgaWYgdmlwID4gdmluIGVsc2UgJ0RPV04nCgogICAgICAgICAgICAgICAgICAgIGVsaWYgbmFtZSA9PSAiTGluUmVnIFNsb3BlIjoKICAgICAgICAgICAgICAgICAgICAgICAgdmFsID0gbGFzdC5nZXQoZiJTTE9QRV97cGFyYW1zLmdldCgnbGVuZ3RoJywgMTQpfSIpCiAgICAgICAgICAgICAgICAgICAgICAgIGlmIHZhbDogZGlyZWN0aW9uID0gJ1VQJyBpZiB2YWwgPiAwIGVsc2UgJ0RPV04nCgogICAgICAgICAgICAgICAgICAgIGVsaWYgbmFtZSA9PSAiQ2hhaWtpbiBNb25leSBGbG93IjoKICAgICAgICAgICAgICAgICAgICAgICAgdmFsID0gbGFzdC5nZXQoZiJDTUZfe3BhcmFtcy5nZXQoJ2xlbmd0aCcsIDIwKX0iKQogICAgICAgICAgICAgICAgICAgICAgICBpZiB2YWw6IGRpcmVjdGlvbiA9ICdVUCcgaWYgdmFsID4gMCBlbHNlICdET1dOJwoKICAgICAgICAgICAgICAgICAgICBlbGlmIG5hbWUgPT0gIkljaGltb2t1IjoKICAgICAgICAgICAgICAgICAgICAgICAgIyBDb21wb25lbnQ6ICdDbG91ZCcsICdUZW5rYW4vS2lqdW4nLCAnUHJpY2UvQmFzZScKICAgICAgICAgICAgICAgICAgICAgICAgaWYgY29tcCA9PSAnQ2xvdWQnOgogICAgICAgICAgICAgICAgICAgICAgICAgICAgc3Bhbl9hID0gbGFzdC5nZXQoZiJJU0Ffe3BhcmFtcy5nZXQoJ3RlbmthbicsIDkpfSIpCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBzcGFuX2IgPSBsYXN0LmdldChmIklTQl97cGFyYW1zLmdldCgna2lqdW4nLCAyNil9IikKICAgICAgICAgICAgICAgICAgICAgICAgICAgIGlmIHNwYW5fYSBhbmQgc3Bhbl9iOiBkaXJlY3Rpb24gPSAnVVAnIGlmIGxhc3RbJ2Nsb3NlJ10gPiBtYXgoc3Bhbl9hLCBzcGFuX2IpIGVsc2UgJ0RPV04nIGlmIGxhc3RbJ2Nsb3NlJ10gPCBtaW4oc3Bhbl9hLCBzcGFuX2IpIGVsc2UgJ05FVVRSQUwnCiAgICAgICAgICAgICAgICAgICAgICAgIGVsaWYgY29tcCA9PSAnVGVua2FuL0tpanVuJzoKICAgICAgICAgICAgICAgICAgICAgICAgICAgIGl0cyA9IGxhc3QuZ2V0KGYiSVRTX3twYXJhbXMuZ2V0KCd0ZW5rYW4nLCA5KX0iKQogICAgICAgICAgICAgICAgICAgICAgICAgICAgaWtzID0gbGFzdC5nZXQoZiJJS1Nfe3BhcmFtcy5nZXQoJ2tpanVuJywgMjYpfSIpCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBpZiBpdHMgYW5kIGlrczogZGlyZWN0aW9uID0gJ1VQJyBpZiBpdHMgPiBpa3MgZWxzZSAnRE9XTicKCiAgICAgICAgICAgICAgICAgICAgIyBBZGQgbW9yZSBjb21wb25lbnQgbG9naWMgYXMgbmVlZGVkLi4uCiAgICAgICAgICAgICAgICBleGNlcHQ6IHBhc3MKICAgICAgICAgICAgICAgIHJlc3VsdHMuYXBwZW5kKGRpcmVjdGlvbikKCiAgICAgICAgaWYgYWxsKHIgPT0gJ1VQJyBmb3IgciBpbiByZXN1bHRzKSBhbmQgcmVzdWx0czogcmV0dXJuICdCVVknCiAgICAgICAgaWYgYWxsKHIgPT0gJ0RPV04nIGZvciByIGluIHJlc3VsdHMpIGFuZCByZXN1bHRzOiByZXR1cm4gJ1NFTEwnCiAgICAgICAgcmV0dXJuIE5vbmUKCiAgICBkZWYgZXZhbHVhdGVfZHluYW1pY19ydWxlcyhzZWxmLCBkZiwgcnVsZXMpOgogICAgICAgICIiIgogICAgICAgIEV2YWx1YXRlcyBhIGxpc3Qgb2YgbG9naWNhbCBydWxlcyBhZ2FpbnN0IHRoZSBkYXRhZnJhbWUuCiAgICAgICAgUmV0dXJucyBUcnVlIGlmIEFMTCBydWxlcyBwYXNzIChBTkQgbG9naWMpLgogICAgICAgICIiIgogICAgICAgIGlmIG5vdCBydWxlczogcmV0dXJuIFRydWUgIyBObyBydWxlcyA9IFBhc3MgKG9yIGhhbmRsZSBhcyBGYWxzZT8pCiAgICAgICAgCiAgICAgICAgbGFzdF9yb3cgPSBkZi5pbG9jWy0xXQogICAgICAgIHByZXZfcm93ID0gZGYuaWxvY1stMl0KICAgICAgICAKICAgICAgICBmb3IgcnVsZSBpbiBydWxlczoKICAgICAgICAgICAgdHJ5OgogICAgICAgICAgICAgICAgIyAxLiBHZXQgVmFsdWUgQQogICAgICAgICAgICAgICAgIyBIYW5kbGUgYmFzaWMgaW5kaWNhdG9ycyBtYXBwaW5ncwogICAgICAgICAgICAgICAgaW5kX2EgPSBzZWxmLl9tYXBfaW5kaWNhdG9yX25hbWUocnVsZVsnYSddLCBydWxlLmdldCgncGEnKSkKICAgICAgICAgICAgICAgIHZhbF9hID0gbGFzdF9yb3cuZ2V0KGluZF9hKQogICAgICAgICAgICAgICAgcHJldl92YWxfYSA9IHByZXZfcm93LmdldChpbmRfYSkKICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgIyAyLiBHZXQgVmFsdWUgQgogICAgICAgICAgICAgICAgaWYgcnVsZVsndGFyZ2V0J10gPT0gJ3ZhbHVlJzoKICAgICAgICAgICAgICAgICAgICB2YWxfYiA9IGZsb2F0KHJ1bGVbJ3ZhbCddKQogICAgICAgICAgICAgICAgICAgIHByZXZfdmFsX2IgPSB2YWxfYgogICAgICAgICAgICAgICAgZWxzZToKICAgICAgICAgICAgICAgICAgICBpbmRfYiA9IHNlbGYuX21hcF9pbmRpY2F0b3JfbmFtZShydWxlWydiJ10sIHJ1bGUuZ2V0KCdwYicpKQogICAgICAgICAgICAgICAgICAgIHZhbF9iID0gbGFzdF9yb3cuZ2V0KGluZF9iKQogICAgICAgICAgICAgICAgICAgIHByZXZfdmFsX2IgPSBwcmV2X3Jvdy5nZXQoaW5kX2IpCgogICAgICAgICAgICAgICAgaWYgdmFsX2EgaXMgTm9uZSBvciB2YWxfYiBpcyBOb25lOgogICAgICAgICAgICAgICAgICAgIHJldHVybiBGYWxzZQoKICAgICAgICAgICAgICAgICMgMy4gQ29tcGFyZSBiYXNlZCBvbiBPcGVyYXRvcgogICAgICAgICAgICAgICAgb3AgPSBydWxlWydvcCddCiAgICAgICAgICAgICAgICBpZiBvcCA9PSAnPic6CiAgICAgICAgICAgICAgICAgICAgaWYgbm90ICh2YWxfYSA+IHZhbF9iKTogcmV0dXJuIEZhbHNlCiAgICAgICAgICAgICAgICBlbGlmIG9wID09ICc8JzoKICAgICAgICAgICAgICAgICAgICBpZiBub3QgKHZhbF9hIDwgdmFsX2IpOiByZXR1cm4gRmFsc2UKICAgICAgICAgICAgICAgIGVsaWYgb3AgPT0gJ2VxdWFscyc6CiAgICAgICAgICAgICAgICAgICAgaWYgbm90ICh2YWxfYSA9PSB2YWxfYik6IHJldHVybiBGYWxzZQogICAgICAgICAgICAgICAgZWxpZiBvcCA9PSAnY3Jvc3NlcyBhYm92ZSc6CiAgICAgICAgICAgICAgICAgICAgIyAoUHJldiBBIDw9IFByZXYgQikgQU5EIChDdXJyIEEgPiBDdXJyIEIpCiAgICAgICAgICAgICAgICAgICAgaWYgbm90IChwcmV2X3ZhbF9hIDw9IHByZXZfdmFsX2IgYW5kIHZhbF9hID4gdmFsX2IpOiByZXR1cm4gRmFsc2UKICAgICAgICAgICAgICAgIGVsaWYgb3AgPT0gJ2Nyb3NzZXMgYmVsb3cnOgogICAgICAgICAgICAgICAgICAgICMgKFByZXYgQSA+PSBQcmV2IEIpIEFORCAoQ3VyciBBIDwgQ3VyciBCKQogICAgICAgICAgICAgICAgICAgIGlmIG5vdCAocHJldl92YWxfYSA+PSBwcmV2X3ZhbF9iIGFuZCB2YWxfYSA8IHZhbF9iKTogcmV0dXJuIEZhbHNlCiAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgIGV4Y2VwdCBFeGNlcHRpb24gYXMgZToKICAgICAgICAgICAgICAgIGxvZ2dlci5lcnJvcihmIlJ1bGUgZXZhbHVhdGlvbiBlcnJvcjoge3J1bGV9IC0+IHtlfSIpCiAgICAgICAgICAgICAgICByZXR1cm4gRmFsc2UKICAgICAgICAgICAgICAgIAogICAgICAgIHJldHVybiBUcnVlCgogICAgZGVmIF9tYXBfaW5kaWNhdG9yX25hbWUoc2VsZiwgbmFtZSwgcGFyYW0pOgogICAgICAgICIiIkhlbHBlciB0byBtYXAgVUkgbmFtZXMgdG8gUGFuZGFzIFRBIGNvbHVtbiBuYW1lcyIiIgogICAgICAgICMgRGVmYXVsdHMgaWYgcGFyYW0gZW1wdHkKICAgICAgICBwID0gcGFyYW0gaWYgcGFyYW0gZWxzZSAiMTQiCiAgICAgICAgCiAgICAgICAgaWYgbmFtZSA9PSAiUlNJIjogcmV0dXJuIGYiUlNJX3twfSIgaWYgZiJSU0lfe3B9IiBpbiBbIlJTSV8xNCJdIGVsc2UgIlJTSSIgIyBGYWxsYmFjayBzaW1wbGlmaWVkCiAgICAgICAgaWYgbmFtZSA9PSAiRU1BIjogcmV0dXJuIGYiRU1BX3twfSIKICAgICAgICBpZiBuYW1lID09ICJTTUEiOiByZXR1cm4gZiJTTUFfe3B9IgogICAgICAgIGlmIG5hbWUgPT0gIkFEWCI6IHJldHVybiBmIkFEWF97cH0iCiAgICAgICAgaWYgbmFtZSA9PSAiQVRSIjogcmV0dXJuIGYiQVRSX3twfSIKICAgICAgICBpZiBuYW1lID09ICJWV0FQIjogcmV0dXJuICJWV0FQX0QiICMgU3RhbmRhcmQgZGFpbHkgVldBUAogICAgICAgICMgQWRkIG1vcmUgbWFwcGluZ3MgYXMgbmVlZGVkCiAgICAgICAgcmV0dXJuIG5hbWUKCiAgICBkZWYgY2hlY2tfZHluYW1pY19zaWduYWwoc2VsZiwgZGF0YV9tYXAsIHN0cmF0ZWd5X2xvZ2ljLCB0aW1lZnJhbWVzKToKICAgICAgICAiIiIKICAgICAgICBFdmFsdWF0ZXMgdGhlIGZ1bGwgc3RyYXRlZ3kgbG9naWMgZnJvbSB0aGUgVUkgY29uZmlndXJhdGlvbi4KICAgICAgICBTdXBwb3J0cyBWMSAoTGVnYWN5KSBhbmQgVjIgKEFsaWdubWVudCkuCiAgICAgICAgIiIiCiAgICAgICAgdmVyc2lvbiA9IHN0cmF0ZWd5X2xvZ2ljLmdldCgndmVyc2lvbicsICcxLjAnKQoKICAgICAgICBpZiB2ZXJzaW9uID09ICcyLjAnOgogICAgICAgICAgICAjIFYyOiBHbG9iYWwgQWxpZ25tZW50IExvZ2ljCiAgICAgICAgICAgICMgQUxMIHNlbGVjdGVkIGNvbXBvbmVudHMgb24gQUxMIHRpbWVmcmFtZXMgbXVzdCBhbGlnbi4KICAgICAgICAgICAgcmVzdWx0cyA9IFtdCiAgICAgICAgICAgIGZvciB0Zl9rZXkgaW4gWydsYXJnZScsICdtZWQnLCAnc21hbGwnXToKICAgICAgICAgICAgICAgIGlmIHRmX2tleSBpbiBzdHJhdGVneV9sb2dpYzoKICAgICAgICAgICAgICAgICAgICAjIE1hcCAnbGFyZ2UnIHRvIHRpbWVmcmFtZVsyXSwgZXRjLiAoYXNzdW1pbmcgMyBURnMpCiAgICAgICAgICAgICAgICAgICAgIyBUaGlzIGlzIHNsaWdodGx5IGJyaXR0bGUgYnV0IG1hdGNoZXMgY3VycmVudCBVSSBhc3N1bXB0aW9ucy4KICAgICAgICAgICAgICAgICAgICAjIEJFVFRFUjogVXNlIHRmIGluZGV4IGZyb20gY29uZmlnLgogICAgICAgICAgICAgICAgICAgIHRmX2lkeCA9IDIgaWYgdGZfa2V5ID09ICdsYXJnZScgZWxzZSAxIGlmIHRmX2tleSA9PSAnbWVkJyBlbHNlIDAKICAgICAgICAgICAgICAgICAgICBpZiBsZW4odGltZWZyYW1lcykgPiB0Zl9pZHg6CiAgICAgICAgICAgICAgICAgICAgICAgIHRmID0gdGltZWZyYW1lc1t0Zl9pZHhdCiAgICAgICAgICAgICAgICAgICAgICAgIGlmIHRmIGluIGRhdGFfbWFwOgogICAgICAgICAgICAgICAgICAgICAgICAgICAgcmVzID0gc2VsZi5ldmFsdWF0ZV9hbGlnbm1lbnQoZGF0YV9tYXBbdGZdLCBzdHJhdGVneV9sb2dpY1t0Zl9rZXldKQogICAgICAgICAgICAgICAgICAgICAgICAgICAgaWYgcmVzOiByZXN1bHRzLmFwcGVuZChyZXMpCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBlbHNlOiByZXR1cm4gTm9uZSAjIERpc2Nvbm5lY3Q6IE9uZSBURiBoYXMgbm8gYWxpZ25tZW50CiAgICAgICAgICAgIAogICAgICAgICAgICAjIEZpbmFsIENoZWNrOiBEbyBhbGwgVEZzIHRoYXQgaGFkIHJ1bGVzIGFncmVlPwogICAgICAgICAgICBpZiByZXN1bHRzIGFuZCBhbGwociA9PSAnQlVZJyBmb3IgciBpbiByZXN1bHRzKTogcmV0dXJuICdCVVknCiAgICAgICAgICAgIGlmIHJlc3VsdHMgYW5kIGFsbChyID09ICdTRUxMJyBmb3IgciBpbiByZXN1bHRzKTogcmV0dXJuICdTRUxMJwogICAgICAgICAgICByZXR1cm4gTm9uZQoKICAgICAgICBlbHNlOgogICAgICAgICAgICAjIFYxOiBMZWdhY3kgSW5kaWNhdG9yIHZzIEluZGljYXRvciBMb2dpYwogICAgICAgICAgICB0cmVuZF9hbGlnbmVkID0gVHJ1ZQogICAgICAgICAgICBpZiBsZW4odGltZWZyYW1lcykgPj0gMyBhbmQgc3RyYXRlZ3lfbG9naWMuZ2V0KCdsYXJnZScpOgogICAgICAgICAgICAgICAgdGZfbGFyZ2UgPSB0aW1lZnJhbWVzWzJdCiAgICAgICAgICAgICAgICBpZiB0Zl9sYXJnZSBpbiBkYXRhX21hcDoKICAgICAgICAgICAgICAgICAgICBpZiBub3Qgc2VsZi5ldmFsdWF0ZV9keW5hbWljX3J1bGVzKGRhdGFfbWFwW3RmX2xhcmdlXSwgc3RyYXRlZ3lfbG9naWNbJ2xhcmdlJ10pOgogICAgICAgICAgICAgICAgICAgICAgICB0cmVuZF9hbGlnbmVkID0gRmFsc2UKICAgICAgICAgICAgaWYgbGVuKHRpbWVmcmFtZXMpID49IDIgYW5kIHN0cmF0ZWd5X2xvZ2ljLmdldCgnbWVkJyk6CiAgICAgICAgICAgICAgICB0Zl9tZWQgPSB0aW1lZnJhbWVzWzFdCiAgICAgICAgICAgICAgICBpZiB0Zl9tZWQgaW4gZGF0YV9tYXA6CiAgICAgICAgICAgICAgICAgICAgaWYgbm90IHNlbGYuZXZhbHVhdGVfZHluYW1pY19ydWxlcyhkYXRhX21hcFt0Zl9tZWRdLCBzdHJhdGVneV9sb2dpY1snbWVkJ10pOgogICAgICAgICAgICAgICAgICAgICAgICB0cmVuZF9hbGlnbmVkID0gRmFsc2UKICAgICAgICAgICAgaWYgbm90IHRyZW5kX2FsaWduZWQ6IHJldHVybiBOb25lCiAgICAgICAgICAgIHRmX3NtYWxsID0gdGltZWZyYW1lc1swXQogICAgICAgICAgICBpZiB0Zl9zbWFsbCBpbiBkYXRhX21hcCBhbmQgc3RyYXRlZ3lfbG9naWMuZ2V0KCdzbWFsbCcpOgogICAgICAgICAgICAgICAgaWYgc2VsZi5ldmFsdWF0ZV9keW5hbWljX3J1bGVzKGRhdGFfbWFwW3RmX3NtYWxsXSwgc3RyYXRlZ3lfbG9naWNbJ3NtYWxsJ10pOgogICAgICAgICAgICAgICAgICAgIHJldHVybiAiQlVZIgogICAgICAgICAgICByZXR1cm4gTm9uZQoKICAgIGRlZiBjaGVja190cmVuZChzZWxmLCBkZl8xZCwgZGZfNGgpOgogICAgICAgICIiIgogICAgICAgIENoZWNrcyBpZiB0aGUgaGlnaGVyIHRpbWVmcmFtZXMgYXJlIGFsaWduZWQuCiAgICAgICAgUmV0dXJuczogJ1VQJywgJ0RPV04nLCBvciAnTkVVVFJBTCcKICAgICAgICAiIiIKICAgICAgICAjIEdldCBsYXN0IGNsb3NlZCBjYW5kbGUKICAgICAgICBsYXN0XzFkID0gZGZfMWQuaWxvY1stMV0KICAgICAgICBsYXN0XzRoID0gZGZfNGguaWxvY1stMV0KICAgICAgICAKICAgICAgICAjIERlZmluZSBUcmVuZCBDcml0ZXJpYQogICAgICAgICMgMS4gUHJpY2UgdnMgRU1BcwogICAgICAgICMgMi4gRU1BIENyb3NzCiAgICAgICAgIyAzLiBBRFggU3RyZW5ndGggKD4yMCkKICAgICAgICAjIDQuICtESSB2cyAtREkKICAgICAgICAKICAgICAgICAjIENoZWNrIDFEIFRyZW5kCiAgICAgICAgdHJlbmRfMWQgPSBzZWxmLl9ldmFsdWF0ZV90cmVuZChsYXN0XzFkKQogICAgICAgIAogICAgICAgICMgQ2hlY2sgNEggVHJlbmQKICAgICAgICB0cmVuZF80aCA9IHNlbGYuX2V2YWx1YXRlX3RyZW5kKGxhc3RfNGgpCiAgICAgICAgCiAgICAgICAgaWYgdHJlbmRfMWQgPT0gJ1VQJyBhbmQgdHJlbmRfNGggPT0gJ1VQJzoKICAgICAgICAgICAgcmV0dXJuICdVUCcKICAgICAgICBlbGlmIHRyZW5kXzFkID09ICdET1dOJyBhbmQgdHJlbmRfNGggPT0gJ0RPV04nOgogICAgICAgICAgICByZXR1cm4gJ0RPV04nCiAgICAgICAgZWxzZToKICAgICAgICAgICAgcmV0dXJuICdORVVUUkFMJwoKICAgIGRlZiBfZXZhbHVhdGVfdHJlbmQoc2VsZiwgcm93KToKICAgICAgICAiIiIKICAgICAgICBIZWxwZXIgdG8gZXZhbHVhdGUgYSBzaW5nbGUgcm93J3MgdHJlbmQuCiAgICAgICAgIiIiCiAgICAgICAgYWR4X3RocmVzaG9sZCA9IDIwCiAgICAgICAgCiAgICAgICAgIyBDaGVjayBpZiBpbmRpY2F0b3JzIGV4aXN0IChVSSBzYWZldHkgY2hlY2spCiAgICAgICAgaWYgJ0VNQV81MCcgbm90IGluIHJvdyBvciAnRU1BXzIwMCcgbm90IGluIHJvdyBvciAnQURYXzE0JyBub3QgaW4gcm93OgogICAgICAgICAgICByZXR1cm4gJ05FVVRSQUwnCiAgICAgICAgICAgIAogICAgICAgICMgVXB0cmVuZCBDb25kaXRpb24KICAgICAgICBpZiAocm93WydjbG9zZSddID4gcm93WydFTUFfNTAnXSA+IHJvd1snRU1BXzIwMCddIGFuZAogICAgICAgICAgICByb3dbJ0FEWF8xNCddID4gYWR4X3RocmVzaG9sZCBhbmQKICAgICAgICAgICAgcm93WydETVBfMTQnXSA+IHJvd1snRE1OXzE0J10pOgogICAgICAgICAgICByZXR1cm4gJ1VQJwogICAgICAgICAgICAKICAgICAgICAjIERvd250cmVuZCBDb25kaXRpb24KICAgICAgICBpZiAocm93WydjbG9zZSddIDwgcm93WydFTUFfNTAnXSA8IHJvd1snRU1BXzIwMCddIGFuZAogICAgICAgICAgICByb3dbJ0FEWF8xNCddID4gYWR4X3RocmVzaG9sZCBhbmQKICAgICAgICAgICAgcm93WydETU5fMTQnXSA+IHJvd1snRE1QXzE0J10pOgogICAgICAgICAgICByZXR1cm4gJ0RPV04nCiAgICAgICAgICAgIAogICAgICAgIHJldHVybiAnTkVVVFJBTCcKCiAgICBkZWYgZ2V0X3Jvd190cmVuZChzZWxmLCByb3cpOgogICAgICAgICIiIlB1YmxpYyB3cmFwcGVyIGZvciBVSSB0cmVuZCBkaXNwbGF5IiIiCiAgICAgICAgcmV0dXJuIHNlbGYuX2V2YWx1YXRlX3RyZW5kKHJvdykKCiAgICBkZWYgY2hlY2tfdHJpZ2dlcihzZWxmLCBkZl8xaCwgdHJlbmRfZGlyZWN0aW9uKToKICAgICAgICAiIiIKICAgICAgICBDaGVja3MgZm9yIGVudHJ5IHRyaWdnZXJzIG9uIGxvd2VyIHRpbWVmcmFtZSAoMUgpIGFsaWduZWQgd2l0aCBUcmVuZC4KICAgICAgICBSZXR1cm5zOiAnQlVZJywgJ1NFTEwnLCBvciBOb25lCiAgICAgICAgIiIiCiAgICAgICAgbGFzdF9yb3cgPSBkZl8xaC5pbG9jWy0xXQogICAgICAgIHByZXZfcm93ID0gZGZfMWguaWxvY1stMl0gIyBUbyBjaGVjayBmb3IgY3Jvc3NvdmVyCiAgICAgICAgCiAgICAgICAgIyBWb2xhdGlsaXR5IEZpbHRlciAoQVRSKQogICAgICAgICMgVE9ETzogRGVmaW5lIGEgZHluYW1pYyB0aHJlc2hvbGQgYmFzZWQgb24gYXNzZXQgcHJpY2Ugb3IgJT8KICAgICAgICAjIEZvciBub3csIGVuc3VyaW5nIGl0J3Mgbm90IHplcm8vbnVsbC4KICAgICAgICBpZiBsYXN0X3Jvd1snQVRSJ10gPT0gMDoKICAgICAgICAgICAgcmV0dXJuIE5vbmUKCiAgICAgICAgaWYgdHJlbmRfZGlyZWN0aW9uID09ICdVUCc6CiAgICAgICAgICAgICMgQnV5IFRyaWdnZXI6IEVNQSAxMCBjcm9zc2VzIEFCT1ZFIEVNQSAyMCBBTkQgUlNJIGlzIHJpc2luZy9idWxsaXNoCiAgICAgICAgICAgIGlmIChwcmV2X3Jvd1snRU1BXzEwJ10gPD0gcHJldl9yb3dbJ0VNQV8yMCddIGFuZCAKICAgICAgICAgICAgICAgIGxhc3Rfcm93WydFTUFfMTAnXSA+IGxhc3Rfcm93WydFTUFfMjAnXSBhbmQKICAgICAgICAgICAgICAgIGxhc3Rfcm93WydSU0knXSA+IDQwKTogIyBSU0kgY2hlY2sKICAgICAgICAgICAgICAgIHJldHVybiAnQlVZJwogICAgICAgICAgICAgICAgCiAgICAgICAgZWxpZiB0cmVuZF9kaXJlY3Rpb24gPT0gJ0RPV04nOgogICAgICAgICAgICAjIFNlbGwgVHJpZ2dlcjogRU1BIDEwIGNyb3NzZXMgQkVMT1cgRU1BIDIwIEFORCBSU0kgaXMgZmFsbGluZy9iZWFyaXNoCiAgICAgICAgICAgIGlmIChwcmV2X3Jvd1snRU1BXzEwJ10gPj0gcHJldl9yb3dbJ0VNQV8yMCddIGFuZCAKICAgICAgICAgICAgICAgIGxhc3Rfcm93WydFTUFfMTAnXSA8IGxhc3Rfcm93WydFTUFfMjAnXSBhbmQKICAgICAgICAgICAgICAgIGxhc3Rfcm93WydSU0knXSA8IDYwKTogIyBSU0kgY2hlY2sKICAgICAgICAgICAgICAgIHJldHVybiAnU0VMTCcKICAgICAgICAgICAgICAgIAogICAgICAgIHJldHVybiBOb25lCg==
\ No newline at end of file
+aW1wb3J0IHBhbmRhc190YSBhcyB0YQppbXBvcnQgcGFuZGFzIGFzIHBkCmltcG9ydCBsb2dnaW5nCgpsb2dnZXIgPSBsb2dnaW5nLmdldExvZ2dlcihfX25hbWVfXykKCmNsYXNzIFN0cmF0ZWd5OgogICAgZGVmIF9faW5pdF9fKHNlbGYpOgogICAgICAgIHBhc3MKCiAgICBkZWYgY2FsY3VsYXRlX2luZGljYXRvcnMoc2VsZiwgZGYsIGluZGljYXRvcnNfY29uZmlnPU5vbmUpOgogICAgICAgICIiIgogICAgICAgIEFkZHMgdGVjaG5pY2FsIGluZGljYXRvcnMgdG8gdGhlIERhdGFGcmFtZS4KICAgICAgICBJZiBpbmRpY2F0b3JzX2NvbmZpZyBpcyBwcm92aWRlZCwgaXQgY2FsY3VsYXRlcyBvbmx5IHRob3NlIHdpdGggc3BlY2lmaWMgcGFyYW1zLgogICAgICAgICIiIgogICAgICAgIGlmIG5vdCBpbmRpY2F0b3JzX2NvbmZpZzoKICAgICAgICAgICAgIyBEZWZhdWx0L0xlZ2FjeSBpbmRpY2F0b3JzIGZvciBiYWRnZXMKICAgICAgICAgICAgZGZbJ0VNQV8xMCddID0gdGEuZW1hKGRmWydjbG9zZSddLCBsZW5ndGg9MTApCiAgICAgICAgICAgIGRmWydFTUFfMjAnXSA9IHRhLmVtYShkZlsnY2xvc2UnXSwgbGVuZ3RoPTIwKQogICAgICAgICAgICBkZlsnRU1BXzUwJ10gPSB0YS5lbWEoZGZbJ2Nsb3NlJ10sIGxlbmd0aD01MCkKICAgICAgICAgICAgZGZbJ0VNQV8yMDAnXSA9IHRhLmVtYShkZlsnY2xvc2UnXSwgbGVuZ3RoPTIwMCkKICAgICAgICAgICAgZGZbJ1NNQV8yMCddID0gdGEuc21hKGRmWydjbG9zZSddLCBsZW5ndGg9MjApCiAgICAgICAgICAgIGRmWydSU0knXSA9IHRhLnJzaShkZlsnY2xvc2UnXSwgbGVuZ3RoPTE0KQogICAgICAgICAgICBtYWNkID0gdGEubWFjZChkZlsnY2xvc2UnXSkKICAgICAgICAgICAgaWYgbWFjZCBpcyBub3QgTm9uZTogZGYgPSBwZC5jb25jYXQoW2RmLCBtYWNkXSwgYXhpcz0xKQogICAgICAgICAgICBhZHggPSB0YS5hZHgoZGZbJ2hpZ2gnXSwgZGZbJ2xvdyddLCBkZlsnY2xvc2UnXSwgbGVuZ3RoPTE0KQogICAgICAgICAgICBpZiBhZHggaXMgbm90IE5vbmU6IGRmID0gcGQuY29uY2F0KFtkZiwgYWR4XSwgYXhpcz0xKQogICAgICAgICAgICBkZlsnQVRSJ10gPSB0YS5hdHIoZGZbJ2hpZ2gnXSwgZGZbJ2xvdyddLCBkZlsnY2xvc2UnXSwgbGVuZ3RoPTE0KQogICAgICAgICAgICBiYiA9IHRhLmJiYW5kcyhkZlsnY2xvc2UnXSwgbGVuZ3RoPTIwLCBzdGQ9MikKICAgICAgICAgICAgaWYgYmIgaXMgbm90IE5vbmU6IGRmID0gcGQuY29uY2F0KFtkZiwgYmJdLCBheGlzPTEpCiAgICAgICAgICAgIHRyeToKICAgICAgICAgICAgICAgIGljaGkgPSB0YS5pY2hpbW9rdShkZlsnaGlnaCddLCBkZlsnbG93J10sIGRmWydjbG9zZSddKVswXQogICAgICAgICAgICAgICAgZGYgPSBwZC5jb25jYXQoW2RmLCBpY2hpXSwgYXhpcz0xKQogICAgICAgICAgICBleGNlcHQ6IHBhc3MKICAgICAgICAgICAgaWYgJ3ZvbHVtZScgaW4gZGYuY29sdW1uczogZGZbJ1ZXQVAnXSA9IHRhLnZ3YXAoZGZbJ2hpZ2gnXSwgZGZbJ2xvdyddLCBkZlsnY2xvc2UnXSwgZGZbJ3ZvbHVtZSddKQogICAgICAgICAgICByZXR1cm4gZGYKCiAgICAgICAgIyBEeW5hbWljIFYyIENhbGN1bGF0aW9uCiAgICAgICAgZm9yIGluZCBpbiBpbmRpY2F0b3JzX2NvbmZpZzoKICAgICAgICAgICAgbmFtZSA9IGluZFsnbmFtZSddCiAgICAgICAgICAgIHBhcmFtcyA9IGluZC5nZXQoJ3BhcmFtcycsIHt9KQogICAgICAgICAgICBzb3VyY2VfY29sID0gcGFyYW1zLmdldCgnc291cmNlJywgJ2Nsb3NlJykKICAgICAgICAgICAgc291cmNlID0gZGZbc291cmNlX2NvbF0gaWYgc291cmNlX2NvbCBpbiBkZi5jb2x1bW5zIGVsc2UgZGZbJ2Nsb3NlJ10KCiAgICAgICAgICAgIHRyeToKICAgICAgICAgICAgICAgIGlmIG5hbWUgPT0gIkVNQSI6CiAgICAgICAgICAgICAgICAgICAgbGVuZ3RoID0gaW50KHBhcmFtcy5nZXQoJ2xlbmd0aCcsIDIwKSkKICAgICAgICAgICAgICAgICAgICBkZltmIkVNQV97bGVuZ3RofSJdID0gdGEuZW1hKHNvdXJjZSwgbGVuZ3RoPWxlbmd0aCkKICAgICAgICAgICAgICAgIGVsaWYgbmFtZSA9PSAiU01BIjoKICAgICAgICAgICAgICAgICAgICBsZW5ndGggPSBpbnQocGFyYW1zLmdldCgnbGVuZ3RoJywgMjApKQogICAgICAgICAgICAgICAgICAgIGRmW2YiU01BX3tsZW5ndGh9Il0gPSB0YS5zbWEoc291cmNlLCBsZW5ndGg9bGVuZ3RoKQogICAgICAgICAgICAgICAgZWxpZiBuYW1lID09ICJSU0kiOgogICAgICAgICAgICAgICAgICAgIGxlbmd0aCA9IGludChwYXJhbXMuZ2V0KCdsZW5ndGgnLCAxNCkpCiAgICAgICAgICAgICAgICAgICAgZGZbZiJSU0lfe2xlbmd0aH0iXSA9IHRhLnJzaShzb3VyY2UsIGxlbmd0aD1sZW5ndGgpCiAgICAgICAgICAgICAgICBlbGlmIG5hbWUgPT0gIk1BQ0QiOgogICAgICAgICAgICAgICAgICAgIGZhc3QgPSBpbnQocGFyYW1zLmdldCgnZmFzdCcsIDEyKSkKICAgICAgICAgICAgICAgICAgICBzbG93ID0gaW50KHBhcmFtcy5nZXQoJ3Nsb3cnLCAyNikpCiAgICAgICAgICAgICAgICAgICAgc2lnbmFsID0gaW50KHBhcmFtcy5nZXQoJ3NpZ25hbCcsIDkpKQogICAgICAgICAgICAgICAgICAgIG1hY2QgPSB0YS5tYWNkKHNvdXJjZSwgZmFzdD1mYXN0LCBzbG93PXNsb3csIHNpZ25hbD1zaWduYWwpCiAgICAgICAgICAgICAgICAgICAgZGYgPSBwZC5jb25jYXQoW2RmLCBtYWNkXSwgYXhpcz0xKQogICAgICAgICAgICAgICAgZWxpZiBuYW1lID09ICJJY2hpbW9rdSI6CiAgICAgICAgICAgICAgICAgICAgdGVua2FuID0gaW50KHBhcmFtcy5nZXQoJ3RlbmthbicsIDkpKQogICAgICAgICAgICAgICAgICAgIGtpanVuID0gaW50KHBhcmFtcy5nZXQoJ2tpanVuJywgMjYpKQogICAgICAgICAgICAgICAgICAgIHNlbmtvdSA9IGludChwYXJhbXMuZ2V0KCdzZW5rb3UnLCA1MikpCiAgICAgICAgICAgICAgICAgICAgaWNoaSA9IHRhLmljaGltb2t1KGRmWydoaWdoJ10sIGRmWydsb3cnXSwgZGZbJ2Nsb3NlJ10sIHRlbmthbj10ZW5rYW4sIGtpanVuPWtpanVuLCBzZW5rb3U9c2Vua291KVswXQogICAgICAgICAgICAgICAgICAgIGRmID0gcGQuY29uY2F0KFtkZiwgaWNoaV0sIGF4aXM9MSkKICAgICAgICAgICAgICAgIGVsaWYgbmFtZSA9PSAiVm9ydGV4IjoKICAgICAgICAgICAgICAgICAgICBsZW5ndGggPSBpbnQocGFyYW1zLmdldCgnbGVuZ3RoJywgMTQpKQogICAgICAgICAgICAgICAgICAgIHZvcnRleCA9IHRhLnZvcnRleChkZlsnaGlnaCddLCBkZlsnbG93J10sIGRmWydjbG9zZSddLCBsZW5ndGg9bGVuZ3RoKQogICAgICAgICAgICAgICAgICAgIGRmID0gcGQuY29uY2F0KFtkZiwgdm9ydGV4XSwgYXhpcz0xKQogICAgICAgICAgICAgICAgZWxpZiBuYW1lID09ICJMaW5SZWcgU2xvcGUiOgogICAgICAgICAgICAgICAgICAgIGxlbmd0aCA9IGludChwYXJhbXMuZ2V0KCdsZW5ndGgnLCAxNCkpCiAgICAgICAgICAgICAgICAgICAgZGZbZiJTTE9QRV97bGVuZ3RofSJdID0gdGEuc2xvcGUoc291cmNlLCBsZW5ndGg9bGVuZ3RoKQogICAgICAgICAgICAgICAgZWxpZiBuYW1lID09ICJUVE0gU3F1ZWV6ZSI6CiAgICAgICAgICAgICAgICAgICAgIyBTdGFuZGFyZCBUVE0gU3F1ZWV6ZSB1c2luZyBLQyBhbmQgQkIKICAgICAgICAgICAgICAgICAgICBzcXVlZXplID0gdGEuc3F1ZWV6ZShkZlsnaGlnaCddLCBkZlsnbG93J10sIGRmWydjbG9zZSddKQogICAgICAgICAgICAgICAgICAgIGlmIHNxdWVlemUgaXMgbm90IE5vbmU6IGRmID0gcGQuY29uY2F0KFtkZiwgc3F1ZWV6ZV0sIGF4aXM9MSkKICAgICAgICAgICAgICAgIGVsaWYgbmFtZSA9PSAiQ2hhaWtpbiBNb25leSBGbG93IjoKICAgICAgICAgICAgICAgICAgICBsZW5ndGggPSBpbnQocGFyYW1zLmdldCgnbGVuZ3RoJywgMjApKQogICAgICAgICAgICAgICAgICAgIGRmW2YiQ01GX3tsZW5ndGh9Il0gPSB0YS5jbWYoZGZbJ2hpZ2gnXSwgZGZbJ2xvdyddLCBkZlsnY2xvc2UnXSwgZGZbJ3ZvbHVtZSddLCBsZW5ndGg9bGVuZ3RoKQogICAgICAgICAgICAgICAgZWxpZiBuYW1lID09ICJBRFgiOgogICAgICAgICAgICAgICAgICAgIGxlbmd0aCA9IGludChwYXJhbXMuZ2V0KCdsZW5ndGgnLCAxNCkpCiAgICAgICAgICAgICAgICAgICAgYWR4ID0gdGEuYWR4KGRmWydoaWdoJ10sIGRmWydsb3cnXSwgZGZbJ2Nsb3NlJ10sIGxlbmd0aD1sZW5ndGgpCiAgICAgICAgICAgICAgICAgICAgZGYgPSBwZC5jb25jYXQoW2RmLCBhZHhdLCBheGlzPTEpCiAgICAgICAgICAgICAgICBlbGlmIG5hbWUgPT0gIkFUUiI6CiAgICAgICAgICAgICAgICAgICAgbGVuZ3RoID0gaW50KHBhcmFtcy5nZXQoJ2xlbmd0aCcsIDE0KSkKICAgICAgICAgICAgICAgICAgICBkZltmIkFUUl97bGVuZ3RofSJdID0gdGEuYXRyKGRmWydoaWdoJ10sIGRmWydsb3cnXSwgZGZbJ2Nsb3NlJ10sIGxlbmd0aD1sZW5ndGgpCiAgICAgICAgICAgIGV4Y2VwdCBFeGNlcHRpb24gYXMgZToKICAgICAgICAgICAgICAgIGxvZ2dlci5lcnJvcihmIkVycm9yIGNhbGN1bGF0aW5nIHtuYW1lfToge2V9IikKCiAgICAgICAgcmV0dXJuIGRmCgogICAgZGVmIGV2YWx1YXRlX2FsaWdubWVudChzZWxmLCBkZiwgaW5kaWNhdG9yc19jb25maWcpOgogICAgICAgICIiIgogICAgICAgIE5FVyBWMiBMb2dpYzogQ2hlY2tzIGlmIEFMTCBzZWxlY3RlZCBjb21wb25lbnRzIGFsaWduIGluIGRpcmVjdGlvbi4KICAgICAgICBSZXR1cm5zICdCVVknIGlmIGFsbCB1cHRyZW5kLCAnU0VMTCcgaWYgYWxsIGRvd250cmVuZCwgZWxzZSBOb25lLgogICAgICAgICIiIgogICAgICAgIGlmIG5vdCBpbmRpY2F0b3JzX2NvbmZpZzogcmV0dXJuIE5vbmUKICAgICAgICAKICAgICAgICBsYXN0ID0gZGYuaWxvY1stMV0KICAgICAgICByZXN1bHRzID0gW10gIyBMaXN0IG9mICdVUCcsICdET1dOJywgb3IgJ05FVVRSQUwnCgogICAgICAgIGZvciBpbmQgaW4gaW5kaWNhdG9yc19jb25maWc6CiAgICAgICAgICAgIG5hbWUgPSBpbmRbJ25hbWUnXQogICAgICAgICAgICBjb21wb25lbnRzID0gaW5kLmdldCgnc2VsZWN0ZWRfY29tcG9uZW50cycsIFtdKQogICAgICAgICAgICBwYXJhbXMgPSBpbmQuZ2V0KCdwYXJhbXMnLCB7fSkKICAgICAgICAgICAgCiAgICAgICAgICAgIGZvciBjb21wIGluIGNvbXBvbmVudHM6CiAgICAgICAgICAgICAgICBkaXJlY3Rpb24gPSAnTkVVVFJBTCcKICAgICAgICAgICAgICAgIHRyeToKICAgICAgICAgICAgICAgICAgICBpZiBuYW1lID09ICJFTUEiOgogICAgICAgICAgICAgICAgICAgICAgICBsZW5ndGggPSBwYXJhbXMuZ2V0KCdsZW5ndGgnLCAyMCkKICAgICAgICAgICAgICAgICAgICAgICAgdmFsID0gbGFzdC5nZXQoZiJFTUFfe2xlbmd0aH0iKQogICAgICAgICAgICAgICAgICAgICAgICBpZiB2YWw6IGRpcmVjdGlvbiA9ICdVUCcgaWYgbGFzdFsnY2xvc2UnXSA+IHZhbCBlbHNlICdET1dOJwogICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgIGVsaWYgbmFtZSA9PSAiUlNJIjoKICAgICAgICAgICAgICAgICAgICAgICAgbGVuZ3RoID0gcGFyYW1zLmdldCgnbGVuZ3RoJywgMTQpCiAgICAgICAgICAgICAgICAgICAgICAgIHZhbCA9IGxhc3QuZ2V0KGYiUlNJX3tsZW5ndGh9IikKICAgICAgICAgICAgICAgICAgICAgICAgaWYgdmFsOiBkaXJlY3Rpb24gPSAnVVAnIGlmIHZhbCA+IDUwIGVsc2UgJ0RPV04nCgogICAgICAgICAgICAgICAgICAgIGVsaWYgbmFtZSA9PSAiVm9ydGV4IjoKICAgICAgICAgICAgICAgICAgICAgICAgdmlwID0gbGFzdC5nZXQoZiJWVFhQX3twYXJhbXMuZ2V0KCdsZW5ndGgnLCAxNCl9IikKICAgICAgICAgICAgICAgICAgICAgICAgdmluID0gbGFzdC5nZXQoZiJWVFhNX3twYXJhbXMuZ2V0KCdsZW5ndGgnLCAxNCl9IikKICAgICAgICAgICAgICAgICAgICAgICAgaWYgdmlwIGFuZCB2aW46IGRpcmVjdGlvbiA9ICdVUCcgaWYgdmlwID4gdmluIGVsc2UgJ0RPV04nCgogICAgICAgICAgICAgICAgICAgIGVsaWYgbmFtZSA9PSAiTGluUmVnIFNsb3BlIjoKICAgICAgICAgICAgICAgICAgICAgICAgdmFsID0gbGFzdC5nZXQoZiJTTE9QRV97cGFyYW1zLmdldCgnbGVuZ3RoJywgMTQpfSIpCiAgICAgICAgICAgICAgICAgICAgICAgIGlmIHZhbDogZGlyZWN0aW9uID0gJ1VQJyBpZiB2YWwgPiAwIGVsc2UgJ0RPV04nCgogICAgICAgICAgICAgICAgICAgIGVsaWYgbmFtZSA9PSAiQ2hhaWtpbiBNb25leSBGbG93IjoKICAgICAgICAgICAgICAgICAgICAgICAgdmFsID0gbGFzdC5nZXQoZiJDTUZfe3BhcmFtcy5nZXQoJ2xlbmd0aCcsIDIwKX0iKQogICAgICAgICAgICAgICAgICAgICAgICBpZiB2YWw6IGRpcmVjdGlvbiA9ICdVUCcgaWYgdmFsID4gMCBlbHNlICdET1dOJwoKICAgICAgICAgICAgICAgICAgICBlbGlmIG5hbWUgPT0gIkljaGltb2t1IjoKICAgICAgICAgICAgICAgICAgICAgICAgIyBDb21wb25lbnQ6ICdDbG91ZCcsICdUZW5rYW4vS2lqdW4nLCAnUHJpY2UvQmFzZScKICAgICAgICAgICAgICAgICAgICAgICAgaWYgY29tcCA9PSAnQ2xvdWQnOgogICAgICAgICAgICAgICAgICAgICAgICAgICAgc3Bhbl9hID0gbGFzdC5nZXQoZiJJU0Ffe3BhcmFtcy5nZXQoJ3RlbmthbicsIDkpfSIpCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBzcGFuX2IgPSBsYXN0LmdldChmIklTQl97cGFyYW1zLmdldCgna2lqdW4nLCAyNil9IikKICAgICAgICAgICAgICAgICAgICAgICAgICAgIGlmIHNwYW5fYSBhbmQgc3Bhbl9iOiBkaXJlY3Rpb24gPSAnVVAnIGlmIGxhc3RbJ2Nsb3NlJ10gPiBtYXgoc3Bhbl9hLCBzcGFuX2IpIGVsc2UgJ0RPV04nIGlmIGxhc3RbJ2Nsb3NlJ10gPCBtaW4oc3Bhbl9hLCBzcGFuX2IpIGVsc2UgJ05FVVRSQUwnCiAgICAgICAgICAgICAgICAgICAgICAgIGVsaWYgY29tcCA9PSAnVGVua2FuL0tpanVuJzoKICAgICAgICAgICAgICAgICAgICAgICAgICAgIGl0cyA9IGxhc3QuZ2V0KGYiSVRTX3twYXJhbXMuZ2V0KCd0ZW5rYW4nLCA5KX0iKQogICAgICAgICAgICAgICAgICAgICAgICAgICAgaWtzID0gbGFzdC5nZXQoZiJJS1Nfe3BhcmFtcy5nZXQoJ2tpanVuJywgMjYpfSIpCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBpZiBpdHMgYW5kIGlrczogZGlyZWN0aW9uID0gJ1VQJyBpZiBpdHMgPiBpa3MgZWxzZSAnRE9XTicKCiAgICAgICAgICAgICAgICAgICAgIyBBZGQgbW9yZSBjb21wb25lbnQgbG9naWMgYXMgbmVlZGVkLi4uCiAgICAgICAgICAgICAgICBleGNlcHQ6IHBhc3MKICAgICAgICAgICAgICAgIHJlc3VsdHMuYXBwZW5kKGRpcmVjdGlvbikKCiAgICAgICAgaWYgYWxsKHIgPT0gJ1VQJyBmb3IgciBpbiByZXN1bHRzKSBhbmQgcmVzdWx0czogcmV0dXJuICdCVVknCiAgICAgICAgaWYgYWxsKHIgPT0gJ0RPV04nIGZvciByIGluIHJlc3VsdHMpIGFuZCByZXN1bHRzOiByZXR1cm4gJ1NFTEwnCiAgICAgICAgcmV0dXJuIE5vbmUKCiAgICBkZWYgZXZhbHVhdGVfZHluYW1pY19ydWxlcyhzZWxmLCBkZiwgcnVsZXMpOgogICAgICAgICIiIgogICAgICAgIEV2YWx1YXRlcyBhIGxpc3Qgb2YgbG9naWNhbCBydWxlcyBhZ2FpbnN0IHRoZSBkYXRhZnJhbWUuCiAgICAgICAgUmV0dXJucyBUcnVlIGlmIEFMTCBydWxlcyBwYXNzIChBTkQgbG9naWMpLgogICAgICAgICIiIgogICAgICAgIGlmIG5vdCBydWxlczogcmV0dXJuIFRydWUgIyBObyBydWxlcyA9IFBhc3MgKG9yIGhhbmRsZSBhcyBGYWxzZT8pCiAgICAgICAgCiAgICAgICAgbGFzdF9yb3cgPSBkZi5pbG9jWy0xXQogICAgICAgIHByZXZfcm93ID0gZGYuaWxvY1stMl0KICAgICAgICAKICAgICAgICBmb3IgcnVsZSBpbiBydWxlczoKICAgICAgICAgICAgdHJ5OgogICAgICAgICAgICAgICAgIyAxLiBHZXQgVmFsdWUgQQogICAgICAgICAgICAgICAgIyBIYW5kbGUgYmFzaWMgaW5kaWNhdG9ycyBtYXBwaW5ncwogICAgICAgICAgICAgICAgaW5kX2EgPSBzZWxmLl9tYXBfaW5kaWNhdG9yX25hbWUocnVsZVsnYSddLCBydWxlLmdldCgncGEnKSkKICAgICAgICAgICAgICAgIHZhbF9hID0gbGFzdF9yb3cuZ2V0KGluZF9hKQogICAgICAgICAgICAgICAgcHJldl92YWxfYSA9IHByZXZfcm93LmdldChpbmRfYSkKICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgIyAyLiBHZXQgVmFsdWUgQgogICAgICAgICAgICAgICAgaWYgcnVsZVsndGFyZ2V0J10gPT0gJ3ZhbHVlJzoKICAgICAgICAgICAgICAgICAgICB2YWxfYiA9IGZsb2F0KHJ1bGVbJ3ZhbCddKQogICAgICAgICAgICAgICAgICAgIHByZXZfdmFsX2IgPSB2YWxfYgogICAgICAgICAgICAgICAgZWxzZToKICAgICAgICAgICAgICAgICAgICBpbmRfYiA9IHNlbGYuX21hcF9pbmRpY2F0b3JfbmFtZShydWxlWydiJ10sIHJ1bGUuZ2V0KCdwYicpKQogICAgICAgICAgICAgICAgICAgIHZhbF9iID0gbGFzdF9yb3cuZ2V0KGluZF9iKQogICAgICAgICAgICAgICAgICAgIHByZXZfdmFsX2IgPSBwcmV2X3Jvdy5nZXQoaW5kX2IpCgogICAgICAgICAgICAgICAgaWYgdmFsX2EgaXMgTm9uZSBvciB2YWxfYiBpcyBOb25lOgogICAgICAgICAgICAgICAgICAgIHJldHVybiBGYWxzZQoKICAgICAgICAgICAgICAgICMgMy4gQ29tcGFyZSBiYXNlZCBvbiBPcGVyYXRvcgogICAgICAgICAgICAgICAgb3AgPSBydWxlWydvcCddCiAgICAgICAgICAgICAgICBpZiBvcCA9PSAnPic6CiAgICAgICAgICAgICAgICAgICAgaWYgbm90ICh2YWxfYSA+IHZhbF9iKTogcmV0dXJuIEZhbHNlCiAgICAgICAgICAgICAgICBlbGlmIG9wID09ICc8JzoKICAgICAgICAgICAgICAgICAgICBpZiBub3QgKHZhbF9hIDwgdmFsX2IpOiByZXR1cm4gRmFsc2UKICAgICAgICAgICAgICAgIGVsaWYgb3AgPT0gJ2VxdWFscyc6CiAgICAgICAgICAgICAgICAgICAgaWYgbm90ICh2YWxfYSA9PSB2YWxfYik6IHJldHVybiBGYWxzZQogICAgICAgICAgICAgICAgZWxpZiBvcCA9PSAnY3Jvc3NlcyBhYm92ZSc6CiAgICAgICAgICAgICAgICAgICAgIyAoUHJldiBBIDw9IFByZXYgQikgQU5EIChDdXJyIEEgPiBDdXJyIEIpCiAgICAgICAgICAgICAgICAgICAgaWYgbm90IChwcmV2X3ZhbF9hIDw9IHByZXZfdmFsX2IgYW5kIHZhbF9hID4gdmFsX2IpOiByZXR1cm4gRmFsc2UKICAgICAgICAgICAgICAgIGVsaWYgb3AgPT0gJ2Nyb3NzZXMgYmVsb3cnOgogICAgICAgICAgICAgICAgICAgICMgKFByZXYgQSA+PSBQcmV2IEIpIEFORCAoQ3VyciBBIDwgQ3VyciBCKQogICAgICAgICAgICAgICAgICAgIGlmIG5vdCAocHJldl92YWxfYSA+PSBwcmV2X3ZhbF9iIGFuZCB2YWxfYSA8IHZhbF9iKTogcmV0dXJuIEZhbHNlCiAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgIGV4Y2VwdCBFeGNlcHRpb24gYXMgZToKICAgICAgICAgICAgICAgIGxvZ2dlci5lcnJvcihmIlJ1bGUgZXZhbHVhdGlvbiBlcnJvcjoge3J1bGV9IC0+IHtlfSIpCiAgICAgICAgICAgICAgICByZXR1cm4gRmFsc2UKICAgICAgICAgICAgICAgIAogICAgICAgIHJldHVybiBUcnVlCgogICAgZGVmIF9tYXBfaW5kaWNhdG9yX25hbWUoc2VsZiwgbmFtZSwgcGFyYW0pOgogICAgICAgICIiIkhlbHBlciB0byBtYXAgVUkgbmFtZXMgdG8gUGFuZGFzIFRBIGNvbHVtbiBuYW1lcyIiIgogICAgICAgICMgRGVmYXVsdHMgaWYgcGFyYW0gZW1wdHkKICAgICAgICBwID0gcGFyYW0gaWYgcGFyYW0gZWxzZSAiMTQiCiAgICAgICAgCiAgICAgICAgaWYgbmFtZSA9PSAiUlNJIjogcmV0dXJuIGYiUlNJX3twfSIgaWYgZiJSU0lfe3B9IiBpbiBbIlJTSV8xNCJdIGVsc2UgIlJTSSIgIyBGYWxsYmFjayBzaW1wbGlmaWVkCiAgICAgICAgaWYgbmFtZSA9PSAiRU1BIjogcmV0dXJuIGYiRU1BX3twfSIKICAgICAgICBpZiBuYW1lID09ICJTTUEiOiByZXR1cm4gZiJTTUFfe3B9IgogICAgICAgIGlmIG5hbWUgPT0gIkFEWCI6IHJldHVybiBmIkFEWF97cH0iCiAgICAgICAgaWYgbmFtZSA9PSAiQVRSIjogcmV0dXJuIGYiQVRSX3twfSIKICAgICAgICBpZiBuYW1lID09ICJWV0FQIjogcmV0dXJuICJWV0FQX0QiICMgU3RhbmRhcmQgZGFpbHkgVldBUAogICAgICAgICMgQWRkIG1vcmUgbWFwcGluZ3MgYXMgbmVlZGVkCiAgICAgICAgcmV0dXJuIG5hbWUKCiAgICBkZWYgY2hlY2tfZHluYW1pY19zaWduYWwoc2VsZiwgZGF0YV9tYXAsIHN0cmF0ZWd5X2xvZ2ljLCB0aW1lZnJhbWVzKToKICAgICAgICAiIiIKICAgICAgICBFdmFsdWF0ZXMgdGhlIGZ1bGwgc3RyYXRlZ3kgbG9naWMgZnJvbSB0aGUgVUkgY29uZmlndXJhdGlvbi4KICAgICAgICBTdXBwb3J0cyBWMSAoTGVnYWN5KSBhbmQgVjIgKEFsaWdubWVudCkuCiAgICAgICAgIiIiCiAgICAgICAgdmVyc2lvbiA9IHN0cmF0ZWd5X2xvZ2ljLmdldCgndmVyc2lvbicsICcxLjAnKQoKICAgICAgICBpZiB2ZXJzaW9uID09ICcyLjAnOgogICAgICAgICAgICAjIFYyOiBHbG9iYWwgQWxpZ25tZW50IExvZ2ljCiAgICAgICAgICAgICMgQUxMIHNlbGVjdGVkIGNvbXBvbmVudHMgb24gQUxMIHRpbWVmcmFtZXMgbXVzdCBhbGlnbi4KICAgICAgICAgICAgcmVzdWx0cyA9IFtdCiAgICAgICAgICAgIGZvciB0Zl9rZXkgaW4gWydsYXJnZScsICdtZWQnLCAnc21hbGwnXToKICAgICAgICAgICAgICAgIGlmIHRmX2tleSBpbiBzdHJhdGVneV9sb2dpYzoKICAgICAgICAgICAgICAgICAgICAjIE1hcCAnbGFyZ2UnIHRvIHRpbWVmcmFtZVsyXSwgZXRjLiAoYXNzdW1pbmcgMyBURnMpCiAgICAgICAgICAgICAgICAgICAgIyBUaGlzIGlzIHNsaWdodGx5IGJyaXR0bGUgYnV0IG1hdGNoZXMgY3VycmVudCBVSSBhc3N1bXB0aW9ucy4KICAgICAgICAgICAgICAgICAgICAjIEJFVFRFUjogVXNlIHRmIGluZGV4IGZyb20gY29uZmlnLgogICAgICAgICAgICAgICAgICAgIHRmX2lkeCA9IDIgaWYgdGZfa2V5ID09ICdsYXJnZScgZWxzZSAxIGlmIHRmX2tleSA9PSAnbWVkJyBlbHNlIDAKICAgICAgICAgICAgICAgICAgICBpZiBsZW4odGltZWZyYW1lcykgPiB0Zl9pZHg6CiAgICAgICAgICAgICAgICAgICAgICAgIHRmID0gdGltZWZyYW1lc1t0Zl9pZHhdCiAgICAgICAgICAgICAgICAgICAgICAgIGlmIHRmIGluIGRhdGFfbWFwOgogICAgICAgICAgICAgICAgICAgICAgICAgICAgcmVzID0gc2VsZi5ldmFsdWF0ZV9hbGlnbm1lbnQoZGF0YV9tYXBbdGZdLCBzdHJhdGVneV9sb2dpY1t0Zl9rZXldKQogICAgICAgICAgICAgICAgICAgICAgICAgICAgaWYgcmVzOiByZXN1bHRzLmFwcGVuZChyZXMpCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBlbHNlOiByZXR1cm4gTm9uZSAjIERpc2Nvbm5lY3Q6IE9uZSBURiBoYXMgbm8gYWxpZ25tZW50CiAgICAgICAgICAgIAogICAgICAgICAgICAjIEZpbmFsIENoZWNrOiBEbyBhbGwgVEZzIHRoYXQgaGFkIHJ1bGVzIGFncmVlPwogICAgICAgICAgICBpZiByZXN1bHRzIGFuZCBhbGwociA9PSAnQlVZJyBmb3IgciBpbiByZXN1bHRzKTogcmV0dXJuICdCVVknCiAgICAgICAgICAgIGlmIHJlc3VsdHMgYW5kIGFsbChyID09ICdTRUxMJyBmb3IgciBpbiByZXN1bHRzKTogcmV0dXJuICdTRUxMJwogICAgICAgICAgICByZXR1cm4gTm9uZQoKICAgICAgICBlbHNlOgogICAgICAgICAgICAjIFYxOiBMZWdhY3kgSW5kaWNhdG9yIHZzIEluZGljYXRvciBMb2dpYwogICAgICAgICAgICB0cmVuZF9hbGlnbmVkID0gVHJ1ZQogICAgICAgICAgICBpZiBsZW4odGltZWZyYW1lcykgPj0gMyBhbmQgc3RyYXRlZ3lfbG9naWMuZ2V0KCdsYXJnZScpOgogICAgICAgICAgICAgICAgdGZfbGFyZ2UgPSB0aW1lZnJhbWVzWzJdCiAgICAgICAgICAgICAgICBpZiB0Zl9sYXJnZSBpbiBkYXRhX21hcDoKICAgICAgICAgICAgICAgICAgICBpZiBub3Qgc2VsZi5ldmFsdWF0ZV9keW5hbWljX3J1bGVzKGRhdGFfbWFwW3RmX2xhcmdlXSwgc3RyYXRlZ3lfbG9naWNbJ2xhcmdlJ10pOgogICAgICAgICAgICAgICAgICAgICAgICB0cmVuZF9hbGlnbmVkID0gRmFsc2UKICAgICAgICAgICAgaWYgbGVuKHRpbWVmcmFtZXMpID49IDIgYW5kIHN0cmF0ZWd5X2xvZ2ljLmdldCgnbWVkJyk6CiAgICAgICAgICAgICAgICB0Zl9tZWQgPSB0aW1lZnJhbWVzWzFdCiAgICAgICAgICAgICAgICBpZiB0Zl9tZWQgaW4gZGF0YV9tYXA6CiAgICAgICAgICAgICAgICAgICAgaWYgbm90IHNlbGYuZXZhbHVhdGVfZHluYW1pY19ydWxlcyhkYXRhX21hcFt0Zl9tZWRdLCBzdHJhdGVneV9sb2dpY1snbWVkJ10pOgogICAgICAgICAgICAgICAgICAgICAgICB0cmVuZF9hbGlnbmVkID0gRmFsc2UKICAgICAgICAgICAgaWYgbm90IHRyZW5kX2FsaWduZWQ6IHJldHVybiBOb25lCiAgICAgICAgICAgIHRmX3NtYWxsID0gdGltZWZyYW1lc1swXQogICAgICAgICAgICBpZiB0Zl9zbWFsbCBpbiBkYXRhX21hcCBhbmQgc3RyYXRlZ3lfbG9naWMuZ2V0KCdzbWFsbCcpOgogICAgICAgICAgICAgICAgaWYgc2VsZi5ldmFsdWF0ZV9keW5hbWljX3J1bGVzKGRhdGFfbWFwW3RmX3NtYWxsXSwgc3RyYXRlZ3lfbG9naWNbJ3NtYWxsJ10pOgogICAgICAgICAgICAgICAgICAgIHJldHVybiAiQlVZIgogICAgICAgICAgICByZXR1cm4gTm9uZQoKICAgIGRlZiBjaGVja190cmVuZChzZWxmLCBkZl8xZCwgZGZfNGgpOgogICAgICAgICIiIgogICAgICAgIENoZWNrcyBpZiB0aGUgaGlnaGVyIHRpbWVmcmFtZXMgYXJlIGFsaWduZWQuCiAgICAgICAgUmV0dXJuczogJ1VQJywgJ0RPV04nLCBvciAnTkVVVFJBTCcKICAgICAgICAiIiIKICAgICAgICAjIEdldCBsYXN0IGNsb3NlZCBjYW5kbGUKICAgICAgICBsYXN0XzFkID0gZGZfMWQuaWxvY1stMV0KICAgICAgICBsYXN0XzRoID0gZGZfNGguaWxvY1stMV0KICAgICAgICAKICAgICAgICAjIERlZmluZSBUcmVuZCBDcml0ZXJpYQogICAgICAgICMgMS4gUHJpY2UgdnMgRU1BcwogICAgICAgICMgMi4gRU1BIENyb3NzCiAgICAgICAgIyAzLiBBRFggU3RyZW5ndGggKD4yMCkKICAgICAgICAjIDQuICtESSB2cyAtREkKICAgICAgICAKICAgICAgICAjIENoZWNrIDFEIFRyZW5kCiAgICAgICAgdHJlbmRfMWQgPSBzZWxmLl9ldmFsdWF0ZV90cmVuZChsYXN0XzFkKQogICAgICAgIAogICAgICAgICMgQ2hlY2sgNEggVHJlbmQKICAgICAgICB0cmVuZF80aCA9IHNlbGYuX2V2YWx1YXRlX3RyZW5kKGxhc3RfNGgpCiAgICAgICAgCiAgICAgICAgaWYgdHJlbmRfMWQgPT0gJ1VQJyBhbmQgdHJlbmRfNGggPT0gJ1VQJzoKICAgICAgICAgICAgcmV0dXJuICdVUCcKICAgICAgICBlbGlmIHRyZW5kXzFkID09ICdET1dOJyBhbmQgdHJlbmRfNGggPT0gJ0RPV04nOgogICAgICAgICAgICByZXR1cm4gJ0RPV04nCiAgICAgICAgZWxzZToKICAgICAgICAgICAgcmV0dXJuICdORVVUUkFMJwoKICAgIGRlZiBfZXZhbHVhdGVfdHJlbmQoc2VsZiwgcm93KToKICAgICAgICAiIiIKICAgICAgICBIZWxwZXIgdG8gZXZhbHVhdGUgYSBzaW5nbGUgcm93J3MgdHJlbmQuCiAgICAgICAgIiIiCiAgICAgICAgYWR4X3RocmVzaG9sZCA9IDIwCiAgICAgICAgCiAgICAgICAgIyBDaGVjayBpZiBpbmRpY2F0b3JzIGV4aXN0IChVSSBzYWZldHkgY2hlY2spCiAgICAgICAgaWYgJ0VNQV81MCcgbm90IGluIHJvdyBvciAnRU1BXzIwMCcgbm90IGluIHJvdyBvciAnQURYXzE0JyBub3QgaW4gcm93OgogICAgICAgICAgICByZXR1cm4gJ05FVVRSQUwnCiAgICAgICAgICAgIAogICAgICAgICMgVXB0cmVuZCBDb25kaXRpb24KICAgICAgICBpZiAocm93WydjbG9zZSddID4gcm93WydFTUFfNTAnXSA+IHJvd1snRU1BXzIwMCddIGFuZAogICAgICAgICAgICByb3dbJ0FEWF8xNCddID4gYWR4X3RocmVzaG9sZCBhbmQKICAgICAgICAgICAgcm93WydETVBfMTQnXSA+IHJvd1snRE1OXzE0J10pOgogICAgICAgICAgICByZXR1cm4gJ1VQJwogICAgICAgICAgICAKICAgICAgICAjIERvd250cmVuZCBDb25kaXRpb24KICAgICAgICBpZiAocm93WydjbG9zZSddIDwgcm93WydFTUFfNTAnXSA8IHJvd1snRU1BXzIwMCddIGFuZAogICAgICAgICAgICByb3dbJ0FEWF8xNCddID4gYWR4X3RocmVzaG9sZCBhbmQKICAgICAgICAgICAgcm93WydETU5fMTQnXSA+IHJvd1snRE1QXzE0J10pOgogICAgICAgICAgICByZXR1cm4gJ0RPV04nCiAgICAgICAgICAgIAogICAgICAgIHJldHVybiAnTkVVVFJBTCcKCiAgICBkZWYgZ2V0X3Jvd190cmVuZChzZWxmLCByb3cpOgogICAgICAgICIiIlB1YmxpYyB3cmFwcGVyIGZvciBVSSB0cmVuZCBkaXNwbGF5IiIiCiAgICAgICAgcmV0dXJuIHNlbGYuX2V2YWx1YXRlX3RyZW5kKHJvdykKCiAgICBkZWYgY2hlY2tfc3ByZWFkKHNlbGYsIHNwcmVhZF9wY3QsIG1heF9zcHJlYWRfcGN0KToKICAgICAgICAiIiIKICAgICAgICBNYW5kYXRvcnkgc3ByZWFkIGZpbHRlci4gYHNwcmVhZF9wY3RgIGNvbWVzIGZyb20gdGhlIHRpY2tlciBzbmFwc2hvdC4KICAgICAgICBVbmtub3duIHNwcmVhZCAobm8gYmlkL2FzaykgZmFpbHMgY2xvc2VkLgogICAgICAgICIiIgogICAgICAgIGlmIHNwcmVhZF9wY3QgaXMgTm9uZToKICAgICAgICAgICAgcmV0dXJuIEZhbHNlCiAgICAgICAgcmV0dXJuIHNwcmVhZF9wY3QgPD0gbWF4X3NwcmVhZF9wY3QKCiAgICBkZWYgY2hlY2tfdHJpZ2dlcihzZWxmLCBkZl8xaCwgdHJlbmRfZGlyZWN0aW9uKToKICAgICAgICAiIiIKICAgICAgICBDaGVja3MgZm9yIGVudHJ5IHRyaWdnZXJzIG9uIGxvd2VyIHRpbWVmcmFtZSAoMUgpIGFsaWduZWQgd2l0aCBUcmVuZC4KICAgICAgICBSZXR1cm5zOiAnQlVZJywgJ1NFTEwnLCBvciBOb25lCiAgICAgICAgIiIiCiAgICAgICAgbGFzdF9yb3cgPSBkZl8xaC5pbG9jWy0xXQogICAgICAgIHByZXZfcm93ID0gZGZfMWguaWxvY1stMl0gIyBUbyBjaGVjayBmb3IgY3Jvc3NvdmVyCiAgICAgICAgCiAgICAgICAgIyBWb2xhdGlsaXR5IEZpbHRlciAoQVRSKQogICAgICAgICMgVE9ETzogRGVmaW5lIGEgZHluYW1pYyB0aHJlc2hvbGQgYmFzZWQgb24gYXNzZXQgcHJpY2Ugb3IgJT8KICAgICAgICAjIEZvciBub3csIGVuc3VyaW5nIGl0J3Mgbm90IHplcm8vbnVsbC4KICAgICAgICBpZiBsYXN0X3Jvd1snQVRSJ10gPT0gMDoKICAgICAgICAgICAgcmV0dXJuIE5vbmUKCiAgICAgICAgaWYgdHJlbmRfZGlyZWN0aW9uID09ICdVUCc6CiAgICAgICAgICAgICMgQnV5IFRyaWdnZXI6IEVNQSAxMCBjcm9zc2VzIEFCT1ZFIEVNQSAyMCBBTkQgUlNJIGlzIHJpc2luZy9idWxsaXNoCiAgICAgICAgICAgIGlmIChwcmV2X3Jvd1snRU1BXzEwJ10gPD0gcHJldl9yb3dbJ0VNQV8yMCddIGFuZCAKICAgICAgICAgICAgICAgIGxhc3Rfcm93WydFTUFfMTAnXSA+IGxhc3Rfcm93WydFTUFfMjAnXSBhbmQKICAgICAgICAgICAgICAgIGxhc3Rfcm93WydSU0knXSA+IDQwKTogIyBSU0kgY2hlY2sKICAgICAgICAgICAgICAgIHJldHVybiAnQlVZJwogICAgICAgICAgICAgICAgCiAgICAgICAgZWxpZiB0cmVuZF9kaXJlY3Rpb24gPT0gJ0RPV04nOgogICAgICAgICAgICAjIFNlbGwgVHJpZ2dlcjogRU1BIDEwIGNyb3NzZXMgQkVMT1cgRU1BIDIwIEFORCBSU0kgaXMgZmFsbGluZy9iZWFyaXNoCiAgICAgICAgICAgIGlmIChwcmV2X3Jvd1snRU1BXzEwJ10gPj0gcHJldl9yb3dbJ0VNQV8yMCddIGFuZCAKICAgICAgICAgICAgICAgIGxhc3Rfcm93WydFTUFfMTAnXSA8IGxhc3Rfcm93WydFTUFfMjAnXSBhbmQKICAgICAgICAgICAgICAgIGxhc3Rfcm93WydSU0knXSA8IDYwKTogIyBSU0kgY2hlY2sKICAgICAgICAgICAgICAgIHJldHVybiAnU0VMTCcKICAgICAgICAgICAgICAgIAogICAgICAgIHJldHVybiBOb25lCg==
\ No newline at end of file
@@ -0,0 +1,119 @@
+import time
+import logging
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+class TickerTable:
+    """Column arrays of one bulk `fetch_tickers` call (one row per symbol)."""
+    def __init__(self, tickers, fetched_at):
+        self.fetched_at = fetched_at
+        self.symbols = np.array(list(tickers.keys()), dtype=object)
+        self.index = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+        def column(field):
+            return np.array([t.get(field) if t.get(field) is not None else np.nan for t in tickers.values()], dtype=np.float64)
+
+        self.bid = column('bid')
+        self.ask = column('ask')
+        self.last = column('last')
+        self.change_pct = column('percentage')
+        base_volume = column('baseVolume')
+        quote_volume = column('quoteVolume')
+        # Some exchanges only report base volume
+        self.quote_volume = np.where(np.isnan(quote_volume), base_volume * self.last, quote_volume)
+
+        mid = (self.bid + self.ask) / 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.spread_pct = np.where(mid > 0, (self.ask - self.bid) / mid * 100, np.nan)
+
+    def to_frame(self):
+        return pd.DataFrame({
+            'symbol': self.symbols,
+            'last': self.last,
+            'bid': self.bid,
+            'ask': self.ask,
+            'spread_pct': self.spread_pct,
+            'quote_volume': self.quote_volume,
+            'change_pct': self.change_pct,
+        })
+
+class TickerSnapshotService:
+    """
+    One bulk `fetch_tickers` per exchange/market per interval, served from memory.
+
+    Feeds the mandatory spread filter in the Hive and the volume-ranked
+    universes of the dashboard's Watchlist Manager without per-symbol requests.
+    If refreshes keep failing, a snapshot older than `max_age` (default three
+    intervals) is no longer served, so the spread filter fails closed.
+    """
+    def __init__(self, interval=30, max_age=None):
+        self.interval = interval
+        self.max_age = max_age if max_age is not None else 3 * interval
+        self.exchanges = {} # {exchange_key: ccxt exchange}
+        self.tables = {} # {exchange_key: TickerTable}
+        self.last_attempt = {} # {exchange_key: timestamp}
+
+    def register(self, key, exchange):
+        """Registers an exchange client under a key such as 'binance_Spot'."""
+        self.exchanges[key] = exchange
+
+    def refresh(self, key):
+        exchange = self.exchanges[key]
+        self.last_attempt[key] = time.time()
+        try:
+            tickers = exchange.fetch_tickers()
+        except Exception as e:
+            # Keep serving the previous snapshot; retry next interval
+            logger.error(f"Ticker snapshot failed for {key}: {e}")
+            return self.tables.get(key)
+        table = TickerTable(tickers, time.time())
+        self.tables[key] = table
+        logger.info(f"Ticker snapshot for {key}: {len(table.symbols)} symbols")
+        return table
+
+    def get_table(self, key):
+        """
+        Returns the snapshot for `key`, refreshing it at most once per interval,
+        or None if there is none younger than `max_age`.
+        """
+        now = time.time()
+        if now - self.last_attempt.get(key, 0) >= self.interval:
+            table = self.refresh(key)
+        else:
+            table = self.tables.get(key)
+        if table is None or now - table.fetched_at > self.max_age:
+            return None
+        return table
+
+    def get_spread(self, key, symbol):
+        """Bid/ask spread in % of mid price, or None if unknown."""
+        table = self.get_table(key)
+        if table is None or symbol not in table.index:
+            return None
+        spread = table.spread_pct[table.index[symbol]]
+        return None if np.isnan(spread) else float(spread)
+
+    def get_frame(self, key):
+        table = self.get_table(key)
+        return table.to_frame() if table is not None else pd.DataFrame()
+
+    def top_by_volume(self, key, n=100, symbols=None, max_spread_pct=None):
+        """
+        Volume-ranked universe as a DataFrame, optionally restricted to
+        `symbols` and to pairs whose spread is at most `max_spread_pct`.
+        """
+        table = self.get_table(key)
+        if table is None:
+            return pd.DataFrame()
+
+        mask = ~np.isnan(table.quote_volume)
+        if symbols is not None:
+            mask &= np.isin(table.symbols, list(symbols))
+        if max_spread_pct is not None:
+            mask &= table.spread_pct <= max_spread_pct
+
+        idx = np.flatnonzero(mask)
+        idx = idx[np.argsort(-table.quote_volume[idx], kind='stable')][:n]
+        return table.to_frame().iloc[idx].reset_index(drop=True)
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Services import their modules flat (as in the Docker images)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for service in ('monitoring_bot', 'trading_bot', 'dashboard'):
+    path = os.path.join(ROOT, service)
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,95 @@
+import os
+import numpy as np
+import pandas as pd
+
+from candle_store import CandleStore
+from data_fetcher import DataFetcher
+from fake_exchange import FakeExchange
+
+def candles(n=500, start=0):
+    ts = pd.to_datetime(np.arange(start, start + n) * 3600 * 1000, unit='ms')
+    values = np.linspace(65432.19, 65500.0, n)
+    return pd.DataFrame({'timestamp': ts, 'open': values, 'high': values, 'low': values, 'close': values, 'volume': values})
+
+def series_bytes(n=500, dtype='float64'):
+    return n * 8 + n * 5 * np.dtype(dtype).itemsize
+
+def test_budget_is_the_store_own_bytes(tmp_path):
+    # ~43 series fit; process RSS is far above 1MB and must not matter
+    store = CandleStore(budget_mb=1, spill_dir=str(tmp_path))
+    for i in range(50):
+        store.put(("i1", f"S{i}", "1h"), candles())
+    fit = store.budget_bytes // series_bytes()
+    assert len(store.resident) == fit
+    assert len(store.spilled) == 50 - fit
+    assert store.resident_bytes == sum(s.nbytes for s in store.resident.values())
+    assert store.resident_bytes <= store.budget_bytes
+
+def test_under_budget_reads_do_not_touch_disk(tmp_path):
+    store = CandleStore(budget_mb=64, spill_dir=str(tmp_path), rss_limit_mb=1024 * 1024)
+    for i in range(50):
+        store.put(("i1", f"S{i}", "1h"), candles())
+    for i in range(50):
+        store.get_frame(("i1", f"S{i}", "1h"))
+    assert not store.spilled
+    assert not list(os.scandir(store.spill_dir))
+
+def test_spilled_series_reload_transparently(tmp_path):
+    store = CandleStore(budget_mb=1, spill_dir=str(tmp_path))
+    store.put(("i1", "COLD", "1h"), candles())
+    for i in range(60):
+        store.put(("i1", f"S{i}", "1h"), candles())
+    assert ("i1", "COLD", "1h") in store.spilled
+    df = store.get_frame(("i1", "COLD", "1h"))
+    assert len(df) == 500
+    assert ("i1", "COLD", "1h") in store.resident
+
+def test_low_priority_instances_are_spilled_first(tmp_path):
+    store = CandleStore(budget_mb=1, spill_dir=str(tmp_path))
+    store.set_priority("low", -1)
+    for i in range(5):
+        store.put(("low", f"S{i}", "1h"), candles())
+    for i in range(60):
+        store.put(("high", f"S{i}", "1h"), candles())
+    assert not any(k[0] == "low" for k in store.resident)
+
+def test_local_candles_same_values_resident_or_not(tmp_path):
+    exchange = FakeExchange(symbols=["BTC/USDT"])
+    db_path = str(tmp_path / "candles.db")
+    cached = DataFetcher('fake', db_path=db_path, exchange=exchange,
+                         candle_store=CandleStore(spill_dir=str(tmp_path / "spill")))
+    cached.fetch_and_sync("i1", "BTC/USDT", "1h", limit=100)
+
+    from_db = cached.get_local_candles("i1", "BTC/USDT", "1h", limit=100)
+    resident = cached.get_local_candles("i1", "BTC/USDT", "1h", limit=100)
+    plain = DataFetcher('fake', db_path=db_path, exchange=exchange).get_local_candles("i1", "BTC/USDT", "1h", limit=100)
+
+    assert resident['close'].dtype == np.float64
+    np.testing.assert_array_equal(from_db['close'].to_numpy(), resident['close'].to_numpy())
+    np.testing.assert_array_equal(plain['close'].to_numpy(), resident['close'].to_numpy())
+
+def test_nodes_do_not_share_spill_files(tmp_path):
+    a = CandleStore(budget_mb=1, spill_dir=str(tmp_path), node_id="node-a")
+    b = CandleStore(budget_mb=1, spill_dir=str(tmp_path), node_id="node-b")
+    key = ("i1", "BTC/USDT", "1h")
+    for store in (a, b):
+        store.put(key, candles())
+        for i in range(60):
+            store.put(("other", f"S{i}", "1h"), candles())
+        assert key in store.spilled
+
+    # Node A unloads the instance after handing it over to B
+    a.drop_instance("i1")
+    assert len(b.get_frame(key)) == 500
+
+def test_spill_dir_is_reset_on_start_and_removed_on_close(tmp_path):
+    store = CandleStore(budget_mb=1, spill_dir=str(tmp_path), node_id="node-a")
+    for i in range(60):
+        store.put(("i1", f"S{i}", "1h"), candles())
+    spill_dir = tmp_path / "node-a"
+    assert any(spill_dir.iterdir())
+
+    restarted = CandleStore(budget_mb=1, spill_dir=str(tmp_path), node_id="node-a")
+    assert not any(spill_dir.iterdir())
+    restarted.close()
+    assert not spill_dir.exists()
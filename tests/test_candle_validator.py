@@ -0,0 +1,86 @@
+import sqlite3
+import numpy as np
+import pandas as pd
+
+from candle_validator import CandleValidator, check_continuity, to_epoch_ms
+from data_fetcher import DataFetcher
+from fake_exchange import FakeExchange
+
+HOUR = 3600 * 1000
+
+def frame(ts_ms):
+    return pd.DataFrame({
+        'timestamp': pd.to_datetime(ts_ms, unit='ms'),
+        'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': 1.0, 'volume': 1.0,
+    })
+
+def test_continuous_series_is_clean():
+    ts = np.arange(10, dtype=np.int64) * HOUR
+    assert check_continuity(ts, HOUR) == ([], 0, 0)
+
+def test_gap_is_reported_as_missing_range():
+    ts = np.array([0, 1, 2, 6, 7], dtype=np.int64) * HOUR
+    gaps, duplicates, out_of_order = check_continuity(ts, HOUR)
+    assert gaps == [(3 * HOUR, 5 * HOUR, 3)]
+    assert (duplicates, out_of_order) == (0, 0)
+
+def test_duplicates_and_disorder_are_counted_not_gaps():
+    ts = np.array([0, 2, 1, 2, 3], dtype=np.int64) * HOUR
+    gaps, duplicates, out_of_order = check_continuity(ts, HOUR)
+    assert gaps == []
+    assert duplicates == 1
+    assert out_of_order == 1
+
+def test_to_epoch_ms_accepts_strings_and_ints():
+    ts = np.array([0, HOUR], dtype=np.int64)
+    assert to_epoch_ms(ts).tolist() == ts.tolist()
+    assert to_epoch_ms(['1970-01-01 00:00:00', '1970-01-01 01:00:00']).tolist() == ts.tolist()
+
+def test_validate_cleans_frame_and_queues_gaps():
+    validator = CandleValidator()
+    df = frame(np.array([1, 0, 1, 5], dtype=np.int64) * HOUR)
+    clean, health = validator.validate("i1", "BTC/USDT", "1h", df, HOUR)
+
+    assert to_epoch_ms(clean['timestamp']).tolist() == [0, HOUR, 5 * HOUR]
+    assert not health.is_healthy
+    assert health.missing_candles == 3
+    assert validator.pop_repairs("i1") == [("BTC/USDT", "1h", 2 * HOUR, 4 * HOUR)]
+    assert validator.pop_repairs("i1") == []
+
+def test_unrepairable_ranges_stop_failing_validation():
+    validator = CandleValidator()
+    df = frame(np.array([0, 3], dtype=np.int64) * HOUR)
+    validator.validate("i1", "BTC/USDT", "1h", df, HOUR)
+    validator.mark_unrepairable("i1", validator.pop_repairs("i1"))
+
+    _, health = validator.validate("i1", "BTC/USDT", "1h", df, HOUR)
+    assert health.is_healthy
+    assert health.ignored_gaps == 1
+
+def test_repair_gaps_fetches_only_missing_range(tmp_path):
+    exchange = FakeExchange(symbols=["BTC/USDT"])
+    fetcher = DataFetcher('fake', db_path=str(tmp_path / "candles.db"), exchange=exchange)
+    candles = fetcher.fetch_and_sync("i1", "BTC/USDT", "1h", limit=50)
+    ts = to_epoch_ms(candles['timestamp'])
+
+    # Punch a hole of 5 candles into the stored series
+    hole = ts[10:15]
+    conn = sqlite3.connect(fetcher.db_path)
+    conn.executemany("DELETE FROM candles WHERE timestamp=?", [(pd.to_datetime(t, unit='ms').isoformat(' '),) for t in hole])
+    conn.commit()
+    conn.close()
+
+    validator = CandleValidator()
+    df = fetcher.get_local_candles("i1", "BTC/USDT", "1h", limit=50)
+    _, health = validator.validate("i1", "BTC/USDT", "1h", df, HOUR)
+    assert health.missing_candles == 5
+
+    calls_before = exchange.calls['fetch_ohlcv']
+    unrepairable = fetcher.repair_gaps("i1", validator.pop_repairs("i1"))
+    assert unrepairable == []
+    assert exchange.calls['fetch_ohlcv'] == calls_before + 1
+
+    df = fetcher.get_local_candles("i1", "BTC/USDT", "1h", limit=50)
+    _, health = validator.validate("i1", "BTC/USDT", "1h", df, HOUR)
+    assert health.is_healthy
+    assert len(df) == 50
@@ -0,0 +1,42 @@
+import pytest
+
+from capital_manager import CapitalManager, build_levels_config
+
+@pytest.mark.parametrize("capital, expected", [
+    (55, ("CRITICAL_LOW", 0)),
+    (60, ("SLevel2", 60)),
+    (79.999, ("SLevel2", 60)),
+    (99.995, ("SLevel1", 80)),
+    (100, ("Level1", 100)),
+    (199.995, ("Level1", 100)),
+    (200, ("Level2", 200)),
+    (5000, ("Level10", 1000)),
+])
+def test_default_levels(capital, expected):
+    manager = CapitalManager(capital)
+    assert manager.get_current_level() == expected
+
+@pytest.mark.parametrize("capital, expected", [
+    (59.99, ("CRITICAL_LOW", 0)),
+    (79.995, ("SLevel2", 60)),
+    (99.995, ("SLevel1", 80)),
+    (150.5, ("Level1", 100)),
+    (299.999, ("Level2", 250)),
+    (10_000, ("Level3", 300)),
+])
+def test_strategy_builder_levels(capital, expected):
+    config = build_levels_config([300, 100, 250], [80, 60])
+    manager = CapitalManager(capital, config)
+    assert manager.get_current_level() == expected
+
+def test_levels_have_no_gaps():
+    config = build_levels_config([100, 200, 300], [80, 60])
+    ordered = sorted(config.values(), key=lambda level: level["min"])
+    for lower, upper in zip(ordered, ordered[1:]):
+        assert lower["max"] == upper["min"]
+    assert ordered[-1]["max"] == float('inf')
+
+def test_position_size_follows_level_after_pnl():
+    manager = CapitalManager(150)
+    assert manager.update_capital(49.995) == ("Level1", 100)
+    assert manager.calculate_position_size(0.02) == pytest.approx(2.0)
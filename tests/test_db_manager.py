@@ -0,0 +1,81 @@
+import sqlite3
+import pytest
+
+from db_manager import DBManager
+
+def open_trade(db, instance_id="a", symbol="BTC/USDT", price=100.0):
+    return db.log_trade({
+        "instance_id": instance_id, "symbol": symbol, "side": "buy",
+        "amount": 1.0, "price": price, "status": "open",
+        "stop_loss": price * 0.9, "take_profit": price * 1.3,
+    })
+
+def test_rollups_track_opens_and_closes(tmp_path):
+    db = DBManager(str(tmp_path / "trades.db"))
+    ids = [open_trade(db) for _ in range(3)]
+    db.close_trades([
+        {"id": ids[0], "exit_price": 110, "pnl": 10},
+        {"id": ids[1], "exit_price": 95, "pnl": -5},
+        {"id": ids[2], "exit_price": 100, "pnl": 0},
+    ])
+    [day] = db.get_rollups(instance_id="a")
+    assert (day['trades_opened'], day['trades_closed']) == (3, 3)
+    # Breakeven is neither a win nor a loss
+    assert (day['wins'], day['losses']) == (1, 1)
+    assert day['realized_pnl'] == pytest.approx(5)
+    assert day['win_rate'] == pytest.approx(1 / 3)
+    assert day['net_opened_notional'] == pytest.approx(0)
+
+def test_closing_twice_is_ignored(tmp_path):
+    db = DBManager(str(tmp_path / "trades.db"))
+    trade_id = open_trade(db)
+    assert len(db.close_trades([{"id": trade_id, "exit_price": 110, "pnl": 10}])) == 1
+    assert db.close_trades([{"id": trade_id, "exit_price": 120, "pnl": 20}]) == []
+    assert db.get_rollups()[0]['trades_closed'] == 1
+
+def test_keyset_pagination(tmp_path):
+    db = DBManager(str(tmp_path / "trades.db"))
+    ids = [open_trade(db, instance_id="a" if i % 2 else "b") for i in range(7)]
+    pages, before_id = [], None
+    while True:
+        page = db.get_trades(instance_id="a", before_id=before_id, limit=2)
+        if not page:
+            break
+        pages.append([t['id'] for t in page])
+        before_id = page[-1]['id']
+    assert pages == [[ids[5], ids[3]], [ids[1]]]
+
+def test_migration_backfills_rollups_from_existing_trades(tmp_path):
+    path = str(tmp_path / "trades.db")
+    # Pre-ledger schema and rows (lowercase status, no instance_id)
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE trades (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, symbol TEXT, side TEXT, amount REAL,
+            entry_price REAL, status TEXT, pnl REAL DEFAULT 0,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP, agent_notes TEXT, user_grade TEXT
+        )
+    ''')
+    rows = [
+        ("BTC/USDT", "buy", 1, 100, "CLOSED", 10, "2025-01-01 10:00:00"),
+        ("BTC/USDT", "buy", 1, 100, "CLOSED", -4, "2025-01-01 12:00:00"),
+        ("ETH/USDT", "sell", 2, 50, "CLOSED", 6, "2025-01-02 09:00:00"),
+        ("ETH/USDT", "buy", 1, 50, "open", 0, "2025-01-02 11:00:00"),
+        ("ETH/USDT", "buy", 1, 50, "REJECTED", 0, "2025-01-02 11:30:00"),
+    ]
+    conn.executemany("INSERT INTO trades (symbol, side, amount, entry_price, status, pnl, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+    db = DBManager(path)
+    rollups = {r['day']: r for r in db.get_rollups(instance_id="default")}
+    assert set(rollups) == {"2025-01-01", "2025-01-02"}
+    assert (rollups["2025-01-01"]['trades_closed'], rollups["2025-01-01"]['wins'], rollups["2025-01-01"]['losses']) == (2, 1, 1)
+    assert rollups["2025-01-01"]['realized_pnl'] == pytest.approx(6)
+    assert rollups["2025-01-02"]['trades_opened'] == 2
+    assert rollups["2025-01-02"]['opened_notional'] == pytest.approx(150)
+    assert [t['id'] for t in db.get_trades(status="OPEN")] == [4]
+
+    # Re-opening the migrated database does not double count
+    db = DBManager(path)
+    assert db.get_rollups(instance_id="default", since_day="2025-01-01")[-1]['trades_closed'] == 2
@@ -0,0 +1,53 @@
+import pytest
+
+from execution_engine import ExecutionEngine
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path) # DBManager's default trades.db
+    return ExecutionEngine()
+
+def signal(**kwargs):
+    return {"symbol": "BTC/USDT", "side": "buy", "price": 100.0, "instance_id": "a", **kwargs}
+
+def test_trade_is_sized_and_armed(engine):
+    result = engine.execute_trade(signal())
+    assert result['status'] == "SUCCESS"
+    assert result['stop_loss'] < 100 < result['take_profit']
+    [trade] = engine.db.get_trades(status="OPEN")
+    assert trade['amount'] > 0
+    assert trade['id'] in engine.monitor.positions
+
+@pytest.mark.parametrize("side, stop_loss, take_profit", [
+    ("buy", 105.0, None),
+    ("buy", 95.0, 99.0),
+    ("sell", 95.0, None),
+    ("sell", 105.0, 101.0),
+])
+def test_levels_on_the_wrong_side_are_rejected(engine, side, stop_loss, take_profit):
+    result = engine.execute_trade(signal(side=side, stop_loss=stop_loss, take_profit=take_profit))
+    assert result['status'] == "FAILED"
+    assert engine.db.get_trades() == []
+
+def test_zero_position_size_is_rejected(engine, monkeypatch):
+    monkeypatch.setattr(engine.risk, "position_size", lambda instance_id: 0.0)
+    result = engine.execute_trade(signal())
+    assert result['status'] == "HALTED"
+    assert engine.db.get_trades() == []
+
+def test_failed_open_leaves_no_trade_position_or_exposure(engine, monkeypatch):
+    engine.risk.get_state("a")
+    before = engine.risk.get_status()
+    def fail(cursor, snapshot):
+        raise RuntimeError("disk full")
+    monkeypatch.setattr(engine.db, "_save_risk_snapshot", fail)
+    result = engine.execute_trade(signal())
+    assert result['status'] == "FAILED"
+    assert engine.db.get_trades() == []
+    assert engine.monitor.positions == {}
+    assert engine.risk.get_status() == before
+
+def test_default_take_profit_uses_instance_rr(engine):
+    engine.risk.get_state("a").rr_ratio = 2.0
+    result = engine.execute_trade(signal(stop_loss=98.0))
+    assert result['take_profit'] == pytest.approx(104.0)
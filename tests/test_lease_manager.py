@@ -0,0 +1,57 @@
+import time
+import sqlite3
+
+from lease_manager import LeaseManager
+
+INSTANCES = [f"inst{i}" for i in range(7)]
+
+def owners(db_path):
+    conn = sqlite3.connect(db_path)
+    rows = dict(conn.execute("SELECT instance_id, owner FROM instance_leases"))
+    conn.close()
+    return rows
+
+def test_nodes_split_instances_fairly(tmp_path):
+    db = str(tmp_path / "trades.db")
+    a = LeaseManager(db, node_id="a")
+    b = LeaseManager(db, node_id="b")
+    a.heartbeat(INSTANCES)
+    b.heartbeat(INSTANCES)
+    owned_a = a.heartbeat(INSTANCES)
+    owned_b = b.heartbeat(INSTANCES)
+    assert owned_a.isdisjoint(owned_b)
+    assert owned_a | owned_b == set(INSTANCES)
+    assert abs(len(owned_a) - len(owned_b)) <= 1
+
+def test_survivor_takes_over_including_own_lapsed_leases(tmp_path):
+    db = str(tmp_path / "trades.db")
+    nodes = [LeaseManager(db, node_id=n, lease_ttl=60) for n in "abc"]
+    for _ in range(2):
+        for node in nodes:
+            node.heartbeat(INSTANCES)
+
+    # b and c die; every lease (including a's own) lapses
+    conn = sqlite3.connect(db)
+    conn.execute("UPDATE instance_leases SET expires_at=?", (time.time() - 1,))
+    conn.execute("UPDATE hive_nodes SET last_heartbeat=? WHERE node_id != 'a'", (time.time() - 3600,))
+    conn.commit()
+    conn.close()
+
+    assert nodes[0].heartbeat(INSTANCES) == set(INSTANCES)
+    assert set(owners(db).values()) == {"a"}
+
+def test_busy_database_surfaces_original_error(tmp_path):
+    db = str(tmp_path / "trades.db")
+    node = LeaseManager(db, node_id="a")
+    blocker = sqlite3.connect(db, isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")
+    node._connect = lambda: sqlite3.connect(db, timeout=0.05, isolation_level=None)
+    try:
+        node.heartbeat(INSTANCES)
+    except sqlite3.OperationalError as e:
+        assert "locked" in str(e)
+    else:
+        raise AssertionError("heartbeat should fail while the database is locked")
+    finally:
+        blocker.execute("ROLLBACK")
+        blocker.close()
@@ -0,0 +1,71 @@
+import json
+import queue
+import logging
+
+from log_pipeline import NonBlockingQueueHandler, RepeatFilter, setup_logging, stop_logging
+
+class Exploding:
+    """Argument whose formatting must never happen for suppressed records."""
+    def __str__(self):
+        raise AssertionError("suppressed record was formatted")
+
+def make_record(msg, *args, **extra):
+    record = logging.makeLogRecord({"name": "t", "levelno": logging.INFO, "levelname": "INFO", "msg": msg, "args": args})
+    record.__dict__.update(extra)
+    return record
+
+def test_rate_key_suppresses_before_formatting():
+    rate = RepeatFilter({"Trend for": 3600})
+    first = make_record("Trend for %s: %s", "BTC/USDT", "UP", rate_key=("Trend for", "i1", "BTC/USDT", "UP"))
+    assert rate.filter(first)
+    for _ in range(3):
+        repeat = make_record("Trend for %s: %s", Exploding(), "UP", rate_key=("Trend for", "i1", "BTC/USDT", "UP"))
+        assert not rate.filter(repeat)
+    other = make_record("Trend for %s: %s", "ETH/USDT", "UP", rate_key=("Trend for", "i1", "ETH/USDT", "UP"))
+    assert rate.filter(other)
+
+    rate.last_emit[("Trend for", "i1", "BTC/USDT", "UP")] -= 3601
+    again = make_record("Trend for %s: %s", "BTC/USDT", "UP", rate_key=("Trend for", "i1", "BTC/USDT", "UP"))
+    assert rate.filter(again)
+    assert again.suppressed == 3
+
+def test_prefix_rules_without_rate_key():
+    rate = RepeatFilter({"Trend for": 3600})
+    assert rate.filter(make_record("Trend for %s", "BTC"))
+    assert not rate.filter(make_record("Trend for %s", "BTC"))
+    assert rate.filter(make_record("Trend for %s", "ETH"))
+    assert rate.filter(make_record("Other %s", "BTC"))
+    assert rate.filter(make_record("Other %s", "BTC"))
+
+def test_full_queue_drops_and_reports():
+    log_queue = queue.Queue(maxsize=2)
+    handler = NonBlockingQueueHandler(log_queue)
+    for i in range(5):
+        handler.handle(make_record("line %d", i))
+    assert handler.dropped == 3
+
+    log_queue.get_nowait()
+    log_queue.get_nowait()
+    handler.handle(make_record("after"))
+    notice, after = log_queue.get_nowait(), log_queue.get_nowait()
+    assert notice.getMessage() == "Log queue full: 3 records dropped"
+    assert notice.levelno == logging.WARNING
+    assert after.getMessage() == "after"
+
+def test_setup_logging_writes_json_with_context(tmp_path):
+    log_file = tmp_path / "engine.log"
+    root = logging.getLogger()
+    saved = (list(root.handlers), root.level)
+    setup_logging("Test", log_file=str(log_file), rate_limits={"Trend for": 3600})
+    try:
+        logger = logging.getLogger("HiveEngine")
+        for _ in range(3):
+            logger.info("Trend for %s: %s", "BTC/USDT", "UP", extra={"instance": "i1", "symbol": "BTC/USDT", "stage": "trend", "rate_key": ("Trend for", "i1", "BTC/USDT", "UP")})
+    finally:
+        stop_logging()
+        root.handlers[:] = saved[0]
+        root.setLevel(saved[1])
+    [line] = log_file.read_text().splitlines()
+    entry = json.loads(line)
+    assert entry["msg"] == "Trend for BTC/USDT: UP"
+    assert (entry["instance"], entry["symbol"], entry["stage"]) == ("i1", "BTC/USDT", "trend")
@@ -0,0 +1,100 @@
+import threading
+import pandas as pd
+import pytest
+
+from db_manager import DBManager
+from risk_engine import RiskEngine
+from position_monitor import PositionMonitor, TriggerBook
+
+@pytest.fixture
+def db(tmp_path):
+    return DBManager(str(tmp_path / "trades.db"))
+
+def open_position(db, monitor, risk, side="buy", price=100.0, stop_loss=90.0, take_profit=130.0, symbol="BTC/USDT", instance_id="a"):
+    trade_id = db.log_trade({
+        "instance_id": instance_id, "symbol": symbol, "side": side, "amount": 1.0,
+        "price": price, "status": "open", "stop_loss": stop_loss, "take_profit": take_profit,
+    })
+    risk.on_open(instance_id, price)
+    monitor.add_position(trade_id, instance_id, symbol, side, 1.0, price, stop_loss, take_profit)
+    return trade_id
+
+def test_trigger_book_crossed_and_remove():
+    book = TriggerBook()
+    book.add(1, 'buy', 90, 130)
+    book.add(2, 'buy', 95, 120)
+    book.add(3, 'sell', 110, 80)
+    assert book.crossed(high=105, low=92) == ([2], [])
+    assert book.crossed(high=125, low=100) == ([3], [2])
+    assert book.crossed(high=100, low=79) == ([1, 2], [3])
+
+    book.remove(2, 'buy', 95, 120)
+    assert book.crossed(high=125, low=92) == ([3], [])
+    assert len(book) == 2
+
+def test_long_and_short_exits(db):
+    risk = RiskEngine(db)
+    monitor = PositionMonitor(db, risk)
+    long_id = open_position(db, monitor, risk, "buy", 100, 90, 130)
+    short_id = open_position(db, monitor, risk, "sell", 100, 110, 80)
+
+    [closed] = monitor.on_price("BTC/USDT", 111)
+    assert (closed['id'], closed['reason'], closed['pnl']) == (short_id, 'stop_loss', pytest.approx(-10))
+    [closed] = monitor.on_price("BTC/USDT", 131)
+    assert (closed['id'], closed['reason'], closed['pnl']) == (long_id, 'take_profit', pytest.approx(30))
+
+    assert monitor.positions == {}
+    assert monitor.books == {}
+    assert risk.get_state("a").open_positions == 0
+    assert risk.get_state("a").capital.current_capital == pytest.approx(170)
+
+def test_both_legs_in_one_candle_close_at_stop(db):
+    risk = RiskEngine(db)
+    monitor = PositionMonitor(db, risk)
+    trade_id = open_position(db, monitor, risk)
+    [closed] = monitor.on_candles([("BTC/USDT", 140, 85), ("BTC/USDT", 140, 85)])
+    assert (closed['id'], closed['reason']) == (trade_id, 'stop_loss')
+
+def test_unknown_instance_does_not_deadlock(db):
+    # Ledger row without a risk snapshot: the instance is resolved on first close
+    db.log_trade({"instance_id": "fresh", "symbol": "BTC/USDT", "side": "buy", "amount": 1.0,
+                  "price": 100.0, "status": "open", "stop_loss": 90.0, "take_profit": 130.0})
+    monitor = PositionMonitor(db, RiskEngine(db))
+    result = []
+    worker = threading.Thread(target=lambda: result.extend(monitor.on_price("BTC/USDT", 85)), daemon=True)
+    worker.start()
+    worker.join(timeout=5)
+    assert not worker.is_alive(), "on_price deadlocked"
+    assert [c['reason'] for c in result] == ['stop_loss']
+
+def test_failed_settlement_leaves_state_untouched(db, monkeypatch):
+    risk = RiskEngine(db)
+    monitor = PositionMonitor(db, risk)
+    trade_id = open_position(db, monitor, risk)
+    status_before = risk.get_status()
+
+    def broken(*args, **kwargs):
+        raise RuntimeError("disk full")
+    monkeypatch.setattr(db, "_upsert_capital", broken)
+    with pytest.raises(RuntimeError):
+        monitor.on_price("BTC/USDT", 85)
+
+    assert db.get_trades(status="OPEN")[0]['id'] == trade_id
+    assert trade_id in monitor.positions
+    assert risk.get_status() == status_before
+
+    monkeypatch.undo()
+    [closed] = monitor.on_price("BTC/USDT", 80)
+    assert closed['id'] == trade_id
+    assert risk.get_state("a").capital.current_capital == pytest.approx(140)
+
+def test_open_positions_are_rearmed_after_restart(db):
+    risk = RiskEngine(db)
+    monitor = PositionMonitor(db, risk)
+    trade_id = open_position(db, monitor, risk)
+
+    restarted = PositionMonitor(db, RiskEngine(db))
+    assert list(restarted.positions) == [trade_id]
+    candles = pd.DataFrame({'high': [101, 110, 131], 'low': [99, 95, 120]})
+    [closed] = restarted.replay("BTC/USDT", candles)
+    assert closed['reason'] == 'take_profit'
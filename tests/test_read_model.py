@@ -0,0 +1,95 @@
+import pytest
+
+from db_manager import DBManager
+from read_model import ReadModel, TradeFeed
+
+@pytest.fixture
+def db(tmp_path):
+    return DBManager(str(tmp_path / "trades.db"))
+
+@pytest.fixture
+def model(tmp_path, db):
+    model = ReadModel(trades_db=str(tmp_path / "trades.db"), candles_db=str(tmp_path / "candles.db"))
+    yield model
+    model.close()
+
+def open_trade(db, instance_id="a", price=100.0):
+    return db.log_trade({
+        "instance_id": instance_id, "symbol": "BTC/USDT", "side": "buy",
+        "amount": 1.0, "price": price, "status": "open",
+        "stop_loss": price * 0.9, "take_profit": price * 1.3,
+    })
+
+def test_first_poll_loads_the_recent_window(db, model):
+    ids = [open_trade(db) for _ in range(5)]
+    feed = TradeFeed(window=3)
+    assert feed.poll(model) == 3
+    assert feed.trades['id'].tolist() == ids[-3:]
+    assert feed.last_id == ids[-1]
+
+def test_poll_only_fetches_newer_rows(db, model, monkeypatch):
+    open_trade(db)
+    feed = TradeFeed(window=10)
+    feed.poll(model)
+    new_id = open_trade(db)
+    calls = []
+    since = model.get_trades_since
+    monkeypatch.setattr(model, "get_trades_since", lambda last_id, limit: calls.append(last_id) or since(last_id, limit))
+    assert feed.poll(model) == 1
+    assert calls == [new_id - 1]
+    assert feed.trades['id'].tolist() == [new_id - 1, new_id]
+    assert feed.poll(model) == 0
+    assert len(feed.trades) == 2
+
+def test_poll_refreshes_trades_still_open(db, model):
+    first, second = open_trade(db), open_trade(db)
+    feed = TradeFeed(window=10)
+    feed.poll(model)
+    db.close_trades([{"id": first, "exit_price": 110, "pnl": 10}])
+    assert feed.poll(model) == 0
+    status = dict(zip(feed.trades['id'], feed.trades['status']))
+    assert status == {first: "CLOSED", second: "OPEN"}
+    assert feed.trades.loc[feed.trades['id'] == first, 'pnl'].item() == pytest.approx(10)
+
+def test_poll_resets_when_a_full_window_behind(db, model):
+    open_trade(db)
+    feed = TradeFeed(window=3)
+    feed.poll(model)
+    ids = [open_trade(db) for _ in range(5)]
+    assert feed.poll(model) == 3
+    assert feed.trades['id'].tolist() == ids[-3:]
+    assert feed.last_id == ids[-1]
+
+def test_instance_summaries_merge_rollups_with_state_and_risk(db, model):
+    ids = [open_trade(db, "a") for _ in range(2)] + [open_trade(db, "b")]
+    db.close_trades([{"id": ids[0], "exit_price": 110, "pnl": 10}])
+    db.update_capital(160.0, "Level 1", instance_id="a")
+    db.save_risk_snapshot({
+        "instance_id": "a", "start_amount": 150, "realized_pnl": 10.0, "peak_capital": 160.0,
+        "open_exposure": 100.0, "open_positions": 1, "halted": 0, "portfolio_peak": 310.0,
+    })
+    summaries = model.get_instance_summaries()
+    assert set(summaries) == {"a", "b"}
+    a, b = summaries["a"], summaries["b"]
+    assert (a['trades_opened'], a['trades_closed'], a['wins']) == (2, 1, 1)
+    assert a['win_rate'] == pytest.approx(1.0)
+    assert (a['total_capital'], a['current_level']) == (160.0, "Level 1")
+    assert (a['open_exposure'], a['open_positions'], a['peak_capital']) == (100.0, 1, 160.0)
+    # No close, state or snapshot yet: None rather than NaN
+    assert b['trades_opened'] == 1
+    assert b['win_rate'] is None
+    assert b['total_capital'] is None and b['open_exposure'] is None
+
+def test_missing_database_reads_as_empty(tmp_path):
+    model = ReadModel(trades_db=str(tmp_path / "none.db"), candles_db=str(tmp_path / "none_candles.db"))
+    assert model.get_recent_trades().empty
+    assert model.get_candles("a", "BTC/USDT", "1h").empty
+    assert model.get_instance_summaries() == {}
+    assert TradeFeed().poll(model) == 0
+    assert not (tmp_path / "none.db").exists() # read-only: never creates it
+    model.close()
+
+def test_missing_table_reads_as_empty(db, model):
+    # trades.db exists but the dashboard's instances table does not
+    assert model.get_instances().empty
+    assert model.get_recent_trades().empty
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from config import Config
+from db_manager import DBManager
+from risk_engine import RiskEngine, parse_risk_params
+
+@pytest.fixture
+def db(tmp_path):
+    return DBManager(str(tmp_path / "trades.db"))
+
+def test_portfolio_drawdown_uses_peak_of_total_capital(db):
+    risk = RiskEngine(db, kill_switch_threshold=0.2)
+    # A goes 150 -> 300 while B goes 150 -> 0, in alternating fills
+    for _ in range(5):
+        risk.on_open("a", 10)
+        risk.on_close("a", 10, 30)
+        risk.on_open("b", 10)
+        risk.on_close("b", 10, -30)
+
+    # Total capital never exceeded 330; summing per-instance peaks would give 450
+    assert risk.total_capital == pytest.approx(300)
+    assert risk.portfolio_peak == pytest.approx(330)
+    assert risk.portfolio_drawdown == pytest.approx(1 - 300 / 330)
+    assert not risk.kill_switch_active
+
+def test_portfolio_kill_switch_trips_on_real_drawdown(db):
+    risk = RiskEngine(db, kill_switch_threshold=0.2)
+    risk.on_open("a", 100)
+    risk.on_close("a", 100, 150) # 300 total
+    risk.on_open("a", 100)
+    risk.on_close("a", 100, -90) # 210 total: 30% below the 300 peak
+    assert risk.kill_switch_active
+    allowed, _ = risk.check_trade("a", 1)
+    assert not allowed
+
+def test_portfolio_peak_survives_restart(db):
+    risk = RiskEngine(db, kill_switch_threshold=0.5)
+    risk.on_open("a", 100)
+    risk.on_close("a", 100, 150)
+    risk.on_open("a", 100)
+    risk.on_close("a", 100, -60)
+
+    restored = RiskEngine(db, kill_switch_threshold=0.5)
+    assert restored.portfolio_peak == pytest.approx(300)
+    assert restored.portfolio_drawdown == pytest.approx(0.2)
+    assert restored.get_state("a").open_positions == 0
+
+def test_instance_seen_without_fills_survives_restart(db):
+    risk = RiskEngine(db, kill_switch_threshold=0.5)
+    risk.on_open("a", 100)
+    risk.on_close("a", 100, 5)
+    # New instance whose first trade is blocked: no fill, but its capital counts
+    allowed, _ = risk.check_trade("b", 10_000)
+    assert not allowed
+    risk.on_open("a", 100)
+    risk.on_close("a", 100, -1)
+    before = (risk.total_capital, risk.portfolio_peak)
+
+    restored = RiskEngine(db, kill_switch_threshold=0.5)
+    assert (restored.total_capital, restored.portfolio_peak) == pytest.approx(before)
+    assert restored.portfolio_drawdown == pytest.approx(1 - 304 / 305)
+    assert set(restored.instances) == {"a", "b"}
+
+def add_instance(db, instance_id, strategy_config):
+    with db.transaction() as cursor:
+        cursor.execute("CREATE TABLE IF NOT EXISTS instances (id TEXT PRIMARY KEY, strategy_config TEXT)")
+        cursor.execute("INSERT INTO instances (id, strategy_config) VALUES (?, ?)", (instance_id, json.dumps(strategy_config)))
+
+def test_instance_risk_settings_drive_sizing_and_rr(db):
+    add_instance(db, "a", {"start_amount": 150, "risk": {"rr": "1.0:2.5", "pct": 1.0}})
+    risk = RiskEngine(db)
+    state = risk.get_state("a")
+    assert state.risk_percent == pytest.approx(0.01)
+    assert state.rr_ratio == pytest.approx(2.5)
+    assert risk.position_size("a") == pytest.approx(state.level_min * 0.01)
+
+@pytest.mark.parametrize("risk_block", [None, {}, {"rr": "bad", "pct": "x"}, {"rr": "0:3", "pct": -1}])
+def test_missing_or_invalid_risk_settings_use_defaults(risk_block):
+    assert parse_risk_params(risk_block) == (Config.DEFAULT_RISK_PERCENT, Config.DEFAULT_RR_RATIO)
@@ -0,0 +1,61 @@
+import time
+import pytest
+
+from fake_exchange import FakeExchange
+from ticker_snapshot import TickerSnapshotService
+
+def make_service(interval=30, **kwargs):
+    exchange = FakeExchange(**kwargs)
+    service = TickerSnapshotService(interval=interval)
+    service.register("fake_Spot", exchange)
+    return service, exchange
+
+def test_one_bulk_call_per_interval():
+    service, exchange = make_service()
+    for symbol in list(exchange.markets)[:20]:
+        service.get_spread("fake_Spot", symbol)
+    service.top_by_volume("fake_Spot", n=10)
+    assert exchange.calls == {'fetch_tickers': 1, 'fetch_ticker': 0, 'fetch_ohlcv': 0}
+
+    service.last_attempt["fake_Spot"] -= 31
+    service.get_spread("fake_Spot", "COIN0/USDT")
+    assert exchange.calls['fetch_tickers'] == 2
+
+def test_spread_matches_bid_ask():
+    service, exchange = make_service()
+    spread = service.get_spread("fake_Spot", "COIN3/USDT")
+    assert spread == pytest.approx(exchange.prices["COIN3/USDT"]['spread_pct'])
+
+def test_unknown_symbol_fails_closed():
+    service, _ = make_service()
+    assert service.get_spread("fake_Spot", "NOPE/USDT") is None
+
+def test_stale_snapshot_fails_closed():
+    service, exchange = make_service(interval=30)
+    assert service.get_spread("fake_Spot", "COIN0/USDT") is not None
+
+    def broken(symbols=None):
+        raise ConnectionError("exchange down")
+    exchange.fetch_tickers = broken
+
+    # Failed refresh within max_age: previous snapshot still served
+    service.last_attempt["fake_Spot"] -= 31
+    assert service.get_spread("fake_Spot", "COIN0/USDT") is not None
+
+    # Older than three intervals: no snapshot, the spread filter blocks
+    service.tables["fake_Spot"].fetched_at = time.time() - 91
+    service.last_attempt["fake_Spot"] -= 31
+    assert service.get_spread("fake_Spot", "COIN0/USDT") is None
+    assert service.top_by_volume("fake_Spot").empty
+
+def test_top_by_volume_ordering_and_filters():
+    service, exchange = make_service()
+    top = service.top_by_volume("fake_Spot", n=5)
+    volumes = [exchange.prices[s]['volume'] for s in exchange.markets]
+    assert top['quote_volume'].tolist() == sorted(volumes, reverse=True)[:5]
+
+    subset = ["COIN1/USDT", "COIN2/USDT", "COIN3/USDT"]
+    filtered = service.top_by_volume("fake_Spot", symbols=subset, max_spread_pct=0.5)
+    assert set(filtered['symbol']) <= set(subset)
+    assert (filtered['spread_pct'] <= 0.5).all()
+    assert filtered['quote_volume'].is_monotonic_decreasing
@@ -1,5 +1,14 @@
+import os
+import sys
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
+from typing import List, Optional
+
+# Shared logging pipeline lives in monitoring_bot (copied next to us in Docker)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'monitoring_bot'))
+from log_pipeline import setup_logging
+setup_logging("TradingBot", log_file=os.getenv("LOG_FILE", "trading_bot.log"))
+
 from execution_engine import create_engine
 
 app = FastAPI(title="Trading Bot Execution Engine")
@@ -11,9 +20,17 @@ class TradeSignal(BaseModel):
     price: float
     reason: str
     agent_decision: str
+    instance_id: str = "default"
+    stop_loss: Optional[float] = None
+    take_profit: Optional[float] = None
+
+class PriceRange(BaseModel):
+    symbol: str
+    high: float
+    low: float
 
 @app.post("/trade")
-async def execute_trade(signal: TradeSignal):
+def execute_trade(signal: TradeSignal):
     """
     Receives APPROVED signal from Analyze Agent.
     """
@@ -26,10 +43,14 @@ async def execute_trade(signal: TradeSignal):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/prices")
+def update_prices(prices: List[PriceRange]):
+    """
+    Batch of latest prices or candle high/low ranges; closes positions whose SL/TP was crossed.
+    """
+    closed = engine.update_prices([(p.symbol, p.high, p.low) for p in prices])
+    return {"closed": closed}
+
 @app.get("/status")
 def status():
-    return {
-        "capital": engine.current_capital,
-        "level": engine.level,
-        "kill_switch": engine.kill_switch_active
-    }
+    return engine.get_status()
@@ -2,6 +2,8 @@ import sqlite3
 import logging
 import json
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 
 logger = logging.getLogger("DBManager")
@@ -16,66 +18,324 @@ class DBManager:
                 self.db_path = "trades.db"
         else:
             self.db_path = db_path
-            
+
+        # One persistent connection shared by the API threads (writes are serialized)
+        self.conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # Re-entrant: reads issued from inside a transaction() callback must not deadlock
+        self.lock = threading.RLock()
+
         self._init_db()
 
+    @contextmanager
+    def transaction(self):
+        """Runs a block of writes atomically on the shared connection."""
+        with self.lock:
+            cursor = self.conn.cursor()
+            try:
+                yield cursor
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+
+    def _add_column(self, cursor, table, column, definition):
+        columns = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+        if column not in columns:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
     def _init_db(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Trades Table
+        with self.transaction() as cursor:
+            # Trades Table (Ledger)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS trades (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    symbol TEXT,
+                    side TEXT,
+                    amount REAL,
+                    entry_price REAL,
+                    status TEXT, -- OPEN, CLOSED, REJECTED
+                    pnl REAL DEFAULT 0,
+                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    agent_notes TEXT,
+                    user_grade TEXT
+                )
+            ''')
+            # Ledger columns added after V1 (existing databases are migrated in place)
+            self._add_column(cursor, 'trades', 'instance_id', "TEXT DEFAULT 'default'")
+            self._add_column(cursor, 'trades', 'exit_price', 'REAL')
+            self._add_column(cursor, 'trades', 'closed_at', 'DATETIME')
+            self._add_column(cursor, 'trades', 'stop_loss', 'REAL')
+            self._add_column(cursor, 'trades', 'take_profit', 'REAL')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_instance_time ON trades (instance_id, timestamp)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_symbol_time ON trades (symbol, timestamp)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_time ON trades (timestamp)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_instance_status ON trades (instance_id, status)')
+
+            # Daily Rollups (maintained in the same transaction as ledger writes)
+            has_rollups = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='trade_rollups_daily'"
+            ).fetchone() is not None
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS trade_rollups_daily (
+                    instance_id TEXT,
+                    day TEXT,
+                    trades_opened INTEGER DEFAULT 0,
+                    trades_closed INTEGER DEFAULT 0,
+                    wins INTEGER DEFAULT 0,
+                    losses INTEGER DEFAULT 0,
+                    realized_pnl REAL DEFAULT 0,
+                    opened_notional REAL DEFAULT 0,
+                    closed_notional REAL DEFAULT 0,
+                    PRIMARY KEY (instance_id, day)
+                )
+            ''')
+            if not has_rollups:
+                self._backfill_rollups(cursor)
+
+            # Instance State Table (Capital & Levels, one row per instance)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS instance_state (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    total_capital REAL,
+                    current_level TEXT,
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            self._add_column(cursor, 'instance_state', 'instance_id', 'TEXT')
+            cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_instance_state_instance ON instance_state (instance_id)')
+
+            # Risk Snapshots (latest risk state per instance, for fast recovery)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS risk_snapshots (
+                    instance_id TEXT PRIMARY KEY,
+                    start_amount REAL,
+                    realized_pnl REAL,
+                    peak_capital REAL,
+                    open_exposure REAL,
+                    open_positions INTEGER,
+                    halted INTEGER DEFAULT 0,
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            self._add_column(cursor, 'risk_snapshots', 'portfolio_peak', 'REAL')
+        logger.info(f"Database initialized at {self.db_path}")
+
+    def _backfill_rollups(self, cursor):
+        """Builds the rollups of a pre-ledger database from its existing trades (one-time migration)."""
+        cursor.execute("UPDATE trades SET status=UPPER(status) WHERE status != UPPER(status)")
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS trades (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT,
-                side TEXT,
-                amount REAL,
-                entry_price REAL,
-                status TEXT, -- OPEN, CLOSED, REJECTED
-                pnl REAL DEFAULT 0,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                agent_notes TEXT,
-                user_grade TEXT
+            INSERT INTO trade_rollups_daily
+            (instance_id, day, trades_opened, trades_closed, wins, losses, realized_pnl, opened_notional, closed_notional)
+            SELECT instance_id, day, SUM(opened), SUM(closed), SUM(wins), SUM(losses), SUM(pnl), SUM(opened_notional), SUM(closed_notional)
+            FROM (
+                SELECT COALESCE(instance_id, 'default') AS instance_id, date(timestamp) AS day,
+                       1 AS opened, 0 AS closed, 0 AS wins, 0 AS losses, 0.0 AS pnl,
+                       amount * entry_price AS opened_notional, 0.0 AS closed_notional
+                FROM trades WHERE status IN ('OPEN', 'CLOSED')
+                UNION ALL
+                SELECT COALESCE(instance_id, 'default'), date(COALESCE(closed_at, timestamp)),
+                       0, 1, COALESCE(pnl, 0) > 0, COALESCE(pnl, 0) < 0, COALESCE(pnl, 0),
+                       0.0, amount * entry_price
+                FROM trades WHERE status = 'CLOSED'
             )
+            GROUP BY instance_id, day
         ''')
-        
-        # Instance State Table (Capital & Levels)
+        if cursor.rowcount > 0:
+            logger.info(f"Backfilled {cursor.rowcount} daily rollup rows from existing trades")
+
+    def _bump_rollup(self, cursor, instance_id, day, opened=0, closed=0, wins=0, losses=0, pnl=0.0, opened_notional=0.0, closed_notional=0.0):
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS instance_state (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                total_capital REAL,
-                current_level TEXT,
-                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            INSERT INTO trade_rollups_daily
+            (instance_id, day, trades_opened, trades_closed, wins, losses, realized_pnl, opened_notional, closed_notional)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(instance_id, day) DO UPDATE SET
+                trades_opened = trades_opened + excluded.trades_opened,
+                trades_closed = trades_closed + excluded.trades_closed,
+                wins = wins + excluded.wins,
+                losses = losses + excluded.losses,
+                realized_pnl = realized_pnl + excluded.realized_pnl,
+                opened_notional = opened_notional + excluded.opened_notional,
+                closed_notional = closed_notional + excluded.closed_notional
+        ''', (instance_id, day, opened, closed, wins, losses, pnl, opened_notional, closed_notional))
+
+    def _insert_trades(self, cursor, trades):
+        day = datetime.utcnow().strftime('%Y-%m-%d')
+        ids = []
+        for trade in trades:
+            instance_id = trade.get('instance_id') or 'default'
+            status = trade.get('status', 'OPEN').upper()
+            cursor.execute('''
+                INSERT INTO trades (instance_id, symbol, side, amount, entry_price, status, stop_loss, take_profit)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (instance_id, trade['symbol'], trade['side'], trade['amount'], trade['price'], status,
+                  trade.get('stop_loss'), trade.get('take_profit')))
+            ids.append(cursor.lastrowid)
+            if status == 'OPEN':
+                self._bump_rollup(cursor, instance_id, day, opened=1, opened_notional=trade['amount'] * trade['price'])
+        return ids
+
+    def _close_trades(self, cursor, closes):
+        """
+        Marks OPEN trades as CLOSED. `closes` is a list of {id, exit_price, pnl}.
+        Returns the rows actually closed (already closed ids are skipped).
+        """
+        now = datetime.utcnow()
+        closed_at = now.strftime('%Y-%m-%d %H:%M:%S')
+        day = now.strftime('%Y-%m-%d')
+        closed = []
+        for close in closes:
+            row = cursor.execute(
+                "SELECT id, instance_id, symbol, amount, entry_price FROM trades WHERE id=? AND status='OPEN'", (close['id'],)
+            ).fetchone()
+            if row is None:
+                continue
+            cursor.execute(
+                "UPDATE trades SET status='CLOSED', exit_price=?, pnl=?, closed_at=? WHERE id=?",
+                (close['exit_price'], close['pnl'], closed_at, row['id'])
             )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        logger.info(f"Database initialized at {self.db_path}")
+            pnl = close['pnl']
+            self._bump_rollup(
+                cursor, row['instance_id'], day, closed=1,
+                wins=int(pnl > 0), losses=int(pnl < 0), pnl=pnl, # breakeven is neither
+                closed_notional=row['amount'] * row['entry_price']
+            )
+            closed.append({**dict(row), **close})
+        return closed
+
+    def log_trades(self, trades):
+        """Inserts a batch of trades (and their rollups) in one transaction. Returns the new ids."""
+        with self.transaction() as cursor:
+            ids = self._insert_trades(cursor, trades)
+        logger.info(f"Trades logged: {len(ids)}")
+        return ids
 
     def log_trade(self, trade_data):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO trades (symbol, side, amount, entry_price, status)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (trade_data['symbol'], trade_data['side'], trade_data['amount'], trade_data['price'], 'OPEN'))
-        conn.commit()
-        conn.close()
+        trade_id = self.log_trades([trade_data])[0]
         logger.info(f"Trade logged: {trade_data['symbol']}")
+        return trade_id
 
-    def update_capital(self, capital, level):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('INSERT INTO instance_state (total_capital, current_level) VALUES (?, ?)', (capital, level))
-        conn.commit()
-        conn.close()
-
-    def get_trades(self):
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM trades ORDER BY timestamp DESC')
-        rows = cursor.fetchall()
-        conn.close()
+    def close_trades(self, closes):
+        with self.transaction() as cursor:
+            return self._close_trades(cursor, closes)
+
+    def open_trade(self, trade, on_opened):
+        """
+        Logs an OPEN trade and persists the resulting risk state atomically.
+        `on_opened(trade_id)` applies the fill and returns the risk snapshot
+        to store in the same transaction. Returns the new trade id.
+        """
+        with self.transaction() as cursor:
+            trade_id = self._insert_trades(cursor, [trade])[0]
+            self._save_risk_snapshot(cursor, on_opened(trade_id))
+        logger.info(f"Trade logged: {trade['symbol']}")
+        return trade_id
+
+    def settle_trades(self, closes, on_closed):
+        """
+        Closes a batch of trades and persists the resulting capital state atomically.
+        `on_closed(rows)` applies the closed rows and returns
+        [(risk_snapshot, capital, level)] to store in the same transaction.
+        """
+        with self.transaction() as cursor:
+            closed = self._close_trades(cursor, closes)
+            for snapshot, capital, level in on_closed(closed):
+                self._save_risk_snapshot(cursor, snapshot)
+                self._upsert_capital(cursor, capital, level, snapshot['instance_id'])
+        return closed
+
+    def get_open_trades_with_triggers(self):
+        with self.lock:
+            rows = self.conn.execute('''
+                SELECT * FROM trades
+                WHERE status='OPEN' AND stop_loss IS NOT NULL AND take_profit IS NOT NULL
+            ''').fetchall()
+        return [dict(row) for row in rows]
+
+    def _upsert_capital(self, cursor, capital, level, instance_id):
+        cursor.execute('''
+            INSERT INTO instance_state (instance_id, total_capital, current_level, updated_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(instance_id) DO UPDATE SET
+                total_capital=excluded.total_capital, current_level=excluded.current_level,
+                updated_at=excluded.updated_at
+        ''', (instance_id, capital, level))
+
+    def update_capital(self, capital, level, instance_id='default'):
+        with self.transaction() as cursor:
+            self._upsert_capital(cursor, capital, level, instance_id)
+
+    def get_trades(self, instance_id=None, symbol=None, status=None, before_id=None, limit=100):
+        """
+        Newest-first page of trades. Pass the last `id` of a page as
+        `before_id` to fetch the next one (keyset pagination).
+        """
+        clauses, params = [], []
+        for column, value in (('instance_id', instance_id), ('symbol', symbol), ('status', status)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if before_id is not None:
+            clauses.append("id < ?")
+            params.append(before_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(limit)
+        with self.lock:
+            rows = self.conn.execute(f'SELECT * FROM trades {where} ORDER BY id DESC LIMIT ?', params).fetchall()
         return [dict(row) for row in rows]
+
+    def get_rollups(self, instance_id=None, since_day=None):
+        """
+        Daily PnL / win rate / notional rows, newest day first.
+        `net_opened_notional` is the day's opened minus closed notional (a flow,
+        not the open exposure; see risk_snapshots for that).
+        """
+        clauses, params = [], []
+        if instance_id is not None:
+            clauses.append("instance_id = ?")
+            params.append(instance_id)
+        if since_day is not None:
+            clauses.append("day >= ?")
+            params.append(since_day)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self.lock:
+            rows = self.conn.execute(f'''
+                SELECT *,
+                    CASE WHEN trades_closed > 0 THEN CAST(wins AS REAL) / trades_closed ELSE NULL END AS win_rate,
+                    opened_notional - closed_notional AS net_opened_notional
+                FROM trade_rollups_daily {where}
+                ORDER BY day DESC, instance_id
+            ''', params).fetchall()
+        return [dict(row) for row in rows]
+
+    def _save_risk_snapshot(self, cursor, snapshot):
+        cursor.execute('''
+            INSERT INTO risk_snapshots
+            (instance_id, start_amount, realized_pnl, peak_capital, open_exposure, open_positions, halted, portfolio_peak, updated_at)
+            VALUES (:instance_id, :start_amount, :realized_pnl, :peak_capital, :open_exposure, :open_positions, :halted, :portfolio_peak, CURRENT_TIMESTAMP)
+            ON CONFLICT(instance_id) DO UPDATE SET
+                start_amount=excluded.start_amount, realized_pnl=excluded.realized_pnl,
+                peak_capital=excluded.peak_capital, open_exposure=excluded.open_exposure,
+                open_positions=excluded.open_positions, halted=excluded.halted,
+                portfolio_peak=excluded.portfolio_peak, updated_at=excluded.updated_at
+        ''', snapshot)
+
+    def save_risk_snapshot(self, snapshot):
+        with self.transaction() as cursor:
+            self._save_risk_snapshot(cursor, snapshot)
+
+    def load_risk_snapshots(self):
+        with self.lock:
+            rows = self.conn.execute('SELECT * FROM risk_snapshots').fetchall()
+        return [dict(row) for row in rows]
+
+    def get_instance_params(self, instance_id):
+        """Returns the Strategy Builder params (start amount, levels...) of an instance, or None."""
+        try:
+            with self.lock:
+                row = self.conn.execute('SELECT strategy_config FROM instances WHERE id=?', (instance_id,)).fetchone()
+        except sqlite3.OperationalError:
+            row = None # instances table not created yet (no dashboard)
+        return json.loads(row[0]) if row and row[0] else None
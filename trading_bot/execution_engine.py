@@ -1,41 +1,70 @@
 import ccxt
 import time
 import logging
+import threading
 from db_manager import DBManager
+from risk_engine import RiskEngine, DEFAULT_INSTANCE_ID
+from position_monitor import PositionMonitor
+from config import Config
 
-# Setup Logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("TradingBot")
 
 class ExecutionEngine:
     def __init__(self, exchange_id='binance'):
         self.exchange = getattr(ccxt, exchange_id)()
         self.db = DBManager()
-        self.current_capital = 150 # Start amount (simulated)
-        self.level = "Level1"
-        self.kill_switch_active = False
-
-    def check_kill_switch(self):
-        """
-        Safety Check: If capital drops below threshold, STOP.
-        """
-        if self.current_capital < 50: # Example Threshold
-            self.kill_switch_active = True
-            logger.critical("KILL SWITCH ACTIVE: Capital < 50 USDT. Halting.")
-            return True
-        return False
+        # Capital, levels, exposure & kill switch across all instances
+        self.risk = RiskEngine(self.db)
+        # SL/TP management of open positions
+        self.monitor = PositionMonitor(self.db, self.risk)
+        # Serializes trades, price updates and status reads (shared risk/monitor state)
+        self.lock = threading.Lock()
 
     def execute_trade(self, signal):
         """
         Receives Approved Signal -> Places Limit Order -> Updates DB.
         """
-        if self.check_kill_switch():
-            return {"status": "HALTED", "reason": "Kill Switch Active"}
+        with self.lock:
+            return self._execute_trade(signal)
+
+    def update_prices(self, candles):
+        """Feeds (symbol, high, low) ranges to the position monitor. Returns the closed trades."""
+        with self.lock:
+            return self.monitor.on_candles(candles)
+
+    def get_status(self):
+        with self.lock:
+            return self.risk.get_status()
 
+    def _execute_trade(self, signal):
+        instance_id = signal.get('instance_id') or DEFAULT_INSTANCE_ID
         symbol = signal['symbol']
         side = signal['side'].lower() # buy/sell
         price = signal['price']
-        amount = 0.001 # TODO: Calculate position size based on Risk/Level
+
+        # SL/TP from the signal, else default stop distance and the instance's R:R target
+        rr_ratio = self.risk.get_state(instance_id).rr_ratio
+        direction = 1 if side == 'buy' else -1
+        stop_loss = signal.get('stop_loss') or price * (1 - direction * Config.DEFAULT_STOP_PCT)
+        stop_distance = (price - stop_loss) * direction
+        if stop_distance <= 0:
+            return {"status": "FAILED", "error": f"Stop loss {stop_loss} must be {'below' if side == 'buy' else 'above'} entry {price}"}
+        take_profit = signal.get('take_profit') or price + direction * stop_distance * rr_ratio
+        if (take_profit - price) * direction <= 0:
+            return {"status": "FAILED", "error": f"Take profit {take_profit} must be {'above' if side == 'buy' else 'below'} entry {price}"}
+
+        # Position size: risk amount (instance risk % of Level min) lost if the stop is hit
+        amount = self.risk.position_size(instance_id) / stop_distance
+        if amount <= 0:
+            level = self.risk.get_state(instance_id).level
+            logger.warning(f"Trade blocked for {instance_id}: zero position size (level {level})")
+            return {"status": "HALTED", "reason": f"Zero position size at level {level}"}
+
+        # Pre-trade risk check (kill switches, level, exposure)
+        allowed, reason = self.risk.check_trade(instance_id, amount * price)
+        if not allowed:
+            logger.warning(f"Trade blocked for {instance_id}: {reason}")
+            return {"status": "HALTED", "reason": reason}
 
         logger.info(f"Executing {side.upper()} Limit Order for {symbol} at {price}")
 
@@ -46,22 +75,30 @@ class ExecutionEngine:
             # SIMULATION
             order = {
                 "id": f"sim_{int(time.time())}",
+                "instance_id": instance_id,
                 "symbol": symbol,
                 "side": side,
                 "amount": amount,
                 "price": price,
+                "stop_loss": stop_loss,
+                "take_profit": take_profit,
                 "status": "open"
             }
             
-            # Log to DB
-            self.db.log_trade(order)
-            
-            # Simulate Fill & PnL Update (Mocking a win)
-            self.current_capital += 5 # Mock Profit
-            self.db.update_capital(self.current_capital, self.level)
+            # Ledger row + risk snapshot in one transaction; memory is rolled back if it fails
+            checkpoint = self.risk.checkpoint({instance_id})
+            try:
+                trade_id = self.db.open_trade(
+                    order, lambda _: self.risk.snapshot(self.risk.on_open(instance_id, amount * price, persist=False))
+                )
+            except Exception:
+                self.risk.rollback(checkpoint)
+                raise
+            # Committed: arm SL/TP (closed later by the position monitor)
+            self.monitor.add_position(trade_id, instance_id, symbol, side, amount, price, stop_loss, take_profit)
             
             logger.info(f"Trade Executed: {order['id']}")
-            return {"status": "SUCCESS", "order_id": order['id']}
+            return {"status": "SUCCESS", "order_id": order['id'], "trade_id": trade_id, "stop_loss": stop_loss, "take_profit": take_profit}
 
         except Exception as e:
             logger.error(f"Execution Failed: {e}")
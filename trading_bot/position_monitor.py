@@ -0,0 +1,162 @@
+import logging
+from bisect import bisect_left, insort
+
+logger = logging.getLogger("PositionMonitor")
+
+class TriggerBook:
+    """
+    Stop-loss / take-profit levels of one symbol in sorted lists.
+
+    Every list is keyed so that the orders crossed by a price move form a
+    suffix: levels that fire when the low trades through them are stored
+    as-is, levels that fire when the high trades through them are stored
+    negated. Finding the k crossed orders is O(log n + k).
+    """
+    def __init__(self):
+        self.long_sl = [] # (level, trade_id): fires when low <= level
+        self.short_tp = [] # (level, trade_id): fires when low <= level
+        self.long_tp = [] # (-level, trade_id): fires when high >= level
+        self.short_sl = [] # (-level, trade_id): fires when high >= level
+
+    def _legs(self, trade_id, side, stop_loss, take_profit):
+        if side == 'buy':
+            return [(self.long_sl, (stop_loss, trade_id)), (self.long_tp, (-take_profit, trade_id))]
+        return [(self.short_sl, (-stop_loss, trade_id)), (self.short_tp, (take_profit, trade_id))]
+
+    def add(self, trade_id, side, stop_loss, take_profit):
+        for levels, entry in self._legs(trade_id, side, stop_loss, take_profit):
+            insort(levels, entry)
+
+    def remove(self, trade_id, side, stop_loss, take_profit):
+        """Removes both legs of a position."""
+        for levels, entry in self._legs(trade_id, side, stop_loss, take_profit):
+            idx = bisect_left(levels, entry)
+            if idx < len(levels) and levels[idx] == entry:
+                del levels[idx]
+
+    @staticmethod
+    def _crossed(levels, key):
+        return levels[bisect_left(levels, (key,)):]
+
+    def crossed(self, high, low):
+        """Returns (stop_ids, target_ids) crossed by a [low, high] range, without removing them."""
+        stops = self._crossed(self.long_sl, low) + self._crossed(self.short_sl, -high)
+        targets = self._crossed(self.long_tp, -high) + self._crossed(self.short_tp, low)
+        return [t for _, t in stops], [t for _, t in targets]
+
+    def __len__(self):
+        return len(self.long_sl) + len(self.short_sl)
+
+class PositionMonitor:
+    """
+    Watches open positions for SL/TP hits and closes them in batches.
+
+    Incoming prices or candle highs/lows only touch the crossed orders of
+    their symbol. Each batch of fills updates the ledger, the rollups and
+    the risk state in one transaction; in-memory positions and risk are
+    only changed once it commits. Works in paper mode by replaying candles.
+    """
+    def __init__(self, db, risk):
+        self.db = db
+        self.risk = risk
+        self.books = {} # {symbol: TriggerBook}
+        self.positions = {} # {trade_id: position}
+        self._restore()
+
+    def _restore(self):
+        """Re-arms SL/TP for OPEN trades in the ledger (restart recovery)."""
+        for trade in self.db.get_open_trades_with_triggers():
+            self.add_position(
+                trade['id'], trade['instance_id'], trade['symbol'], trade['side'],
+                trade['amount'], trade['entry_price'], trade['stop_loss'], trade['take_profit']
+            )
+        if self.positions:
+            logger.info(f"Re-armed SL/TP for {len(self.positions)} open positions")
+
+    def add_position(self, trade_id, instance_id, symbol, side, amount, entry_price, stop_loss, take_profit):
+        self.positions[trade_id] = {
+            "instance_id": instance_id,
+            "symbol": symbol,
+            "side": side,
+            "amount": amount,
+            "entry_price": entry_price,
+            "stop_loss": stop_loss,
+            "take_profit": take_profit,
+        }
+        self.books.setdefault(symbol, TriggerBook()).add(trade_id, side, stop_loss, take_profit)
+
+    def _remove_position(self, trade_id):
+        position = self.positions.pop(trade_id, None)
+        if position is None:
+            return
+        book = self.books[position['symbol']]
+        book.remove(trade_id, position['side'], position['stop_loss'], position['take_profit'])
+        if not len(book):
+            del self.books[position['symbol']]
+
+    def _collect(self, symbol, high, low, pending):
+        """Pending closes for one symbol's price range. Mutates nothing but `pending`."""
+        book = self.books.get(symbol)
+        if book is None:
+            return []
+        stop_ids, target_ids = book.crossed(high, low)
+        closes = []
+        # Both legs inside one candle: assume the stop was hit first (conservative)
+        for trade_id, exit_field in [(t, 'stop_loss') for t in stop_ids] + [(t, 'take_profit') for t in target_ids]:
+            if trade_id in pending:
+                continue
+            pending.add(trade_id)
+            position = self.positions[trade_id]
+            exit_price = position[exit_field]
+            direction = 1 if position['side'] == 'buy' else -1
+            pnl = (exit_price - position['entry_price']) * position['amount'] * direction
+            closes.append({"id": trade_id, "exit_price": exit_price, "pnl": pnl, "reason": exit_field})
+        return closes
+
+    def on_candles(self, candles):
+        """
+        Processes a batch of (symbol, high, low) ranges; a plain price is
+        (symbol, price, price). Returns the closed trades.
+        """
+        closes, pending = [], set()
+        for symbol, high, low in candles:
+            closes.extend(self._collect(symbol, high, low, pending))
+        if not closes:
+            return []
+
+        # Resolve risk state before the transaction and keep a copy to roll back to
+        checkpoint = self.risk.checkpoint({self.positions[c['id']]['instance_id'] for c in closes})
+        try:
+            closed = self.db.settle_trades(closes, self._apply_closes)
+        except Exception:
+            self.risk.rollback(checkpoint)
+            raise
+
+        # Committed: disarm (ids the ledger had already closed are dropped too)
+        for close in closes:
+            self._remove_position(close['id'])
+        for close in closed:
+            logger.info(f"{close['reason'].upper()} hit: trade {close['id']} {close['symbol']} @ {close['exit_price']} (PnL {close['pnl']:.2f})")
+        return closed
+
+    def on_price(self, symbol, price):
+        return self.on_candles([(symbol, price, price)])
+
+    def _apply_closes(self, closed):
+        """Books closed trades into the risk engine; returns the rows to persist with them."""
+        touched = {}
+        for trade in closed:
+            touched[trade['instance_id']] = self.risk.on_close(
+                trade['instance_id'], trade['amount'] * trade['entry_price'], trade['pnl'], persist=False
+            )
+        return [(self.risk.snapshot(state), state.capital.current_capital, state.level) for state in touched.values()]
+
+    def replay(self, symbol, candles):
+        """
+        Paper mode: feeds historical candles (DataFrame with high/low) in order.
+        Returns all trades closed during the replay.
+        """
+        closed = []
+        for high, low in zip(candles['high'].to_numpy(), candles['low'].to_numpy()):
+            closed.extend(self.on_candles([(symbol, float(high), float(low))]))
+        return closed
@@ -0,0 +1,247 @@
+import os
+import sys
+import copy
+import logging
+
+# Shared capital/level logic lives in monitoring_bot (copied next to us in Docker)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'monitoring_bot'))
+from capital_manager import CapitalManager, build_levels_config
+from config import Config
+
+logger = logging.getLogger("RiskEngine")
+
+DEFAULT_INSTANCE_ID = "default"
+DEFAULT_START_AMOUNT = 150 # Used when an instance has no Strategy Builder config
+
+def parse_risk_params(risk):
+    """
+    (risk_percent, rr_ratio) from a Strategy Builder "risk" block, e.g.
+    {"rr": "1.0:3.0", "pct": 2.0} -> (0.02, 3.0). Missing or invalid values
+    fall back to the Config defaults.
+    """
+    risk = risk or {}
+    risk_percent, rr_ratio = Config.DEFAULT_RISK_PERCENT, Config.DEFAULT_RR_RATIO
+    try:
+        if risk.get('pct') is not None and float(risk['pct']) > 0:
+            risk_percent = float(risk['pct']) / 100
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid risk pct {risk.get('pct')!r}, using {risk_percent}")
+    try:
+        if risk.get('rr'):
+            risk_part, reward_part = (float(x) for x in str(risk['rr']).split(':'))
+            if risk_part > 0 and reward_part > 0:
+                rr_ratio = reward_part / risk_part
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid risk rr {risk.get('rr')!r}, using {rr_ratio}")
+    return risk_percent, rr_ratio
+
+class InstanceRisk:
+    """Incrementally maintained risk state of one instance."""
+    def __init__(self, instance_id, capital_manager, risk_percent=Config.DEFAULT_RISK_PERCENT, rr_ratio=Config.DEFAULT_RR_RATIO):
+        self.instance_id = instance_id
+        self.capital = capital_manager
+        self.risk_percent = risk_percent # Fraction of the Level minimum risked per trade
+        self.rr_ratio = rr_ratio # Reward / risk for the default take-profit
+        self.peak_capital = capital_manager.current_capital
+        self.open_exposure = 0.0
+        self.open_positions = 0
+        self.halted = False
+        self.level, self.level_min = capital_manager.get_current_level()
+
+    @property
+    def drawdown(self):
+        if self.peak_capital <= 0:
+            return 0.0
+        return 1 - self.capital.current_capital / self.peak_capital
+
+    def snapshot(self):
+        return {
+            "instance_id": self.instance_id,
+            "start_amount": self.capital.start_amount,
+            "realized_pnl": self.capital.realized_pnl,
+            "peak_capital": self.peak_capital,
+            "open_exposure": self.open_exposure,
+            "open_positions": self.open_positions,
+            "halted": int(self.halted),
+        }
+
+class RiskEngine:
+    """
+    Portfolio risk across all instances, updated from the trade stream.
+
+    Each fill adjusts the instance state and the portfolio totals by its delta,
+    so pre-trade checks and the kill switch are O(1). State is persisted as one
+    snapshot row per instance and restored at startup without replaying trades.
+    """
+    def __init__(self, db, kill_switch_threshold=Config.KILL_SWITCH_THRESHOLD, max_exposure_ratio=Config.MAX_EXPOSURE_RATIO):
+        self.db = db
+        self.kill_switch_threshold = kill_switch_threshold
+        self.max_exposure_ratio = max_exposure_ratio
+        self.instances = {} # {instance_id: InstanceRisk}
+
+        # Portfolio aggregates (the peak is of the summed capital, not a sum of per-instance peaks)
+        self.total_capital = 0.0
+        self.portfolio_peak = 0.0
+        self.total_exposure = 0.0
+        self.kill_switch_active = False
+
+        self._restore()
+
+    def _restore(self):
+        """Rebuilds state from persisted snapshots."""
+        snapshots = self.db.load_risk_snapshots()
+        for snap in snapshots:
+            state = self._new_state(snap['instance_id'], snap['start_amount'])
+            state.capital.update_capital(snap['realized_pnl'])
+            state.level, state.level_min = state.capital.get_current_level()
+            state.peak_capital = snap['peak_capital']
+            state.open_exposure = snap['open_exposure']
+            state.open_positions = snap['open_positions']
+            state.halted = bool(snap['halted'])
+            self._add(state)
+        # Every snapshot carries the portfolio peak at save time; it only grows
+        stored_peaks = [snap['portfolio_peak'] for snap in snapshots if snap.get('portfolio_peak') is not None]
+        self.portfolio_peak = max([self.total_capital] + stored_peaks)
+        self._evaluate_portfolio()
+        logger.info(f"Risk state restored for {len(self.instances)} instances (capital {self.total_capital:.2f}, exposure {self.total_exposure:.2f})")
+
+    def _new_state(self, instance_id, start_amount=None):
+        params = self.db.get_instance_params(instance_id) or {}
+        if start_amount is None:
+            start_amount = params.get('start_amount', DEFAULT_START_AMOUNT)
+        levels_config = None
+        if params.get('levels') and params.get('safe_levels'):
+            levels_config = build_levels_config(params['levels'], params['safe_levels'])
+        risk_percent, rr_ratio = parse_risk_params(params.get('risk'))
+        return InstanceRisk(instance_id, CapitalManager(start_amount, levels_config), risk_percent, rr_ratio)
+
+    def _add(self, state):
+        self.instances[state.instance_id] = state
+        self.total_capital += state.capital.current_capital
+        self.total_exposure += state.open_exposure
+        self.portfolio_peak = max(self.portfolio_peak, self.total_capital)
+
+    def get_state(self, instance_id):
+        state = self.instances.get(instance_id)
+        if state is None:
+            state = self._new_state(instance_id)
+            self._add(state)
+            # Persist right away: its capital is now part of portfolio_peak, which
+            # other snapshots store, so a restart must restore it too
+            self.db.save_risk_snapshot(self.snapshot(state))
+        return state
+
+    @property
+    def portfolio_drawdown(self):
+        if self.portfolio_peak <= 0:
+            return 0.0
+        return 1 - self.total_capital / self.portfolio_peak
+
+    def check_trade(self, instance_id, notional):
+        """
+        Pre-trade check. Returns (allowed, reason).
+        """
+        if self.kill_switch_active:
+            return False, "Kill Switch Active"
+        state = self.get_state(instance_id)
+        if state.halted:
+            return False, f"Instance {instance_id} halted (drawdown {state.drawdown:.0%})"
+        if state.level == "CRITICAL_LOW":
+            return False, "Capital below lowest SLevel"
+        if state.open_exposure + notional > state.capital.current_capital * self.max_exposure_ratio:
+            return False, f"Exposure limit reached ({state.open_exposure:.2f} open)"
+        return True, None
+
+    def position_size(self, instance_id, risk_percent=None):
+        """
+        Risk amount (x% of the current Level minimum) for the next trade;
+        x is the instance's Strategy Builder risk % unless given.
+        """
+        state = self.get_state(instance_id)
+        if state.level == "CRITICAL_LOW":
+            return 0.0
+        if risk_percent is None:
+            risk_percent = state.risk_percent
+        return state.level_min * risk_percent
+
+    def on_open(self, instance_id, notional, persist=True):
+        """
+        Applies an opening fill. Pass persist=False when the caller saves the
+        snapshot in its own transaction.
+        """
+        state = self.get_state(instance_id)
+        state.open_exposure += notional
+        state.open_positions += 1
+        self.total_exposure += notional
+        if persist:
+            self.db.save_risk_snapshot(self.snapshot(state))
+        return state
+
+    def on_close(self, instance_id, notional, pnl, persist=True):
+        """
+        Applies a closing fill: releases exposure, books PnL and re-evaluates
+        the level and both kill switches. Pass persist=False when the caller
+        saves the snapshot in its own transaction.
+        """
+        state = self.get_state(instance_id)
+        state.open_exposure = max(0.0, state.open_exposure - notional)
+        state.open_positions = max(0, state.open_positions - 1)
+        self.total_exposure = max(0.0, self.total_exposure - notional)
+
+        state.level, state.level_min = state.capital.update_capital(pnl)
+        self.total_capital += pnl
+        self.portfolio_peak = max(self.portfolio_peak, self.total_capital)
+        state.peak_capital = max(state.peak_capital, state.capital.current_capital)
+
+        if not state.halted and state.drawdown >= self.kill_switch_threshold:
+            state.halted = True
+            logger.critical(f"KILL SWITCH [{instance_id}]: drawdown {state.drawdown:.0%} >= {self.kill_switch_threshold:.0%}. Halting instance.")
+        self._evaluate_portfolio()
+
+        if persist:
+            self.db.save_risk_snapshot(self.snapshot(state))
+        return state
+
+    def checkpoint(self, instance_ids):
+        """
+        Copies the state a batch of fills will touch, so it can be rolled back
+        if the batch fails to persist. Also resolves unknown instances up front
+        (their params are read from the DB, which must happen outside a write
+        transaction).
+        """
+        states = {iid: copy.deepcopy(self.get_state(iid)) for iid in instance_ids}
+        return states, (self.total_capital, self.portfolio_peak, self.total_exposure, self.kill_switch_active)
+
+    def rollback(self, checkpoint):
+        states, totals = checkpoint
+        self.instances.update(states)
+        self.total_capital, self.portfolio_peak, self.total_exposure, self.kill_switch_active = totals
+
+    def snapshot(self, state):
+        """Persistable row of an instance, stamped with the current portfolio peak."""
+        return {**state.snapshot(), "portfolio_peak": self.portfolio_peak}
+
+    def _evaluate_portfolio(self):
+        if not self.kill_switch_active and self.portfolio_drawdown >= self.kill_switch_threshold:
+            self.kill_switch_active = True
+            logger.critical(f"KILL SWITCH ACTIVE: portfolio drawdown {self.portfolio_drawdown:.0%}. Halting all instances.")
+
+    def get_status(self):
+        return {
+            "capital": self.total_capital,
+            "peak_capital": self.portfolio_peak,
+            "exposure": self.total_exposure,
+            "drawdown": self.portfolio_drawdown,
+            "kill_switch": self.kill_switch_active,
+            "instances": {
+                iid: {
+                    "capital": state.capital.current_capital,
+                    "level": state.level,
+                    "open_exposure": state.open_exposure,
+                    "open_positions": state.open_positions,
+                    "drawdown": state.drawdown,
+                    "halted": state.halted,
+                }
+                for iid, state in self.instances.items()
+            },
+        }